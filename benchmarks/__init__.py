@@ -0,0 +1 @@
+"""Benchmarks for the Electrolux Status integration."""
@@ -0,0 +1,86 @@
+"""Benchmark of the capability attribute filter.
+
+Runs the compiled ATTRIBUTES_BLACKLIST / ATTRIBUTES_WHITELIST filter against
+thousands of synthetic capability keys derived from the sample documents and
+compares it with the previous per-pattern loop.
+
+Run from the repository root: python -m benchmarks.bench_filters
+"""
+
+import random
+import re
+import timeit
+
+from custom_components.electrolux_status.api import ATTRIBUTE_FILTER, AttributeFilter
+from custom_components.electrolux_status.const import (
+    ATTRIBUTES_BLACKLIST,
+    ATTRIBUTES_WHITELIST,
+)
+
+from .samples import load_sample, sample_models
+
+KEY_COUNT = 5000
+ROUNDS = 20
+
+
+def legacy_keep_source(source: str) -> bool:
+    """Filter as implemented before the patterns were combined."""
+    for ignored_pattern in ATTRIBUTES_BLACKLIST:
+        if re.match(ignored_pattern, source):
+            for whitelist_pattern in ATTRIBUTES_WHITELIST:
+                if re.match(whitelist_pattern, source):
+                    return True
+            return False
+    return True
+
+
+def synthetic_keys(count: int, seed: int = 0) -> list[str]:
+    """Build capability keys mixing sample keys with generated suffixes."""
+    rng = random.Random(seed)
+    roots = sorted(
+        {
+            key
+            for model in sample_models()
+            for key in load_sample(model, "appliance_capabilities")
+        }
+    )
+    keys = list(roots)
+    while len(keys) < count:
+        root = rng.choice(roots)
+        suffix = "".join(rng.choices("abcdefghijklmnopqrstuvwxyzABCDEFGHIJ", k=8))
+        keys.append(f"{root}{rng.choice(['/', '_', ''])}{suffix}")
+    return keys
+
+
+def main() -> None:
+    """Run the benchmark."""
+    keys = synthetic_keys(KEY_COUNT)
+    for key in keys:
+        assert ATTRIBUTE_FILTER.keep(key) == legacy_keep_source(key), key
+
+    uncached = AttributeFilter(ATTRIBUTES_BLACKLIST, ATTRIBUTES_WHITELIST)
+
+    def run(keep):
+        for key in keys:
+            keep(key)
+
+    legacy = timeit.timeit(lambda: run(legacy_keep_source), number=ROUNDS)
+    compiled = timeit.timeit(lambda: run(uncached._keep), number=ROUNDS)  # noqa: SLF001
+    cached = timeit.timeit(lambda: run(ATTRIBUTE_FILTER.keep), number=ROUNDS)
+
+    calls = len(keys) * ROUNDS
+    kept = sum(ATTRIBUTE_FILTER.keep(key) for key in keys)
+    print(f"{len(keys)} keys ({kept} kept), {ROUNDS} rounds")
+    for label, duration in (
+        ("legacy", legacy),
+        ("combined", compiled),
+        ("combined + cache", cached),
+    ):
+        print(
+            f"{label:>18}: {duration * 1e9 / calls:8.0f} ns/key"
+            f" ({legacy / duration:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
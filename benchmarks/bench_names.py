@@ -0,0 +1,128 @@
+"""Micro-benchmark of the entity name generation.
+
+Compares the compiled and cached name generation of ElectroluxLibraryEntity with
+the previous implementation (uncompiled rules, no cache) over the attribute
+paths of every sample capability document.
+
+Run from the repository root: python -m benchmarks.bench_names
+"""
+
+import re
+import timeit
+
+from custom_components.electrolux_status.api import (
+    ElectroluxLibraryEntity,
+    entity_name,
+    sensor_name,
+)
+from custom_components.electrolux_status.const import RENAME_RULES
+
+from .samples import load_sample, sample_models
+
+ROUNDS = 200
+
+
+def legacy_sensor_name(attr_name: str) -> str:
+    """Name generation as implemented before the rules were compiled."""
+    sensor = attr_name
+    for truncate_rule in RENAME_RULES:
+        sensor = re.sub(truncate_rule, "", sensor)
+    sensor = sensor[0].upper() + sensor[1:]
+    sensor = sensor.replace("_", " ")
+    sensor = sensor.replace("/", " ")
+    group = ""
+    words = []
+    for i, char in enumerate(sensor):
+        if group == "":
+            group = char
+        else:
+            if char == " " and len(group) > 0:
+                words.append(group)
+                group = ""
+                continue
+
+            if (
+                (char.isupper() or char.isdigit())
+                and (sensor[i - 1].isupper() or sensor[i - 1].isdigit())
+                and (
+                    (i == len(sensor) - 1)
+                    or (sensor[i + 1].isupper() or sensor[i + 1].isdigit())
+                )
+            ):
+                group += char
+            elif (char.isupper() or char.isdigit()) and sensor[i - 1].islower():
+                if re.match("^[A-Z0-9]+$", group):
+                    words.append(group)
+                else:
+                    words.append(group.lower())
+                group = char
+            else:
+                group += char
+    if len(group) > 0:
+        if re.match("^[A-Z0-9]+$", group):
+            words.append(group)
+        else:
+            words.append(group.lower())
+    return " ".join(words).lower()
+
+
+def legacy_entity_name(attr_name: str) -> str:
+    """Entity name extraction as implemented before the rules were compiled."""
+    for truncate_rule in RENAME_RULES:
+        attr_name = re.sub(truncate_rule, "", attr_name)
+    return attr_name.rpartition("/")[-1] or attr_name
+
+
+def attribute_paths() -> list[str]:
+    """Return the attribute paths of every sample capability document."""
+    paths = []
+    for model in sample_models():
+        library = ElectroluxLibraryEntity(
+            name=model,
+            status="connected",
+            state=load_sample(model, "appliance_state"),
+            appliance_info=None,
+            capabilities=load_sample(model, "appliance_capabilities"),
+        )
+        paths.extend(library.sources_list() or [])
+    return paths
+
+
+def main() -> None:
+    """Run the benchmark."""
+    paths = attribute_paths()
+    for path in paths:
+        assert sensor_name(path) == legacy_sensor_name(path), path
+        assert entity_name(path) == legacy_entity_name(path), path
+
+    def run(sensor_func, entity_func):
+        for path in paths:
+            sensor_func(path)
+            entity_func(path)
+
+    sensor_name.cache_clear()
+    entity_name.cache_clear()
+    cold = timeit.timeit(
+        lambda: run(sensor_name.__wrapped__, entity_name.__wrapped__), number=ROUNDS
+    )
+    legacy = timeit.timeit(
+        lambda: run(legacy_sensor_name, legacy_entity_name), number=ROUNDS
+    )
+    cached = timeit.timeit(lambda: run(sensor_name, entity_name), number=ROUNDS)
+
+    calls = len(paths) * ROUNDS
+    print(f"{len(paths)} attribute paths, {ROUNDS} rounds")
+    for label, duration in (
+        ("legacy", legacy),
+        ("compiled", cold),
+        ("compiled + cache", cached),
+    ):
+        print(
+            f"{label:>18}: {duration * 1e6 / calls:8.2f} µs/path"
+            f" ({legacy / duration:5.1f}x)"
+        )
+    print(f"cache: {sensor_name.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""Replay benchmark of the appliance setup and updates.
+
+Replays the documents of every samples/<model>/ directory through Appliance:
+cold setup (entity plans compiled), warm setup (entity plans reused), full state
+updates, streams of synthetic deltas and the extraction of the entity values.
+Each case reports ops/sec, the memory blocks it allocates and its peak memory.
+The capabilities set up with reused plans are checked against a cold setup.
+
+Results are written as JSON, to the temporary directory unless --output is
+given; pass a previous result file with --baseline to print the relative
+throughput of each case. --keys grows the samples to the given number of
+capabilities with benchmarks.fleet.
+
+Run from the repository root: python -m benchmarks.bench_replay
+"""
+
+import argparse
+import copy
+from datetime import UTC, datetime
+import gc
+import json
+from pathlib import Path
+import platform
+import random
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.const import Platform
+
+from custom_components.electrolux_status.api import (
+    Appliance,
+    Appliances,
+    ElectroluxLibraryEntity,
+)
+from custom_components.electrolux_status.util import (
+    decode_entity_plan,
+    encode_entity_plan,
+)
+
+from .fleet import synthetic_documents
+from .samples import sample_documents, sample_models, synthetic_deltas
+
+RESULT_VERSION = 1
+DELTA_COUNT = 1000
+MIN_DURATION = 0.5
+
+# state property read by Home Assistant for each platform
+VALUE_PROPERTIES = {
+    Platform.BINARY_SENSOR: "is_on",
+    Platform.NUMBER: "native_value",
+    Platform.SELECT: "current_option",
+    Platform.SENSOR: "native_value",
+    Platform.SWITCH: "is_on",
+}
+
+
+class ReplayCoordinator:
+    """Stand-in for the coordinator attributes used by the appliances."""
+
+    def __init__(self) -> None:
+        """Initialize an empty coordinator."""
+        self.hass = None
+        self.api = None
+        self.config_entry = None
+        self.entity_plans: dict[str, Any] = {}
+        self.data = {"appliances": Appliances({})}
+
+
+def create_appliance(
+    coordinator: ReplayCoordinator, model: str, documents: dict[str, Any]
+) -> Appliance:
+    """Create and set up an appliance from the documents of a sample."""
+    state = copy.deepcopy(documents["appliance_state"])
+    pnc_id = state.get("applianceId", model)
+    appliance = Appliance(
+        coordinator=coordinator,
+        name=model,
+        pnc_id=pnc_id,
+        brand="Electrolux",
+        model=documents["appliances_info"].get("model", model),
+        state=state,
+    )
+    coordinator.data["appliances"].appliances[pnc_id] = appliance
+    appliance.setup(
+        ElectroluxLibraryEntity(
+            name=model,
+            status="connected",
+            state=state,
+            appliance_info=documents["appliances_info"],
+            capabilities=documents["appliance_capabilities"],
+        )
+    )
+    return appliance
+
+
+def check_warm_setup(model: str, documents: dict[str, Any]) -> None:
+    """Raise if reusing the stored entity plans changes the capabilities set up.
+
+    The plans go through their stored encoding, as after a restart.
+    """
+    cold = create_appliance(ReplayCoordinator(), model, copy.deepcopy(documents))
+    stored = {
+        appliance_id: {
+            "key": entry["key"],
+            "plans": [
+                decode_entity_plan(encode_entity_plan(plan)) for plan in entry["plans"]
+            ],
+        }
+        for appliance_id, entry in cold.coordinator.entity_plans.items()
+    }
+    coordinator = ReplayCoordinator()
+    coordinator.entity_plans = dict(stored)
+    warm = create_appliance(coordinator, model, copy.deepcopy(documents))
+    if coordinator.entity_plans[warm.pnc_id] is not stored[warm.pnc_id]:
+        raise RuntimeError(f"{model}: the stored entity plans were not reused")
+    if warm.data.capabilities != cold.data.capabilities:
+        raise RuntimeError(
+            f"{model}: the capabilities differ between a cold and a warm setup"
+        )
+
+
+def extract_values(appliance: Appliance) -> int:
+    """Read the state of every entity, return the number of values read."""
+    count = 0
+    for entity in appliance.entities:
+        if name := VALUE_PROPERTIES.get(entity.entity_type):
+            getattr(entity, name)
+            count += 1
+    return count
+
+
+def measure(run, ops: int, min_duration: float) -> dict[str, Any]:
+    """Time a case, then trace the memory of one more run.
+
+    run executes ops operations each time it is called.
+    """
+    run()
+    rounds = 0
+    start = time.perf_counter()
+    while True:
+        run()
+        rounds += 1
+        duration = time.perf_counter() - start
+        if duration >= min_duration:
+            break
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    run()
+    current, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = [
+        stat for stat in after.compare_to(before, "filename") if stat.count_diff > 0
+    ]
+    return {
+        "ops": ops * rounds,
+        "seconds": duration,
+        "ops_per_sec": ops * rounds / duration,
+        "allocated_blocks_per_op": sum(stat.count_diff for stat in allocated) / ops,
+        "allocated_bytes_per_op": sum(stat.size_diff for stat in allocated) / ops,
+        "peak_bytes": peak,
+    }
+
+
+def bench_model(
+    model: str,
+    documents: dict[str, Any],
+    delta_count: int,
+    min_duration: float,
+    seed: int,
+) -> dict[str, Any]:
+    """Run every case on the documents of one appliance."""
+    results: dict[str, Any] = {}
+
+    def cold_setup():
+        create_appliance(ReplayCoordinator(), model, documents)
+
+    results["setup_cold"] = measure(cold_setup, 1, min_duration)
+
+    planned = ReplayCoordinator()
+    create_appliance(planned, model, documents)
+
+    def warm_setup():
+        coordinator = ReplayCoordinator()
+        coordinator.entity_plans = planned.entity_plans
+        create_appliance(coordinator, model, documents)
+
+    results["setup_warm"] = measure(warm_setup, 1, min_duration)
+
+    appliance = create_appliance(ReplayCoordinator(), model, documents)
+    state = appliance.state
+
+    def full_update():
+        appliance.update(state)
+
+    results["full_update"] = measure(full_update, 1, min_duration)
+
+    deltas = synthetic_deltas(documents, delta_count, seed)
+
+    def delta_stream():
+        for delta in deltas:
+            appliance.update_reported_data(delta)
+
+    results["deltas"] = measure(delta_stream, len(deltas), min_duration)
+
+    appliance = create_appliance(ReplayCoordinator(), model, documents)
+    # as done by the coordinator before the entities are read
+    appliance.update(appliance.state)
+    values = extract_values(appliance)
+    results["extract_values"] = measure(
+        lambda: extract_values(appliance), max(values, 1), min_duration
+    )
+
+    return {
+        "entities": len(appliance.entities),
+        "values": values,
+        "cases": results,
+    }
+
+
+def _revision() -> str | None:
+    """Return the git revision of the tree, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_results(models: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    """Print a summary of the results."""
+    for model, result in models.items():
+        print(f"{model}: {result['entities']} entities")
+        for case, stats in result["cases"].items():
+            line = (
+                f"{case:>16}: {stats['ops_per_sec']:12.1f} ops/s"
+                f" {stats['allocated_blocks_per_op']:10.1f} blocks/op"
+                f" {stats['peak_bytes'] / 1024:10.1f} KiB peak"
+            )
+            previous = (
+                (baseline or {}).get("models", {}).get(model, {}).get("cases", {})
+            ).get(case)
+            if previous:
+                line += f" ({stats['ops_per_sec'] / previous['ops_per_sec']:5.2f}x)"
+            print(line)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", nargs="*", default=None)
+    parser.add_argument("--keys", type=int, default=0, help="grow the samples")
+    parser.add_argument("--deltas", type=int, default=DELTA_COUNT)
+    parser.add_argument("--min-duration", type=float, default=MIN_DURATION)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "bench_replay.json",
+    )
+    parser.add_argument("--baseline", type=Path, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    models = {}
+    for model in args.models or sample_models():
+        documents = sample_documents(model)
+        if args.keys:
+            documents = synthetic_documents(documents, args.keys, rng)
+            model = f"{model}-{args.keys}"
+        check_warm_setup(model, documents)
+        models[model] = bench_model(
+            model, documents, args.deltas, args.min_duration, args.seed
+        )
+    result = {
+        "version": RESULT_VERSION,
+        "created": datetime.now(UTC).isoformat(),
+        "revision": _revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "deltas": args.deltas,
+        "keys": args.keys,
+        "seed": args.seed,
+        "models": models,
+    }
+    args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    _print_results(models, baseline)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
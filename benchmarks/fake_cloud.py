@@ -0,0 +1,303 @@
+"""Local stand-in for the Electrolux cloud.
+
+Serves the appliance list, info, state, capabilities and command endpoints from
+the sample documents and pushes state deltas over a websocket, so the
+integration can be load tested without touching the real service.
+
+The fleet is built by multiplying the samples (optionally grown by
+benchmarks.fleet), the push rate, the latency added
+to every request and periodic bursts of 429 responses are configurable.
+
+Run from the repository root: python -m benchmarks.fake_cloud --appliances 10 --rate 50
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import itertools
+import json
+import random
+import time
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+from .fleet import synthetic_fleet
+from .samples import sample_models, synthetic_deltas
+
+API_PREFIX = "/appliance/api/v2"
+WEBSOCKET_PATH = "/ws"
+DEFAULT_PORT = 8480
+# deltas prepared for each appliance, replayed in a loop
+DELTA_CYCLE = 1000
+
+
+@dataclass
+class FakeAppliance:
+    """Define an appliance served by the fake cloud."""
+
+    appliance_id: str
+    name: str
+    documents: dict[str, Any]
+    deltas: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def reported(self) -> dict[str, Any]:
+        """Return the reported state of the appliance."""
+        return self.documents["appliance_state"]["properties"]["reported"]
+
+
+@dataclass
+class FakeCloudSettings:
+    """Define the behaviour of the fake cloud."""
+
+    # deltas pushed per second over every websocket, 0 disables the push
+    rate: float = 10.0
+    # latency added to every REST request, in seconds
+    latency: float = 0.0
+    # a burst of 429 responses starts every burst_every seconds, 0 disables them
+    burst_every: float = 0.0
+    burst_length: float = 0.0
+    seed: int = 0
+
+
+def sample_fleet(count: int, seed: int = 0, key_count: int = 0) -> list[FakeAppliance]:
+    """Build a fleet by multiplying the samples.
+
+    When key_count is given the capabilities are grown to key_count keys.
+    """
+    return [
+        FakeAppliance(
+            appliance_id=documents["appliance_state"]["applianceId"],
+            name=name,
+            documents=documents,
+            deltas=synthetic_deltas(documents, DELTA_CYCLE, seed + index),
+        )
+        for index, (name, documents) in enumerate(
+            synthetic_fleet(count, key_count, seed)
+        )
+    ]
+
+
+class FakeCloud:
+    """aiohttp application emulating the Electrolux cloud."""
+
+    def __init__(
+        self, appliances: list[FakeAppliance], settings: FakeCloudSettings
+    ) -> None:
+        """Initialize the fake cloud."""
+        self.appliances = {
+            appliance.appliance_id: appliance for appliance in appliances
+        }
+        self.settings = settings
+        self.started = time.monotonic()
+        self.stats = {"requests": 0, "throttled": 0, "commands": 0, "pushed": 0}
+        self._rng = random.Random(settings.seed)
+        # appliances subscribed by each websocket queue
+        self._subscriptions: dict[asyncio.Queue, set[str]] = {}
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.add_routes(
+            [
+                web.get(f"{API_PREFIX}/appliances", self.appliances_list),
+                web.post(f"{API_PREFIX}/appliances/info", self.appliances_info),
+                web.get(f"{API_PREFIX}/appliances/{{appliance_id}}", self.state),
+                web.get(
+                    f"{API_PREFIX}/appliances/{{appliance_id}}/capabilities",
+                    self.capabilities,
+                ),
+                web.put(
+                    f"{API_PREFIX}/appliances/{{appliance_id}}/command", self.command
+                ),
+                web.get(f"{API_PREFIX}/stats", self.statistics),
+                web.get(WEBSOCKET_PATH, self.websocket),
+            ]
+        )
+
+    def throttled(self) -> bool:
+        """Return True during a burst of 429 responses."""
+        if not self.settings.burst_every:
+            return False
+        elapsed = (time.monotonic() - self.started) % self.settings.burst_every
+        return elapsed < self.settings.burst_length
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Add the latency and the 429 bursts to the REST requests."""
+        if request.path in (WEBSOCKET_PATH, f"{API_PREFIX}/stats"):
+            return await handler(request)
+        self.stats["requests"] += 1
+        if self.settings.latency:
+            await asyncio.sleep(self.settings.latency)
+        if self.throttled():
+            self.stats["throttled"] += 1
+            raise web.HTTPTooManyRequests(headers={"Retry-After": "1"})
+        return await handler(request)
+
+    def _appliance(self, request: web.Request) -> FakeAppliance:
+        """Return the appliance of the request."""
+        if appliance := self.appliances.get(request.match_info["appliance_id"]):
+            return appliance
+        raise web.HTTPNotFound
+
+    async def appliances_list(self, request: web.Request) -> web.Response:
+        """Return the appliances of the account."""
+        return web.json_response(
+            [
+                {
+                    "applianceId": appliance.appliance_id,
+                    "applianceData": {"applianceName": appliance.name},
+                    "connectionState": appliance.documents["appliance_state"].get(
+                        "connectionState"
+                    ),
+                }
+                for appliance in self.appliances.values()
+            ]
+        )
+
+    async def appliances_info(self, request: web.Request) -> web.Response:
+        """Return the information of the requested appliances."""
+        body = await request.json()
+        return web.json_response(
+            [
+                self.appliances[appliance_id].documents["appliances_info"]
+                for appliance_id in body.get("applianceIds", [])
+                if appliance_id in self.appliances
+            ]
+        )
+
+    async def state(self, request: web.Request) -> web.Response:
+        """Return the state of an appliance."""
+        return web.json_response(self._appliance(request).documents["appliance_state"])
+
+    async def capabilities(self, request: web.Request) -> web.Response:
+        """Return the capabilities of an appliance."""
+        return web.json_response(
+            self._appliance(request).documents["appliance_capabilities"]
+        )
+
+    async def command(self, request: web.Request) -> web.Response:
+        """Apply a command to the reported state and push it as a delta."""
+        appliance = self._appliance(request)
+        command = await request.json()
+        self.stats["commands"] += 1
+        delta = {}
+        for key, value in command.items():
+            if isinstance(value, dict) and isinstance(appliance.reported.get(key), dict):
+                value = {**appliance.reported[key], **value}
+            delta[key] = value
+        appliance.reported.update(delta)
+        for queue in self._subscribers(appliance.appliance_id):
+            queue.put_nowait((appliance.appliance_id, delta))
+        return web.json_response({})
+
+    async def statistics(self, request: web.Request) -> web.Response:
+        """Return the counters of the fake cloud."""
+        return web.json_response(self.stats)
+
+    def _subscribers(self, appliance_id: str) -> list[asyncio.Queue]:
+        """Return the queues of the websockets subscribed to an appliance."""
+        return [
+            queue
+            for queue, appliance_ids in self._subscriptions.items()
+            if appliance_id in appliance_ids
+        ]
+
+    async def websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Push deltas of the subscribed appliances.
+
+        The client first sends {"applianceIds": [...]}, each message then holds
+        the appliance id, the send time (time.time()) and the delta.
+        """
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        message = await ws.receive()
+        if message.type != WSMsgType.TEXT:
+            return ws
+        appliance_ids = [
+            appliance_id
+            for appliance_id in json.loads(message.data).get("applianceIds", [])
+            if appliance_id in self.appliances
+        ]
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscriptions[queue] = set(appliance_ids)
+        push = asyncio.create_task(self._push(queue, appliance_ids))
+        sender = asyncio.create_task(self._send(ws, queue))
+        try:
+            async for message in ws:
+                if message.type in (WSMsgType.CLOSE, WSMsgType.ERROR):
+                    break
+        finally:
+            push.cancel()
+            sender.cancel()
+            self._subscriptions.pop(queue, None)
+        return ws
+
+    async def _push(self, queue: asyncio.Queue, appliance_ids: list[str]) -> None:
+        """Generate deltas at the configured rate."""
+        if not self.settings.rate or not appliance_ids:
+            return
+        cycles = {
+            appliance_id: itertools.cycle(self.appliances[appliance_id].deltas)
+            for appliance_id in appliance_ids
+        }
+        start = time.monotonic()
+        sent = 0
+        while True:
+            # catch up with the rate when the loop is late
+            due = int((time.monotonic() - start) * self.settings.rate) - sent
+            for _ in range(max(due, 0)):
+                appliance_id = self._rng.choice(appliance_ids)
+                delta = next(cycles[appliance_id])
+                self.appliances[appliance_id].reported.update(delta)
+                queue.put_nowait((appliance_id, delta))
+                sent += 1
+            await asyncio.sleep(1 / self.settings.rate)
+
+    async def _send(self, ws: web.WebSocketResponse, queue: asyncio.Queue) -> None:
+        """Send the queued deltas."""
+        while True:
+            appliance_id, delta = await queue.get()
+            await ws.send_json(
+                {"applianceId": appliance_id, "sent": time.time(), "delta": delta}
+            )
+            self.stats["pushed"] += 1
+
+
+async def start_fake_cloud(
+    cloud: FakeCloud, host: str = "127.0.0.1", port: int = DEFAULT_PORT
+) -> web.AppRunner:
+    """Start serving the fake cloud, return the runner to clean it up."""
+    runner = web.AppRunner(cloud.app)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+def main() -> None:
+    """Run the fake cloud until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--appliances", type=int, default=len(sample_models()))
+    parser.add_argument("--keys", type=int, default=0, help="capabilities per appliance")
+    parser.add_argument("--rate", type=float, default=FakeCloudSettings.rate)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--burst-every", type=float, default=0.0, help="seconds")
+    parser.add_argument("--burst-length", type=float, default=0.0, help="seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    settings = FakeCloudSettings(
+        rate=args.rate,
+        latency=args.latency,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        seed=args.seed,
+    )
+    cloud = FakeCloud(sample_fleet(args.appliances, args.seed, args.keys), settings)
+    print(f"Serving {len(cloud.appliances)} appliances on {args.host}:{args.port}")
+    web.run_app(cloud.app, host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Client of the fake Electrolux cloud.
+
+Implements the part of pyelectroluxocp.OneAppApi used by the coordinator, so an
+ElectroluxCoordinator created with this client talks to benchmarks.fake_cloud
+instead of the real service.
+"""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import time
+from typing import Any
+
+from aiohttp import ClientSession, WSMsgType
+
+from .fake_cloud import API_PREFIX, DEFAULT_PORT, WEBSOCKET_PATH
+
+TOKEN_LIFETIME = timedelta(hours=12)
+
+
+@dataclass
+class FakeUserToken:
+    """Define the token attributes read by the coordinator."""
+
+    token: str
+    expiresAt: datetime  # noqa: N815
+
+
+class FakeCloudApi:
+    """OneAppApi compatible client of the fake cloud.
+
+    Push latencies (cloud send to end of the callback) are kept in latencies.
+    """
+
+    def __init__(
+        self,
+        url: str = f"http://127.0.0.1:{DEFAULT_PORT}",
+        client_session: ClientSession | None = None,
+    ) -> None:
+        """Initialize the client."""
+        self.url = url.rstrip("/")
+        self._session = client_session
+        self._close_session = client_session is None
+        self._user_token: FakeUserToken | None = None
+        self._websocket = None
+        self.latencies: list[float] = []
+        self.received = 0
+
+    async def __aenter__(self) -> "FakeCloudApi":
+        """Open the client."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the client."""
+        await self.close()
+
+    @property
+    def session(self) -> ClientSession:
+        """Return the HTTP session, creating it if needed."""
+        if self._session is None:
+            self._session = ClientSession()
+        return self._session
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request, raise ClientResponseError on error statuses."""
+        async with self.session.request(
+            method, f"{self.url}{API_PREFIX}{path}", raise_for_status=True, **kwargs
+        ) as response:
+            return await response.json()
+
+    async def _get_gigya_client(self) -> None:
+        """Nothing to authenticate against."""
+
+    async def get_user_token(self) -> FakeUserToken:
+        """Return a token valid for TOKEN_LIFETIME."""
+        if self._user_token is None or self._user_token.expiresAt <= datetime.now(
+            UTC
+        ).replace(tzinfo=None):
+            self._user_token = FakeUserToken(
+                token=f"fake-{time.time_ns()}",
+                expiresAt=(datetime.now(UTC) + TOKEN_LIFETIME).replace(tzinfo=None),
+            )
+        return self._user_token
+
+    async def get_user_metadata(self) -> dict[str, Any]:
+        """Return the user metadata."""
+        return {"userId": "fake"}
+
+    async def get_appliances_list(self) -> list[dict[str, Any]]:
+        """Return the appliances of the account."""
+        return await self._request("GET", "/appliances")
+
+    async def get_appliances_info(self, appliance_ids: list[str]) -> list[dict[str, Any]]:
+        """Return the information of the appliances."""
+        return await self._request(
+            "POST", "/appliances/info", json={"applianceIds": appliance_ids}
+        )
+
+    async def get_appliance_state(self, appliance_id: str) -> dict[str, Any]:
+        """Return the state of an appliance."""
+        return await self._request("GET", f"/appliances/{appliance_id}")
+
+    async def get_appliance_capabilities(self, appliance_id: str) -> dict[str, Any]:
+        """Return the capabilities of an appliance."""
+        return await self._request("GET", f"/appliances/{appliance_id}/capabilities")
+
+    async def execute_appliance_command(
+        self, appliance_id: str, command: dict[str, Any]
+    ) -> Any:
+        """Send a command to an appliance."""
+        return await self._request(
+            "PUT", f"/appliances/{appliance_id}/command", json=command
+        )
+
+    async def watch_for_appliance_state_updates(
+        self,
+        appliance_ids: list[str],
+        callback: Callable[[dict[str, dict[str, Any]]], None],
+    ) -> None:
+        """Call the callback with {appliance_id: delta} for each pushed delta."""
+        async with self.session.ws_connect(f"{self.url}{WEBSOCKET_PATH}") as websocket:
+            self._websocket = websocket
+            await websocket.send_json({"applianceIds": appliance_ids})
+            async for message in websocket:
+                if message.type != WSMsgType.TEXT:
+                    break
+                data = message.json()
+                callback({data["applianceId"]: data["delta"]})
+                self.received += 1
+                self.latencies.append(time.time() - data["sent"])
+        self._websocket = None
+
+    async def disconnect_websocket(self) -> None:
+        """Close the websocket."""
+        if self._websocket is not None:
+            await self._websocket.close()
+            self._websocket = None
+
+    async def close(self, *args) -> None:
+        """Close the websocket and the session."""
+        await self.disconnect_websocket()
+        if self._close_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+        # let the connections close before the loop stops
+        await asyncio.sleep(0)
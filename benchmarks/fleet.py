@@ -0,0 +1,160 @@
+"""Synthetic fleets for scale testing.
+
+Grows the capability and state documents of the samples into large synthetic
+appliances: new capabilities are cloned from the sample ones, grouped under
+"/" nested containers with the container sizes and the nested / root ratio of
+the samples, and a share of them get triggers on their siblings.
+
+The fleets can be served by benchmarks.fake_cloud (--keys) and measured by
+benchmarks.bench_replay (--keys).
+
+Run from the repository root: python -m benchmarks.fleet --appliances 50 --keys 10000
+"""
+
+import argparse
+import copy
+import random
+from typing import Any
+
+from .samples import sample_documents, sample_models
+
+# share of the generated capabilities with a trigger
+TRIGGER_RATIO = 0.02
+# container sizes used when the samples do not have nested capabilities
+DEFAULT_CONTAINER_SIZES = [5, 10, 25]
+
+
+def _template(
+    path: str, capability: Any, reported: dict[str, Any]
+) -> tuple[dict[str, Any], Any] | None:
+    """Return a capability and its reported value, if it can be cloned."""
+    if not isinstance(capability, dict) or capability.get("type") in (
+        None,
+        "complex",
+        "alert",
+    ):
+        return None
+    parent, _, child = path.partition("/")
+    value = reported.get(parent)
+    if child:
+        value = value.get(child) if isinstance(value, dict) else None
+    if value is None or isinstance(value, dict | list):
+        return None
+    capability = {key: item for key, item in capability.items() if key != "triggers"}
+    return capability, value
+
+
+def _trigger(
+    source: str, capability: dict[str, Any], target: str, target_capability: dict
+) -> dict[str, Any] | None:
+    """Return a trigger of a capability restricting a sibling capability."""
+    source_values = list(capability.get("values", None) or {})
+    target_values = list(target_capability.get("values", None) or {})
+    if not source_values or not target_values:
+        return None
+    return {
+        "action": {target: {"values": {target_values[0]: {}}}},
+        "condition": {
+            "operand_1": "value",
+            "operand_2": source_values[0],
+            "operator": "eq",
+        },
+    }
+
+
+def synthetic_documents(
+    documents: dict[str, Any], key_count: int, rng: random.Random, prefix: str = "syn"
+) -> dict[str, Any]:
+    """Grow the documents of a sample to key_count capabilities."""
+    documents = copy.deepcopy(documents)
+    capabilities: dict[str, Any] = documents["appliance_capabilities"]
+    reported: dict[str, Any] = documents["appliance_state"]["properties"]["reported"]
+
+    templates = [
+        template
+        for path, capability in capabilities.items()
+        if (template := _template(path, capability, reported))
+    ]
+    if not templates:
+        return documents
+    containers: dict[str, int] = {}
+    for path in capabilities:
+        if "/" in path:
+            parent = path.split("/", 1)[0]
+            containers[parent] = containers.get(parent, 0) + 1
+    sizes = list(containers.values()) or DEFAULT_CONTAINER_SIZES
+    nested = sum(containers.values())
+    nested_ratio = nested / len(capabilities) if containers else 0.5
+
+    index = 0
+    while len(capabilities) < key_count:
+        if rng.random() < nested_ratio:
+            container = f"{prefix}Container{index}"
+            capabilities[container] = {"access": "read", "type": "complex"}
+            reported[container] = {}
+            paths = []
+            for _ in range(min(rng.choice(sizes), key_count - len(capabilities))):
+                capability, value = copy.deepcopy(rng.choice(templates))
+                child = f"{prefix}{index}_{len(paths)}"
+                capabilities[f"{container}/{child}"] = capability
+                reported[container][child] = value
+                paths.append(f"{container}/{child}")
+            for path in paths:
+                if len(paths) > 1 and rng.random() < TRIGGER_RATIO:
+                    target = rng.choice([other for other in paths if other != path])
+                    if trigger := _trigger(
+                        path, capabilities[path], target, capabilities[target]
+                    ):
+                        capabilities[path]["triggers"] = [trigger]
+        else:
+            capability, value = copy.deepcopy(rng.choice(templates))
+            capabilities[f"{prefix}{index}"] = capability
+            reported[f"{prefix}{index}"] = value
+        index += 1
+    return documents
+
+
+def synthetic_fleet(
+    count: int, key_count: int, seed: int = 0
+) -> list[tuple[str, dict[str, Any]]]:
+    """Build count synthetic appliances of key_count capabilities.
+
+    Return the name and the documents of each appliance; the appliances built
+    from the same sample share the same capabilities, as appliances of the same
+    model do.
+    """
+    rng = random.Random(seed)
+    models = sample_models()
+    grown = {
+        model: synthetic_documents(sample_documents(model), key_count, rng)
+        for model in models[:count]
+    }
+    fleet = []
+    for index in range(count):
+        model = models[index % len(models)]
+        documents = copy.deepcopy(grown[model])
+        state = documents["appliance_state"]
+        state["applianceId"] = f"{state['applianceId']}-{index:04d}"
+        fleet.append((f"{model} {index}", documents))
+    return fleet
+
+
+def main() -> None:
+    """Print the size of a synthetic fleet."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--appliances", type=int, default=50)
+    parser.add_argument("--keys", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for name, documents in synthetic_fleet(args.appliances, args.keys, args.seed):
+        capabilities = documents["appliance_capabilities"]
+        print(
+            f"{name}: {len(capabilities)} capabilities,"
+            f" {sum('/' in path for path in capabilities)} nested,"
+            f" {sum('triggers' in value for value in capabilities.values())} with triggers"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""End-to-end load test of the coordinator against the fake cloud.
+
+Starts benchmarks.fake_cloud in-process (or uses --url), creates an
+ElectroluxCoordinator with the fake cloud client, sets the entities up, listens
+to the websocket for --duration seconds and reports the setup time, the push
+throughput, the push latencies measured by the coordinator (reception to end of
+the entity updates, and merge) and the state of its ingest queue.
+
+Run from the repository root: python -m benchmarks.load_test --appliances 50 --rate 200
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.electrolux_status.coordinator import ElectroluxCoordinator
+from custom_components.electrolux_status.stats import STAGE_MERGE, STAGE_TOTAL
+
+from .fake_cloud import (
+    DEFAULT_PORT,
+    FakeCloud,
+    FakeCloudSettings,
+    sample_fleet,
+    start_fake_cloud,
+)
+from .fake_cloud_client import FakeCloudApi
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """Return the p50, p95 and p99 of the values, in milliseconds."""
+    if len(values) < 2:
+        return {}
+    cuts = statistics.quantiles(values, n=100)
+    return {f"p{p}": cuts[p - 1] * 1000 for p in (50, 95, 99)}
+
+
+def stage_percentiles(
+    coordinator: ElectroluxCoordinator, stage: str
+) -> dict[str, float]:
+    """Return the percentiles of a push stage over all the appliances."""
+    return percentiles(
+        [
+            sample
+            for stats in coordinator.stats.appliances.values()
+            if (histogram := stats.histogram(f"push_{stage}")) is not None
+            for sample in histogram.samples
+        ]
+    )
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test."""
+    runner = None
+    cloud = None
+    url = args.url
+    if url is None:
+        settings = FakeCloudSettings(
+            rate=args.rate,
+            latency=args.latency,
+            burst_every=args.burst_every,
+            burst_length=args.burst_length,
+            seed=args.seed,
+        )
+        cloud = FakeCloud(
+            sample_fleet(args.appliances, args.seed, args.keys), settings
+        )
+        runner = await start_fake_cloud(cloud, port=args.port)
+        url = f"http://127.0.0.1:{args.port}"
+
+    client = FakeCloudApi(url)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            coordinator = ElectroluxCoordinator(
+                hass, client=client, renew_interval=3600, username="load-test"
+            )
+            await coordinator.get_stored_token()
+            await coordinator.async_login()
+
+            start = time.perf_counter()
+            await coordinator.setup_entities()
+            setup = time.perf_counter() - start
+
+            coordinator.launch_ingest_task()
+            coordinator.listen_websocket()
+            start = time.perf_counter()
+            await asyncio.sleep(args.duration)
+            duration = time.perf_counter() - start
+            await coordinator.close_websocket()
+        finally:
+            await client.close()
+            await hass.async_stop(force=True)
+            if runner is not None:
+                await runner.cleanup()
+
+    appliances = coordinator.data["appliances"].get_appliances()
+    return {
+        "appliances": len(appliances),
+        "entities": sum(len(appliance.entities) for appliance in appliances.values()),
+        "setup_seconds": setup,
+        "received": client.received,
+        "deltas_per_sec": client.received / duration,
+        "push_total_ms": stage_percentiles(coordinator, STAGE_TOTAL),
+        "push_merge_ms": stage_percentiles(coordinator, STAGE_MERGE),
+        "ingest": coordinator.ingest.as_dict(),
+        "cloud": cloud.stats if cloud else None,
+    }
+
+
+def main() -> None:
+    """Run the load test and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=None, help="fake cloud already running")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--appliances", type=int, default=10)
+    parser.add_argument("--keys", type=int, default=0, help="capabilities per appliance")
+    parser.add_argument("--rate", type=float, default=100.0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--burst-every", type=float, default=0.0, help="seconds")
+    parser.add_argument("--burst-length", type=float, default=0.0, help="seconds")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    text = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Access to the sample appliance documents stored in samples/."""
+
+import json
+from pathlib import Path
+import random
+from typing import Any
+
+SAMPLES_DIR = Path(__file__).resolve().parent.parent / "samples"
+
+
+def sample_models() -> list[str]:
+    """Return the models available in the samples directory."""
+    return sorted(path.name for path in SAMPLES_DIR.iterdir() if path.is_dir())
+
+
+def load_sample(model: str, document: str) -> Any:
+    """Load one document of a sample, ex: load_sample("EHE6899SA", "appliance_state")."""
+    with open(SAMPLES_DIR / model / f"get_{document}.json", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def sample_documents(model: str) -> dict[str, Any]:
+    """Load the documents of a sample needed to set up an appliance."""
+    info = load_sample(model, "appliances_info")
+    return {
+        "appliance_capabilities": load_sample(model, "appliance_capabilities"),
+        "appliance_state": load_sample(model, "appliance_state"),
+        "appliances_info": info[0] if isinstance(info, list) else info,
+    }
+
+
+def _next_value(value: Any, capability: Any, rng: random.Random) -> Any:
+    """Return another plausible value of a reported property."""
+    if isinstance(capability, dict) and isinstance(capability.get("values"), dict):
+        values = list(capability["values"])
+        if values:
+            return rng.choice(values)
+    if isinstance(value, bool):
+        return not value
+    if isinstance(value, int | float):
+        return value + rng.choice((-1, 1))
+    return value
+
+
+def synthetic_deltas(
+    documents: dict[str, Any], count: int, seed: int = 0
+) -> list[dict[str, Any]]:
+    """Build deltas changing one reported property at a time.
+
+    Nested properties are sent with their parent, as the cloud does.
+    """
+    rng = random.Random(seed)
+    reported = documents["appliance_state"]["properties"]["reported"]
+    capabilities = documents["appliance_capabilities"]
+    paths: list[tuple[str, str | None]] = []
+    for key, value in reported.items():
+        if isinstance(value, dict):
+            paths.extend(
+                (key, sub_key)
+                for sub_key, sub_value in value.items()
+                if not isinstance(sub_value, dict | list)
+            )
+        elif not isinstance(value, list):
+            paths.append((key, None))
+
+    deltas = []
+    for _ in range(count):
+        key, sub_key = rng.choice(paths)
+        capability = capabilities.get(key)
+        if sub_key is None:
+            deltas.append({key: _next_value(reported[key], capability, rng)})
+            continue
+        if isinstance(capability, dict):
+            capability = capabilities.get(f"{key}/{sub_key}", capability.get(sub_key))
+        parent = dict(reported[key])
+        parent[sub_key] = _next_value(parent[sub_key], capability, rng)
+        deltas.append({key: parent})
+    return deltas
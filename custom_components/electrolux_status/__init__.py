@@ -1,5 +1,6 @@
 """electrolux status integration."""
 
+from datetime import timedelta
 import logging
 
 from homeassistant.config_entries import ConfigEntry
@@ -12,17 +13,30 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
+from .capture import DeltaRecorder
 from .const import (
+    CONF_RECORD_DELTAS,
     CONF_RENEW_INTERVAL,
+    CONF_SLOW_UPDATE_BUDGET,
+    COUNTDOWN_INTERVAL,
     DEFAULT_LANGUAGE,
+    DEFAULT_SLOW_UPDATE_BUDGET,
     DEFAULT_WEBSOCKET_RENEWAL_DELAY,
     DOMAIN,
+    INVENTORY_INTERVAL,
     PLATFORMS,
     languages,
 )
-from .coordinator import ElectroluxCoordinator
+from .coordinator import (
+    PLAN_STORAGE_VERSION,
+    ElectroluxCoordinator,
+    entity_plans_store_key,
+)
+from .services import async_setup_services
 from .util import get_electrolux_session
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
@@ -31,6 +45,7 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 # noinspection PyUnusedLocal
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up this integration using YAML is not supported."""
+    await async_setup_services(hass)
     return True
 
 
@@ -57,6 +72,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     await coordinator.get_stored_token()
+    # while the cloud is unreachable, the first call of setup_entities is the probe
+    # of the breaker, or is refused and the setup retried later
     if not await coordinator.async_login():
         raise ConfigEntryAuthFailed("Electrolux wrong credentials")
 
@@ -64,13 +81,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if coordinator.config_entry is None:
         coordinator.config_entry = entry
 
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-
+    coordinator.stats.slow_budget = (
+        entry.data.get(CONF_SLOW_UPDATE_BUDGET, DEFAULT_SLOW_UPDATE_BUDGET) / 1000
+    )
     # Initialize entities
     _LOGGER.debug("async_setup_entry setup_entities")
     await coordinator.setup_entities()
     _LOGGER.debug("async_setup_entry listen_websocket")
+    # the pushed deltas are queued until the ingest task is started
     coordinator.listen_websocket()
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            coordinator.async_tick_countdowns,
+            timedelta(seconds=COUNTDOWN_INTERVAL),
+        )
+    )
     # _LOGGER.debug("async_setup_entry launch_websocket_renewal_task")
     # await coordinator.launch_websocket_renewal_task()
 
@@ -79,6 +105,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
+    # write the staleness of the entities when the cloud is lost or found again
+    entry.async_on_unload(
+        coordinator.breaker.add_listener(coordinator.async_update_listeners)
+    )
 
     _LOGGER.debug("async_setup_entry async_config_entry_first_refresh")
     # Fill in the values for first time
@@ -87,6 +117,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not coordinator.last_update_success:
         raise ConfigEntryNotReady
 
+    # only the coordinators of the entries set up are found by the services
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+
+    # started once the setup can no longer be retried, so that nothing leaks
+    if entry.data.get(CONF_RECORD_DELTAS, False):
+        coordinator.recorder = DeltaRecorder.create(hass)
+        entry.async_on_unload(coordinator.recorder.async_close)
+        _LOGGER.info(
+            "Electrolux recording the received deltas to %s",
+            coordinator.recorder.directory,
+        )
+    coordinator.launch_ingest_task()
+
     _LOGGER.debug("async_setup_entry extend PLATFORMS")
     coordinator.platforms.extend(PLATFORMS)
 
@@ -94,6 +137,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("async_setup_entry async_forward_entry_setups")
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            coordinator.async_refresh_inventory,
+            timedelta(seconds=INVENTORY_INTERVAL),
+        )
+    )
+
     _LOGGER.debug("async_setup_entry OVER")
     return True
 
@@ -107,7 +158,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     coordinator: ElectroluxCoordinator = hass.data[DOMAIN][entry.entry_id]
     await coordinator.close_websocket()
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, PLATFORMS
+    ):
+        hass.data[DOMAIN].pop(entry.entry_id)
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored entity plans of a removed entry."""
+    await Store(
+        hass, PLAN_STORAGE_VERSION, entity_plans_store_key(entry.entry_id)
+    ).async_remove()
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -0,0 +1,137 @@
+"""Alerts tracking for Electrolux Status."""
+
+import logging
+from typing import Any
+
+from .triggers import changed_paths, state_value
+from .util import create_notification, dismiss_notification
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# code, severity and acknowledge status of an alert
+Alert = tuple[str, str, str]
+
+# attribute of the alerts sensors holding the state of every alert code
+ATTR_ALERTS = "alerts"
+
+
+class AlertSource:
+    """Define the state of one alerts attribute of an appliance."""
+
+    def __init__(self, path: str, alert_types: dict[str, Any], title: str) -> None:
+        """Initialize the alerts attribute."""
+        self.path = path
+        self.title = title
+        # default is nullable - set a value for display to user
+        self.default_attributes: dict[str, str] = {key: "OFF" for key in alert_types}
+        self.attributes: dict[str, str] = dict(self.default_attributes)
+        self.active: set[Alert] = set()
+        self.raw: Any = None
+
+
+class AlertEngine:
+    """Keep the active alerts of an appliance.
+
+    Notifications are created or dismissed when an alert appears or disappears
+    and the attributes of the alerts entities are only rebuilt on changes.
+    """
+
+    def __init__(self, coordinator: Any) -> None:
+        """Initialize the engine."""
+        self.coordinator = coordinator
+        self.sources: dict[str, AlertSource] = {}
+
+    def register(self, path: str, alert_types: dict[str, Any], title: str) -> None:
+        """Track an alerts attribute of the appliance."""
+        self.sources[path] = AlertSource(path, alert_types, title)
+
+    def attributes(self, path: str) -> dict[str, str]:
+        """Return the alerts attributes of an alerts attribute."""
+        if source := self.sources.get(path):
+            return source.attributes
+        return {}
+
+    def codes(self, path: str) -> list[str]:
+        """Return the alert codes declared for an alerts attribute."""
+        if source := self.sources.get(path):
+            return list(source.default_attributes)
+        return []
+
+    def is_active(self, path: str, code: str) -> bool:
+        """Return true if an alert code of an alerts attribute is active."""
+        if source := self.sources.get(path):
+            return any(alert[0] == code for alert in source.active)
+        return False
+
+    def update(
+        self, reported_state: dict[str, Any], delta: dict[str, Any] | None = None
+    ) -> None:
+        """Refresh the active alerts from the reported state.
+
+        When a delta is given only the alerts attributes it contains are refreshed.
+        """
+        if not self.sources:
+            return
+        if delta is None:
+            paths = list(self.sources)
+        else:
+            paths = [path for path in changed_paths(delta) if path in self.sources]
+        for path in paths:
+            source = self.sources[path]
+            raw = state_value(reported_state, path)
+            if raw == source.raw:
+                continue
+            source.raw = raw
+            self._transition(source, self._alerts(raw))
+
+    def clear(self) -> None:
+        """Dismiss the notifications of the active alerts, as if all were cleared."""
+        for source in self.sources.values():
+            self._transition(source, set())
+            source.raw = None
+
+    @staticmethod
+    def _alerts(raw: Any) -> set[Alert]:
+        """Convert the reported alerts to a set."""
+        if not isinstance(raw, list):
+            return set()
+        return {
+            (
+                alert.get("code", "Unknown"),
+                alert.get("severity", "Alert"),
+                alert.get("acknowledgeStatus", ""),
+            )
+            for alert in raw
+            if isinstance(alert, dict)
+        }
+
+    def _transition(self, source: AlertSource, alerts: set[Alert]) -> None:
+        """Apply the difference between the active alerts and the new ones."""
+        raised = alerts - source.active
+        cleared = source.active - alerts
+        if not raised and not cleared:
+            return
+        _LOGGER.debug(
+            "Electrolux alerts of %s raised: %s cleared: %s",
+            source.path,
+            raised,
+            cleared,
+        )
+        hass = self.coordinator.hass
+        for name, severity, status in cleared:
+            dismiss_notification(hass, name, severity, status, title=source.title)
+        for name, severity, status in raised:
+            create_notification(
+                hass,
+                self.coordinator.config_entry,
+                alert_name=name,
+                alert_severity=severity,
+                alert_status=status,
+                title=source.title,
+            )
+
+        source.active = alerts
+        attributes = dict(source.default_attributes)
+        for name, severity, status in sorted(alerts):
+            attributes[name] = f"{severity}-{status}"
+        source.attributes = attributes
@@ -1,6 +1,6 @@
 """API for Electrolux Status."""
 
-import copy
+from functools import lru_cache
 import logging
 import re
 from typing import Any
@@ -14,32 +14,195 @@ from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.const import Platform, UnitOfTemperature
 
+from .alerts import AlertEngine
 from .binary_sensor import ElectroluxBinarySensor
 from .button import ElectroluxButton
-from .catalog_core import CATALOG_BASE, CATALOG_MODEL
+from .catalog_core import CATALOG_BASE, CATALOG_MODEL, CATALOG_MODEL_FILTERS
 from .const import (
     BINARY_SENSOR,
     BUTTON,
     ATTRIBUTES_BLACKLIST,
+    ENTITY_PLAN_VERSION,
     NUMBER,
     PLATFORMS,
     RENAME_RULES,
     SELECT,
     SENSOR,
     STATIC_ATTRIBUTES,
-    SWITCH, ATTRIBUTES_WHITELIST,
+    SWITCH,
+    ATTRIBUTES_WHITELIST,
 )
+from .countdown import CountdownEngine
 from .entity import ElectroluxEntity
-from .model import ElectroluxDevice
+from .model import (
+    ElectroluxAttributeFilter,
+    ElectroluxDevice,
+    ElectroluxEntityPlan,
+)
 from .number import ElectroluxNumber
+from .programs import ProgramIndex
 from .select import ElectroluxSelect
 from .sensor import ElectroluxSensor
 from .switch import ElectroluxSwitch
+from .triggers import TriggerEngine
+from .util import fingerprint
+from .validation import CapabilityValidator, CommandValidationError
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 HEADERS = {"Content-type": "application/json; charset=UTF-8"}
 
+# Rename rules compiled once, names are cached as many appliances share attributes
+RENAME_PATTERNS: list[re.Pattern[str]] = [re.compile(rule) for rule in RENAME_RULES]
+UPPERCASE_WORD = re.compile(r"[A-Z0-9]+")
+NAME_CACHE_SIZE = 4096
+ATTRIBUTE_FILTER_CACHE_SIZE = 8192
+
+
+def _truncate_name(attr_name: str) -> str:
+    """Apply the rename rules to an attribute name."""
+    for truncate_rule in RENAME_PATTERNS:
+        attr_name = truncate_rule.sub("", attr_name)
+    return attr_name
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def sensor_name(attr_name: str) -> str:
+    """Convert an attribute path to a lower case sentence.
+
+    ex: "fCMiscellaneousState/detergentExtradosage" to "detergent extradosage".
+    """
+    sensor = _truncate_name(attr_name)
+    sensor = sensor[0].upper() + sensor[1:]
+    sensor = sensor.replace("_", " ")
+    sensor = sensor.replace("/", " ")
+    group = ""
+    words = []
+    for i, char in enumerate(sensor):
+        if group == "":
+            group = char
+        else:
+            if char == " " and len(group) > 0:
+                words.append(group)
+                group = ""
+                continue
+
+            if (
+                (char.isupper() or char.isdigit())
+                and (sensor[i - 1].isupper() or sensor[i - 1].isdigit())
+                and (
+                    (i == len(sensor) - 1)
+                    or (sensor[i + 1].isupper() or sensor[i + 1].isdigit())
+                )
+            ):
+                group += char
+            elif (char.isupper() or char.isdigit()) and sensor[i - 1].islower():
+                if UPPERCASE_WORD.fullmatch(group):
+                    words.append(group)
+                else:
+                    words.append(group.lower())
+                group = char
+            else:
+                group += char
+    if len(group) > 0:
+        if UPPERCASE_WORD.fullmatch(group):
+            words.append(group)
+        else:
+            words.append(group.lower())
+    return " ".join(words).lower()
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def entity_name(attr_name: str) -> str:
+    """Extract the entity name of an attribute path."""
+    attr_name = _truncate_name(attr_name)
+    return attr_name.rpartition("/")[-1] or attr_name
+
+
+class AttributeFilter:
+    """Decide which capabilities are loaded as entities.
+
+    The blacklist and whitelist regex are combined into one pattern each and the
+    decision is cached per attribute.
+    """
+
+    def __init__(self, blacklist: list[str], whitelist: list[str]) -> None:
+        """Compile the filter."""
+        self.blacklist = blacklist
+        self.whitelist = whitelist
+        self._blacklist = self._combine(blacklist)
+        self._whitelist = self._combine(whitelist)
+        self.keep = lru_cache(maxsize=ATTRIBUTE_FILTER_CACHE_SIZE)(self._keep)
+
+    @staticmethod
+    def _combine(patterns: list[str]) -> re.Pattern[str] | None:
+        """Combine regex in a single alternation."""
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+    def _keep(self, source: str) -> bool:
+        """Return True if the source is not blacklisted or is whitelisted."""
+        if self._blacklist is None or not self._blacklist.match(source):
+            return True
+        if self._whitelist is not None and self._whitelist.match(source):
+            return True
+        _LOGGER.debug("Exclude source %s from list", source)
+        return False
+
+    def extend(self, overlay: ElectroluxAttributeFilter) -> "AttributeFilter":
+        """Return a new filter completed with the overlay."""
+        return AttributeFilter(
+            self.blacklist + overlay.blacklist, self.whitelist + overlay.whitelist
+        )
+
+
+ATTRIBUTE_FILTER = AttributeFilter(ATTRIBUTES_BLACKLIST, ATTRIBUTES_WHITELIST)
+_MODEL_ATTRIBUTE_FILTERS: dict[str, AttributeFilter] = {}
+
+
+def attribute_filter(model: str) -> AttributeFilter:
+    """Return the attribute filter of a model."""
+    if model not in CATALOG_MODEL_FILTERS:
+        return ATTRIBUTE_FILTER
+    if model not in _MODEL_ATTRIBUTE_FILTERS:
+        _MODEL_ATTRIBUTE_FILTERS[model] = ATTRIBUTE_FILTER.extend(
+            CATALOG_MODEL_FILTERS[model]
+        )
+    return _MODEL_ATTRIBUTE_FILTERS[model]
+
+
+# Base catalog extended with the model catalog, by model
+_MODEL_CATALOGS: dict[str, dict[str, ElectroluxDevice]] = {}
+# Fingerprints of the merged catalog, by model
+_CATALOG_FINGERPRINTS: dict[str, str] = {}
+
+
+def model_catalog(model: str) -> dict[str, ElectroluxDevice]:
+    """Return the catalog used for a model.
+
+    The merged catalog is built once and shared by the appliances of the model.
+    """
+    if model not in CATALOG_MODEL:
+        return CATALOG_BASE
+    if model not in _MODEL_CATALOGS:
+        _LOGGER.debug("Extending catalog for %s", model)
+        _MODEL_CATALOGS[model] = {**CATALOG_BASE, **CATALOG_MODEL[model]}
+    return _MODEL_CATALOGS[model]
+
+
+def catalog_fingerprint(model: str) -> str:
+    """Return the fingerprint of the catalog used for a model."""
+    if model not in _CATALOG_FINGERPRINTS:
+        catalog = model_catalog(model)
+        model_filter = attribute_filter(model)
+        _CATALOG_FINGERPRINTS[model] = fingerprint(
+            [(key, repr(device)) for key, device in sorted(catalog.items())],
+            model_filter.blacklist,
+            model_filter.whitelist,
+        )
+    return _CATALOG_FINGERPRINTS[model]
+
 
 class ElectroluxLibraryEntity:
     """Electrolux Library Entity."""
@@ -64,6 +227,11 @@ class ElectroluxLibraryEntity:
         """Return the reported state of the appliance."""
         return self.state.get("properties", {}).get("reported")
 
+    @property
+    def model(self) -> str:
+        """Return the model of the appliance."""
+        return self.appliance_info.get("model") if self.appliance_info else ""
+
     def get_name(self):
         """Get entity name."""
         return self.name
@@ -77,46 +245,7 @@ class ElectroluxLibraryEntity:
 
     def get_sensor_name(self, attr_name: str) -> str:
         """Get the name of the sensor."""
-        sensor = attr_name
-        for truncate_rule in RENAME_RULES:
-            sensor = re.sub(truncate_rule, "", sensor)
-        sensor = sensor[0].upper() + sensor[1:]
-        sensor = sensor.replace("_", " ")
-        sensor = sensor.replace("/", " ")
-        group = ""
-        words = []
-        for i, char in enumerate(sensor):
-            if group == "":
-                group = char
-            else:
-                if char == " " and len(group) > 0:
-                    words.append(group)
-                    group = ""
-                    continue
-
-                if (
-                    (char.isupper() or char.isdigit())
-                    and (sensor[i - 1].isupper() or sensor[i - 1].isdigit())
-                    and (
-                        (i == len(sensor) - 1)
-                        or (sensor[i + 1].isupper() or sensor[i + 1].isdigit())
-                    )
-                ):
-                    group += char
-                elif (char.isupper() or char.isdigit()) and sensor[i - 1].islower():
-                    if re.match("^[A-Z0-9]+$", group):
-                        words.append(group)
-                    else:
-                        words.append(group.lower())
-                    group = char
-                else:
-                    group += char
-        if len(group) > 0:
-            if re.match("^[A-Z0-9]+$", group):
-                words.append(group)
-            else:
-                words.append(group.lower())
-        return " ".join(words).lower()
+        return sensor_name(attr_name)
 
     # def get_sensor_name_old(self, attr_name: str, container: str | None = None):
     #     """Convert sensor format.
@@ -133,10 +262,7 @@ class ElectroluxLibraryEntity:
 
         ex: Convert format "fCMiscellaneousState/EWX1493A_detergentExtradosage" to "XdetergentExtradosage"
         """
-        for truncate_rule in RENAME_RULES:
-            attr_name = re.sub(truncate_rule, "", attr_name)
-
-        return attr_name.rpartition("/")[-1] or attr_name
+        return entity_name(attr_name)
 
     def get_entity_attr(self, attr_name: str) -> str:
         """Extract Entity attr in raw format.
@@ -289,27 +415,11 @@ class ElectroluxLibraryEntity:
         # dont load these entities by as they are not useful
         # we do load some of these directly via STATIC_ATTRIBUTES as
         # one or another are useful, but not all child values are
+        keep_source = attribute_filter(self.model).keep
+        sources = [key for key in self.capabilities if keep_source(key)]
 
-        def keep_source(source: str) -> bool:
-            for ignored_pattern in ATTRIBUTES_BLACKLIST:
-                if re.match(ignored_pattern, source):
-                    for whitelist_pattern in ATTRIBUTES_WHITELIST:
-                        if re.match(whitelist_pattern, source):
-                            return True
-                    _LOGGER.debug("Exclude source %s from list", source)
-                    return False
-            return True
-
-        sources = [
-            key
-            for key in list(self.capabilities.keys())
-            if keep_source(key)
-        ]
-
-        for key, value in self.capabilities.items():
-            if not keep_source(key):
-                continue
-
+        for key in sources.copy():
+            value = self.capabilities[key]
             if isinstance(value, dict):
                 for sub_key, sub_value in value.items():
                     if (
@@ -338,6 +448,7 @@ class Appliance:
     brand: str
     device: str
     entities: list[ElectroluxEntity]
+    platform_entities: dict[Platform, list[ElectroluxEntity]]
     coordinator: Any
 
     def __init__(
@@ -358,6 +469,14 @@ class Appliance:
         self.name = name
         self.brand = brand
         self.state: ApplienceStatusResponse = state
+        self.triggers = TriggerEngine(None)
+        self.programs = ProgramIndex(None)
+        self.alerts = AlertEngine(coordinator)
+        self.countdown = CountdownEngine(None)
+        self.entities = []
+        self.platform_entities = {}
+        # validators of the capabilities, compiled on the first command
+        self.validators: dict[str, CapabilityValidator] = {}
 
     @property
     def reported_state(self) -> dict[str, Any]:
@@ -379,20 +498,7 @@ class Appliance:
     def catalog(self) -> dict[str, ElectroluxDevice]:
         """Return the defined catalog for the appliance."""
         # TODO: Use appliance_type as opposed to model?
-        if self.model in CATALOG_MODEL:
-            _LOGGER.debug("Extending catalog for %s", self.model)
-            # Make a deep copy of the base catalog to preserve it
-            new_catalog = copy.deepcopy(CATALOG_BASE)
-
-            # Get the specific model's extended catalog
-            model_catalog = CATALOG_MODEL[self.model]
-
-            # Update the existing catalog with the extended information for this model
-            for key, device in model_catalog.items():
-                new_catalog[key] = device
-
-            return new_catalog
-        return CATALOG_BASE
+        return model_catalog(self.model)
 
     def update_missing_entities(self) -> None:
         """Add missing entities when no capabilities returned by the API.
@@ -426,6 +532,10 @@ class Appliance:
                     )
                     if entity := self.get_entity(key):
                         self.entities.extend(entity)
+                        for item in entity:
+                            self.platform_entities.setdefault(
+                                item.entity_type, []
+                            ).append(item)
 
     def get_state(self, attr_name: str) -> dict[str, Any] | None:
         """Retrieve the start from self.reported_state using the attribute name.
@@ -443,8 +553,8 @@ class Appliance:
 
         return result
 
-    def get_entity(self, capability: str) -> list[ElectroluxEntity] | None:
-        """Return the entity."""
+    def get_entity_plan(self, capability: str) -> ElectroluxEntityPlan | None:
+        """Return the plan of the entities derived from the capability."""
         entity_type = self.data.get_entity_type(capability)
         entity_name = self.data.get_entity_name(capability)
         entity_attr = self.data.get_entity_attr(capability)
@@ -454,18 +564,12 @@ class Appliance:
         entity_category = None
         entity_icon = None
         unit = self.data.get_entity_unit(capability)
-        display_name = f"{self.data.get_name()} {self.data.get_sensor_name(capability)}"
 
         # get the item definition from the catalog
         catalog_item = self.catalog.get(capability, None)
         if catalog_item:
             if capability_info is None:
                 capability_info = catalog_item.capability_info
-            elif (
-                "values" not in capability_info
-                and "values" in catalog_item.capability_info
-            ):
-                capability_info["values"] = catalog_item.capability_info["values"]
 
             device_class = catalog_item.device_class
             unit = catalog_item.unit
@@ -500,106 +604,119 @@ class Appliance:
             catalog_item,
         )
 
-        def electrolux_entity_factory(
-            name: str,
-            entity_type: Platform | None,
-            entity_name: str,
-            entity_attr: str,
-            entity_source: str,
-            capability: str,
-            unit: str,
-            entity_category: str,
-            device_class: str,
-            icon: str,
-            catalog_entry: ElectroluxDevice | None,
-            commands: Any | None = None,
-        ):
-            entity_classes = {
-                BINARY_SENSOR: ElectroluxBinarySensor,
-                BUTTON: ElectroluxButton,
-                NUMBER: ElectroluxNumber,
-                SELECT: ElectroluxSelect,
-                SENSOR: ElectroluxSensor,
-                SWITCH: ElectroluxSwitch,
-            }
+        if entity_type not in PLATFORMS:
+            return None
 
-            entity_class = entity_classes.get(entity_type)
-
-            if entity_class is None:
-                _LOGGER.debug("Unknown entity type %s for %s", entity_type, name)
-                raise ValueError(f"Unknown entity type: {entity_type}")
-
-            entity_params = {
-                "coordinator": self.coordinator,
-                "config_entry": self.coordinator.config_entry,
-                "pnc_id": self.pnc_id,
-                "name": name,
-                "entity_type": entity_type,
-                "entity_name": entity_name,
-                "entity_attr": entity_attr,
-                "entity_source": entity_source,
-                "capability": capability,
-                "unit": unit,
-                "entity_category": entity_category,
-                "device_class": device_class,
-                "icon": icon,
-                "catalog_entry": catalog_entry,
-            }
+        return ElectroluxEntityPlan(
+            capability=capability,
+            entity_type=entity_type,
+            entity_name=entity_name,
+            entity_attr=entity_attr,
+            entity_source=category,
+            sensor_name=self.data.get_sensor_name(capability),
+            capability_info=capability_info,
+            unit=unit,
+            device_class=device_class,
+            entity_category=entity_category,
+            icon=entity_icon,
+            static=False,
+        )
 
-            if commands is None:
-                return [entity_class(**entity_params)]
-
-            entities: list[
-                ElectroluxBinarySensor
-                | ElectroluxNumber
-                | ElectroluxSensor
-                | ElectroluxSwitch
-                | ElectroluxButton
-                | ElectroluxSelect
-            ] = []
-            # Replace entity name and icons for multi-entities attribute (one value = one entity)
-            for command in commands:
-                entity = {**entity_params, "val_to_send": command}
-                if catalog_item:
-                    if catalog_item.entity_value_named:
-                        entity["name"] = command
-                    if (
-                        catalog_item.entity_icons_value_map
-                        and catalog_item.entity_icons_value_map.get(command, None)
-                    ):
-                        entity["icon"] = catalog_item.entity_icons_value_map.get(
-                            command
-                        )
-                # Instanciate the new entity and append it
-                entities.append(entity_class(**entity))
-            return entities
-
-        if entity_type in PLATFORMS:
-            commands = (
-                capability_info.get("values", {}) if entity_type == BUTTON else None
-            )
-            return electrolux_entity_factory(
-                name=display_name,
-                entity_type=entity_type,
-                entity_name=entity_name,
-                entity_attr=entity_attr,
-                entity_source=category,
-                capability=capability_info,
-                unit=unit,
-                entity_category=entity_category,
-                device_class=device_class,
-                icon=entity_icon,
-                catalog_entry=catalog_item,
-                commands=commands,
-            )
+    def build_entities(self, plan: ElectroluxEntityPlan) -> list[ElectroluxEntity]:
+        """Instantiate the entities described by an entity plan."""
+        entity_classes = {
+            BINARY_SENSOR: ElectroluxBinarySensor,
+            BUTTON: ElectroluxButton,
+            NUMBER: ElectroluxNumber,
+            SELECT: ElectroluxSelect,
+            SENSOR: ElectroluxSensor,
+            SWITCH: ElectroluxSwitch,
+        }
+
+        name = f"{self.data.get_name()} {plan['sensor_name']}"
+        entity_type = plan["entity_type"]
+        entity_class = entity_classes.get(entity_type)
+
+        if entity_class is None:
+            _LOGGER.debug("Unknown entity type %s for %s", entity_type, name)
+            raise ValueError(f"Unknown entity type: {entity_type}")
+
+        catalog_item = self.catalog.get(plan["capability"], None)
+        entity_params = {
+            "coordinator": self.coordinator,
+            "config_entry": self.coordinator.config_entry,
+            "pnc_id": self.pnc_id,
+            "name": name,
+            "entity_type": entity_type,
+            "entity_name": plan["entity_name"],
+            "entity_attr": plan["entity_attr"],
+            "entity_source": plan["entity_source"],
+            "capability": plan["capability_info"],
+            "unit": plan["unit"],
+            "entity_category": plan["entity_category"],
+            "device_class": plan["device_class"],
+            "icon": plan["icon"],
+            "catalog_entry": catalog_item,
+        }
+
+        if entity_type != BUTTON:
+            return [entity_class(**entity_params)]
+
+        entities: list[ElectroluxEntity] = []
+        # Replace entity name and icons for multi-entities attribute (one value = one entity)
+        for command in plan["capability_info"].get("values", {}):
+            entity = {**entity_params, "val_to_send": command}
+            if catalog_item:
+                if catalog_item.entity_value_named:
+                    entity["name"] = command
+                if (
+                    catalog_item.entity_icons_value_map
+                    and catalog_item.entity_icons_value_map.get(command, None)
+                ):
+                    entity["icon"] = catalog_item.entity_icons_value_map.get(command)
+            # Instanciate the new entity and append it
+            entities.append(entity_class(**entity))
+        return entities
 
+    def get_entity(self, capability: str) -> list[ElectroluxEntity] | None:
+        """Return the entity."""
+        if plan := self.get_entity_plan(capability):
+            return self.build_entities(plan)
         return []
 
-    def setup(self, data: ElectroluxLibraryEntity):
-        """Configure the entity."""
-        self.data: ElectroluxLibraryEntity = data
-        self.entities: list[ElectroluxEntity] = []
-        entities: list[ElectroluxEntity] = []
+    @property
+    def entity_plan_key(self) -> str:
+        """Return the key identifying the entity plans of the appliance.
+
+        The plans only depend on the capabilities, the catalog and the static
+        attributes reported in the state, so they can be reused as long as none of them change.
+        """
+        return fingerprint(
+            ENTITY_PLAN_VERSION,
+            self.model,
+            catalog_fingerprint(self.model),
+            [
+                static_attribute
+                for static_attribute in STATIC_ATTRIBUTES
+                if self.get_state(static_attribute) is not None
+            ],
+            self.data.capabilities,
+        )
+
+    def complete_capabilities(self) -> None:
+        """Complete the capabilities missing values with those of the catalog."""
+        for capability, catalog_item in self.catalog.items():
+            capability_info = self.data.get_capability(capability)
+            if (
+                isinstance(capability_info, dict)
+                and "values" not in capability_info
+                and "values" in catalog_item.capability_info
+            ):
+                capability_info["values"] = catalog_item.capability_info["values"]
+
+    def compile_entity_plans(self) -> list[ElectroluxEntityPlan]:
+        """Derive the entity plans from the capabilities and the catalog."""
+        plans: list[ElectroluxEntityPlan] = []
         # Extraction of the appliance capabilities & mapping to the known entities of the component
         # [ "applianceState", "autoDosing",..., "userSelections/analogTemperature",...]
         capabilities_names = self.data.sources_list()
@@ -618,41 +735,125 @@ class Appliance:
             # attr not found in state, next attr
             if self.get_state(static_attribute) is None:
                 continue
-            if catalog_item := self.catalog.get(static_attribute, None):
-                if (entity := self.get_entity(static_attribute)) is None:
+            if static_attribute in self.catalog:
+                if (plan := self.get_entity_plan(static_attribute)) is None:
                     # catalog definition and automatic checks fail to determine type
                     _LOGGER.debug(
                         "Electrolux static_attribute undefined %s", static_attribute
                     )
                     continue
-                # add to the capability dict
-                keys = static_attribute.split("/")
-                capabilities = self.data.capabilities
-                for key in keys[:-1]:
-                    capabilities = capabilities.setdefault(key, {})
-                capabilities[keys[-1]] = catalog_item.capability_info
-                _LOGGER.debug("Electrolux adding static_attribute %s", static_attribute)
-                entities.extend(entity)
+                plan["static"] = True
+                plans.append(plan)
 
         # For each capability src
         if capabilities_names:
             for capability in capabilities_names:
-                if entity := self.get_entity(capability):
-                    entities.extend(entity)
+                if plan := self.get_entity_plan(capability):
+                    plans.append(plan)
                 else:
                     _LOGGER.debug("Could not create entity for capability %s", capability)
 
-        # Setup each found entity
+        return plans
+
+    def setup(self, data: ElectroluxLibraryEntity):
+        """Configure the entity."""
+        self.data: ElectroluxLibraryEntity = data
+        self.validators = {}
+        self.entities: list[ElectroluxEntity] = []
+        entities: list[ElectroluxEntity] = []
+
+        # The key must be computed before the capabilities are completed
+        # with the catalog, whether the plans are compiled or reused
+        plan_key = self.entity_plan_key
+        self.complete_capabilities()
+        stored = self.coordinator.entity_plans.get(self.pnc_id)
+        if stored and stored["key"] == plan_key:
+            _LOGGER.debug("Electrolux reusing stored entity plans for %s", self.pnc_id)
+            plans = stored["plans"]
+        else:
+            plans = self.compile_entity_plans()
+            self.coordinator.entity_plans[self.pnc_id] = {
+                "key": plan_key,
+                "plans": plans,
+            }
+
+        for plan in plans:
+            if plan["static"]:
+                # add to the capability dict
+                keys = plan["capability"].split("/")
+                capabilities = self.data.capabilities
+                for key in keys[:-1]:
+                    capabilities = capabilities.setdefault(key, {})
+                capabilities[keys[-1]] = plan["capability_info"]
+                _LOGGER.debug(
+                    "Electrolux adding static_attribute %s", plan["capability"]
+                )
+            entities.extend(self.build_entities(plan))
+
+        # Setup each found entity and bucket it by platform
         self.entities = entities
+        self.platform_entities = {}
+        self.alerts = AlertEngine(self.coordinator)
         for entity in entities:
             entity.setup(data)
+            self.platform_entities.setdefault(entity.entity_type, []).append(entity)
+            if entity.entity_attr == "alerts":
+                self.alerts.register(
+                    entity.json_path, entity.capability.get("values", {}), entity.name
+                )
+        self.alerts.update(self.reported_state)
+
+        self.programs = ProgramIndex(self.data.capabilities)
+        self.programs.update(self.reported_state)
+        self.triggers = TriggerEngine(self.data.capabilities)
+        self.triggers.evaluate(self.reported_state)
+        self.countdown = CountdownEngine(self.data.capabilities)
+        self.countdown.sync(self.reported_state)
+
+    def get_constraint(self, attr_name: str) -> dict[str, Any]:
+        """Return the overrides currently applied to a capability.
+
+        The overrides of the selected program are completed by the active triggers.
+        """
+        program = self.programs.constraint(attr_name)
+        trigger = self.triggers.constraint(attr_name)
+        if not program:
+            return trigger
+        if not trigger:
+            return program
+        return {**program, **trigger}
+
+    def validate_command(
+        self, path: str, value: Any, capability: dict[str, Any] | None = None
+    ) -> Any:
+        """Return the value of a command to a capability, snapped to its step.
+
+        The validator is compiled from the capability of the appliance, completed
+        with the catalog, whatever the caller. The capability of the entity
+        sending the command is only used when the appliance has none. Raise
+        CommandValidationError if the capability or its current overrides do not
+        accept the value.
+        """
+        if (validator := self.validators.get(path)) is None:
+            if self.data and isinstance(
+                reported := self.data.get_capability(path), dict
+            ):
+                capability = reported
+            if not isinstance(capability, dict):
+                raise CommandValidationError(f"Unknown capability {path}")
+            validator = self.validators[path] = CapabilityValidator(path, capability)
+        if constraint := self.get_constraint(path):
+            validator = validator.override(constraint)
+        return validator.validate(value)
 
     def update_reported_data(self, reported_data: dict[str, Any]):
         """Update the reported data."""
-        _LOGGER.debug("Electrolux update reported data %s", reported_data)
         try:
             self.reported_state.update(reported_data)
-            _LOGGER.debug("Electrolux updated reported data %s", self.state)
+            self.programs.update(self.reported_state)
+            self.triggers.update(reported_data, self.reported_state)
+            self.countdown.sync(self.reported_state, reported_data)
+            self.alerts.update(self.reported_state, reported_data)
             self.update_missing_entities()
             for entity in self.entities:
                 entity.update(self.state)
@@ -667,6 +868,10 @@ class Appliance:
     def update(self, appliance_status: ApplienceStatusResponse):
         """Update appliance status."""
         self.state = appliance_status
+        self.programs.update(self.reported_state)
+        self.triggers.evaluate(self.reported_state)
+        self.countdown.sync(self.reported_state)
+        self.alerts.update(self.reported_state)
         self.update_missing_entities()
         for entity in self.entities:
             entity.update(self.state)
@@ -690,3 +895,11 @@ class Appliances:
     def get_appliance_ids(self) -> list[str]:
         """Return all appliance ids."""
         return list(self.appliances)
+
+    def get_platform_entities(self, platform: Platform) -> list[ElectroluxEntity]:
+        """Return the entities of a platform, for all appliances."""
+        return [
+            entity
+            for appliance in self.appliances.values()
+            for entity in appliance.platform_entities.get(platform, ())
+        ]
@@ -1,14 +1,22 @@
 """Binary sensor platform for Electrolux Status."""
 
 import logging
+from typing import Any
 
-from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import BINARY_SENSOR, DOMAIN
+from .const import BINARY_SENSOR, DOMAIN, SIGNAL_NEW_APPLIANCES
 from .entity import ElectroluxEntity
+from .model import ElectroluxDevice
 from .util import string_to_boolean
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
@@ -21,19 +29,34 @@ async def async_setup_entry(
 ) -> None:
     """Configure binary sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    if appliances := coordinator.data.get("appliances", None):
-        for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity
-                for entity in appliance.entities
-                if entity.entity_type == BINARY_SENSOR
+
+    @callback
+    def async_add_appliances(appliances: Any) -> None:
+        entities = appliances.get_platform_entities(BINARY_SENSOR)
+        _LOGGER.debug(
+            "Electrolux add %d BINARY_SENSOR entities to registry", len(entities)
+        )
+        async_add_entities(
+            [
+                *entities,
+                *(
+                    ElectroluxAlertBinarySensor(
+                        coordinator, entry, appliance_id, path, code
+                    )
+                    for appliance_id, appliance in appliances.get_appliances().items()
+                    for path in appliance.alerts.sources
+                    for code in appliance.alerts.codes(path)
+                ),
             ]
-            _LOGGER.debug(
-                "Electrolux add %d BINARY_SENSOR entities to registry for appliance %s",
-                len(entities),
-                appliance_id,
-            )
-            async_add_entities(entities)
+        )
+
+    if appliances := coordinator.data.get("appliances", None):
+        async_add_appliances(appliances)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_NEW_APPLIANCES.format(entry.entry_id), async_add_appliances
+        )
+    )
 
 
 class ElectroluxBinarySensor(ElectroluxEntity, BinarySensorEntity):
@@ -51,16 +74,76 @@ class ElectroluxBinarySensor(ElectroluxEntity, BinarySensorEntity):
             return self.catalog_entry.state_invert
         return False
 
+    # numeric states need to be inverted as well
+    decode_strings_only = False
+
+    @staticmethod
+    def decode(catalog_entry: ElectroluxDevice | None, unit: str | None, value: Any) -> Any:
+        """Convert a raw value to the state of the binary_sensor."""
+        if isinstance(value, str):
+            value = string_to_boolean(value, True)
+        if catalog_entry and catalog_entry.state_invert:
+            return not value
+        return value
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary_sensor is on."""
         value = self.extract_value()
-        if isinstance(value, str):
-            value = string_to_boolean(value, True)
         if value is None:
             if self.catalog_entry and self.catalog_entry.state_mapping:
                 mapping = self.catalog_entry.state_mapping
                 value = self.get_state_attr(mapping)
         if value is not None:
-            self._cached_value = value
-        return not self._cached_value if self.invert else self._cached_value
+            self._cached_value = self.decoder(value)
+        return self._cached_value
+
+
+class ElectroluxAlertBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Alert code of an appliance, disabled by default.
+
+    The state is only written when the alert is raised or cleared.
+    """
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: Any,
+        config_entry: ConfigEntry,
+        pnc_id: str,
+        path: str,
+        code: str,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self.pnc_id = pnc_id
+        self.path = path
+        self.code = code
+        self._written: bool | None = None
+        self._attr_name = f"Alert {code.replace('_', ' ').lower()}"
+        self._attr_unique_id = f"{config_entry.entry_id}-alert-{code}-{path}-{pnc_id}"
+        appliance = coordinator.data["appliances"].get_appliance(pnc_id)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, appliance.name)},
+            "name": appliance.name,
+            "model": appliance.model,
+            "manufacturer": appliance.brand,
+        }
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if the alert is active."""
+        appliance = self.coordinator.data["appliances"].get_appliance(self.pnc_id)
+        return appliance is not None and appliance.alerts.is_active(
+            self.path, self.code
+        )
+
+    def _handle_coordinator_update(self) -> None:
+        """Write the state when the alert is raised or cleared."""
+        if (is_on := self.is_on) != self._written:
+            self._written = is_on
+            self.async_write_ha_state()
@@ -0,0 +1,174 @@
+"""Circuit breaker of the Electrolux cloud for Electrolux Status.
+
+After consecutive outage errors the breaker of the account opens: the
+non-essential calls to the API fail right away and the entities keep the last
+known state, marked as stale. Once the open delay elapses a single call is let
+through as a probe; its success closes the breaker, its failure opens it again
+for twice as long. Commands sent by the user are always let through.
+
+The breakers are kept per account across reloads of the config entry, so that
+setup retries do not call an unreachable cloud either.
+"""
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime
+import logging
+import time
+from typing import Any
+
+from aiohttp import ClientConnectionError, ClientResponseError
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_OPEN_DELAY,
+    BREAKER_OPEN_DELAY,
+    DOMAIN_DATA,
+)
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# OneAppApi methods called even when the breaker is open, without changing its
+# state: commands of the user and the token needed to send them
+ESSENTIAL_ENDPOINTS = ("execute_appliance_command", "get_user_token")
+
+
+class CircuitOpenError(Exception):
+    """The cloud is unreachable, the call was not made."""
+
+
+def is_outage(ex: BaseException) -> bool:
+    """Return true if an error means the cloud is unreachable."""
+    if isinstance(ex, ClientResponseError):
+        return ex.status >= 500
+    return isinstance(ex, ClientConnectionError | asyncio.TimeoutError)
+
+
+class CircuitBreaker:
+    """Track the reachability of the cloud for an account."""
+
+    def __init__(
+        self,
+        account: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        open_delay: float = BREAKER_OPEN_DELAY,
+        max_open_delay: float = BREAKER_MAX_OPEN_DELAY,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.account = account
+        self.failure_threshold = failure_threshold
+        self.open_delay = open_delay
+        self.max_open_delay = max_open_delay
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.delay = open_delay
+        self.opened_at = 0.0
+        # wall clock time of the last successful exchange with the cloud
+        self.last_success: datetime | None = None
+        self._probing = False
+        # called when the breaker opens or closes
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call a listener when the breaker opens or closes, return its removal."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _notify(self) -> None:
+        """Call the listeners."""
+        for listener in list(self._listeners):
+            listener()
+
+    @property
+    def stale(self) -> bool:
+        """Return true if the known state may be outdated."""
+        return self.state != STATE_CLOSED
+
+    def allow(self) -> bool:
+        """Return true if a call can be made now.
+
+        A call let through an open breaker is its probe, which must be ended by
+        record_success, record_failure or release.
+        """
+        if self.state == STATE_CLOSED:
+            return True
+        if self.state == STATE_OPEN:
+            if time.monotonic() - self.opened_at < self.delay:
+                return False
+            _LOGGER.debug("Electrolux cloud breaker of %s half open", self.account)
+            self.state = STATE_HALF_OPEN
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful exchange with the cloud."""
+        self.last_success = dt_util.utcnow()
+        self.failures = 0
+        self._probing = False
+        if self.state != STATE_CLOSED:
+            _LOGGER.info(
+                "Electrolux cloud reachable again, breaker of %s closed", self.account
+            )
+            self.state = STATE_CLOSED
+            self.delay = self.open_delay
+            self._notify()
+
+    def record_failure(self) -> None:
+        """Record an outage error."""
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN:
+            self.delay = min(self.delay * 2, self.max_open_delay)
+            self._open()
+        elif self.state == STATE_CLOSED and self.failures >= self.failure_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """End a probe which neither succeeded nor failed with an outage."""
+        self._probing = False
+
+    def _open(self) -> None:
+        """Stop the calls for the open delay."""
+        self._probing = False
+        self.opened_at = time.monotonic()
+        if self.state == STATE_CLOSED:
+            _LOGGER.warning(
+                "Electrolux cloud unreachable, breaker of %s open for %d s",
+                self.account,
+                self.delay,
+            )
+            self.state = STATE_OPEN
+            self._notify()
+        else:
+            _LOGGER.debug(
+                "Electrolux cloud probe failed, breaker of %s open for %d s",
+                self.account,
+                self.delay,
+            )
+            self.state = STATE_OPEN
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the breaker."""
+        last_success = self.last_success.isoformat() if self.last_success else None
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "open_delay": self.delay,
+            "last_success": last_success,
+        }
+
+
+def async_get_breaker(hass: HomeAssistant, account: str) -> CircuitBreaker:
+    """Return the breaker of an account."""
+    breakers: dict[str, CircuitBreaker] = hass.data.setdefault(DOMAIN_DATA, {})
+    if (breaker := breakers.get(account)) is None:
+        breaker = breakers[account] = CircuitBreaker(account)
+    return breaker
@@ -8,10 +8,11 @@ from pyelectroluxocp.oneAppApi import OneAppApi
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import BUTTON, DOMAIN, icon_mapping
+from .const import BUTTON, DOMAIN, SIGNAL_NEW_APPLIANCES, icon_mapping
 from .entity import ElectroluxEntity
 from .model import ElectroluxDevice
 
@@ -25,17 +26,22 @@ async def async_setup_entry(
 ) -> None:
     """Configure button platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_appliances(appliances: Any) -> None:
+        entities = appliances.get_platform_entities(BUTTON)
+        _LOGGER.debug(
+            "Electrolux add %d BUTTON entities to registry", len(entities)
+        )
+        async_add_entities(entities)
+
     if appliances := coordinator.data.get("appliances", None):
-        for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == BUTTON
-            ]
-            _LOGGER.debug(
-                "Electrolux add %d BUTTON entities to registry for appliance %s",
-                len(entities),
-                appliance_id,
-            )
-            async_add_entities(entities)
+        async_add_appliances(appliances)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_NEW_APPLIANCES.format(entry.entry_id), async_add_appliances
+        )
+    )
 
 
 class ElectroluxButton(ElectroluxEntity, ButtonEntity):
@@ -104,6 +110,22 @@ class ElectroluxButton(ElectroluxEntity, ButtonEntity):
             return name
         return f"{name} {self.val_to_send}"
 
+    @property
+    def available(self) -> bool:
+        """Return True if the command is currently accepted by the appliance."""
+        if not super().available:
+            return False
+        constraint = self.constraint
+        if constraint.get("disabled", False) or constraint.get("access") == "read":
+            return False
+        values: dict[str, Any] | None = constraint.get("values", None)
+        if values is None:
+            return True
+        entry = values.get(self.val_to_send, None)
+        return entry is not None and not (
+            isinstance(entry, dict) and entry.get("disabled", False)
+        )
+
     @property
     def icon(self) -> str | None:
         """Return the icon of the entity."""
@@ -0,0 +1,191 @@
+"""Capture and replay of the push stream for Electrolux Status.
+
+When enabled, the deltas received from the websocket are appended to one file per
+appliance, in a capture directory created for each setup of the integration.
+Each file starts with a header line holding the appliance id, followed by one
+[timestamp, delta] line per delta.
+
+A capture can be fed back through the coordinator at the recorded pace, faster,
+or as fast as possible. Replayed deltas go straight to the ingest queue: they
+are neither recorded, counted as pushes nor taken as a sign of the cloud being
+reachable.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from datetime import datetime
+import json
+import logging
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+CAPTURE_DIR = "captures"
+CAPTURE_SUFFIX = ".jsonl"
+# pending deltas are written after FLUSH_DELAY seconds or once FLUSH_SIZE are buffered
+FLUSH_DELAY = 5
+FLUSH_SIZE = 500
+# deltas replayed at maximum speed between two yields to the event loop
+REPLAY_BATCH = 100
+
+UNSAFE_CHARACTERS = re.compile(r"[^\w.-]")
+
+# timestamp, appliance id, delta
+CapturedDelta = tuple[float, str, dict[str, Any]]
+
+
+def captures_path(hass: HomeAssistant) -> Path:
+    """Return the directory holding the captures."""
+    return Path(hass.config.path(DOMAIN, CAPTURE_DIR))
+
+
+def _dumps(data: Any) -> str:
+    """Serialize compactly."""
+    return json.dumps(data, separators=(",", ":"))
+
+
+class DeltaRecorder:
+    """Append the received deltas to the files of a capture.
+
+    Deltas are buffered in the event loop and written by the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: Path) -> None:
+        """Initialize the recorder."""
+        self._hass = hass
+        self.directory = directory
+        self._buffer: dict[str, list[str]] = {}
+        self._pending = 0
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._writes: set[asyncio.Future] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, hass: HomeAssistant) -> "DeltaRecorder":
+        """Create a recorder writing to a new capture."""
+        name = datetime.now().strftime("%Y%m%d-%H%M%S")
+        return cls(hass, captures_path(hass) / name)
+
+    @callback
+    def record(self, appliance_id: str, delta: dict[str, Any]) -> None:
+        """Buffer a delta received for an appliance."""
+        self._buffer.setdefault(appliance_id, []).append(
+            _dumps([round(time.time(), 3), delta])
+        )
+        self._pending += 1
+        if self._pending >= FLUSH_SIZE:
+            self._async_flush()
+        elif self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self._hass, FLUSH_DELAY, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: datetime | None = None) -> None:
+        """Write the buffered deltas in the executor."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        if not self._buffer:
+            return
+        buffer, self._buffer, self._pending = self._buffer, {}, 0
+        write = self._hass.async_add_executor_job(self._write, buffer)
+        self._writes.add(write)
+        write.add_done_callback(self._writes.discard)
+
+    def _write(self, buffer: dict[str, list[str]]) -> None:
+        """Append the lines of each appliance to its file."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for appliance_id, lines in buffer.items():
+                path = self.directory / (
+                    UNSAFE_CHARACTERS.sub("_", appliance_id) + CAPTURE_SUFFIX
+                )
+                header = not path.exists()
+                with open(path, "a", encoding="utf-8") as file:
+                    if header:
+                        file.write(_dumps({"applianceId": appliance_id}) + "\n")
+                    file.write("\n".join(lines) + "\n")
+
+    async def async_close(self) -> None:
+        """Write the pending deltas."""
+        self._async_flush()
+        if self._writes:
+            await asyncio.gather(*self._writes)
+
+
+def _read_file(path: Path) -> Iterator[CapturedDelta]:
+    """Return the deltas of a capture file."""
+    with open(path, encoding="utf-8") as file:
+        appliance_id = json.loads(file.readline())["applianceId"]
+        for line in file:
+            if line.strip():
+                timestamp, delta = json.loads(line)
+                yield timestamp, appliance_id, delta
+
+
+def capture_directory(root: Path, name: str) -> Path | None:
+    """Return the directory of a capture, None if it is not one of the root."""
+    root = root.resolve()
+    directory = (root / name).resolve()
+    if (
+        directory == root
+        or not directory.is_relative_to(root)
+        or not directory.is_dir()
+    ):
+        return None
+    return directory
+
+
+def read_capture(directory: Path) -> list[CapturedDelta]:
+    """Return the deltas of every appliance of a capture, in reception order."""
+    deltas = [
+        delta
+        for path in sorted(directory.glob(f"*{CAPTURE_SUFFIX}"))
+        for delta in _read_file(path)
+    ]
+    deltas.sort(key=lambda delta: delta[0])
+    return deltas
+
+
+async def async_replay_capture(
+    coordinators: list[Any], deltas: list[CapturedDelta], speed: float = 1.0
+) -> int:
+    """Feed captured deltas to the coordinators of their appliances.
+
+    The deltas of every coordinator are replayed on a single timeline; speed
+    multiplies the recorded pace, 0 replays as fast as possible.
+    Deltas of appliances unknown to the coordinators are skipped.
+    Return the number of deltas replayed.
+    """
+    owners = {
+        appliance_id: coordinator
+        for coordinator in coordinators
+        for appliance_id in coordinator.data["appliances"].get_appliance_ids()
+    }
+    deltas = [delta for delta in deltas if delta[1] in owners]
+    if not deltas:
+        return 0
+    _LOGGER.debug(
+        "Electrolux replaying %d deltas at speed %s", len(deltas), speed or "max"
+    )
+    loop = asyncio.get_running_loop()
+    first = deltas[0][0]
+    start = loop.time()
+    for count, (timestamp, appliance_id, delta) in enumerate(deltas, 1):
+        if speed:
+            if (wait := start + (timestamp - first) / speed - loop.time()) > 0:
+                await asyncio.sleep(wait)
+        elif count % REPLAY_BATCH == 0:
+            await asyncio.sleep(0)
+        owners[appliance_id].ingest.put(appliance_id, delta, time.perf_counter())
+    return len(deltas)
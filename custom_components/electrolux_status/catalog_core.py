@@ -15,7 +15,11 @@ from homeassistant.const import (
 from homeassistant.helpers.entity import EntityCategory
 
 from .catalog_refridgerator import EHE6899SA
-from .model import ElectroluxDevice
+from .model import ElectroluxAttributeFilter, ElectroluxDevice, ElectroluxWritePolicy
+
+# write policies of the values changing often without meaning much
+TEMPERATURE_WRITE_POLICY = ElectroluxWritePolicy(min_interval=60, deadband=0.5)
+COUNTER_WRITE_POLICY = ElectroluxWritePolicy(min_interval=60)
 
 # definitions of model explicit overrides. These will be used to
 # create a new catalog with a merged definition of properties
@@ -23,6 +27,10 @@ CATALOG_MODEL: dict[str, dict[str, ElectroluxDevice]] = {
     "EHE6899SA": EHE6899SA,
 }
 
+# definitions of model explicit attribute filters. These extend
+# ATTRIBUTES_BLACKLIST and ATTRIBUTES_WHITELIST for the model
+CATALOG_MODEL_FILTERS: dict[str, ElectroluxAttributeFilter] = {}
+
 CATALOG_BASE: dict[str, ElectroluxDevice] = {
     "airFilterLifeTime": ElectroluxDevice(
         capability_info={"access": "read", "type": "number"},
@@ -102,6 +110,7 @@ CATALOG_BASE: dict[str, ElectroluxDevice] = {
         unit=UnitOfTemperature.CELSIUS,
         entity_category=None,
         entity_icon="mdi:thermometer",
+        write_policy=TEMPERATURE_WRITE_POLICY,
     ),
     "applianceTotalWorkingTime": ElectroluxDevice(
         capability_info={"access": "read", "type": "number"},
@@ -167,6 +176,7 @@ CATALOG_BASE: dict[str, ElectroluxDevice] = {
         unit=UnitOfTemperature.CELSIUS,
         entity_category=None,
         entity_icon="mdi:thermometer",
+        write_policy=ElectroluxWritePolicy(deadband=0.5),
     ),
     "displayTemperature": ElectroluxDevice(
         capability_info={"access": "read", "type": "string"},
@@ -600,6 +610,7 @@ CATALOG_BASE: dict[str, ElectroluxDevice] = {
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_icon="mdi:wifi",
         entity_registry_enabled_default=False,
+        write_policy=ElectroluxWritePolicy(min_interval=300),
     ),
     "ovenProcessIdentifier": ElectroluxDevice(
         capability_info={"access": "read", "type": "string"},
@@ -643,6 +654,7 @@ CATALOG_BASE: dict[str, ElectroluxDevice] = {
         unit=UnitOfTime.SECONDS,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_icon="mdi:timelapse",
+        write_policy=COUNTER_WRITE_POLICY,
     ),
     "sensorHumidity": ElectroluxDevice(
         capability_info={"access": "read", "type": "number"},
@@ -651,6 +663,7 @@ CATALOG_BASE: dict[str, ElectroluxDevice] = {
         entity_category=None,
         entity_icon="mdi:water-opacity",
         friendly_name="Humidity",
+        write_policy=ElectroluxWritePolicy(min_interval=60, deadband=1),
     ),
     "sensorTemperature": ElectroluxDevice(
         capability_info={"access": "read", "type": "number"},
@@ -658,6 +671,7 @@ CATALOG_BASE: dict[str, ElectroluxDevice] = {
         unit=UnitOfTemperature.CELSIUS,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_icon="mdi:thermometer",
+        write_policy=TEMPERATURE_WRITE_POLICY,
     ),
     "startTime": ElectroluxDevice(
         capability_info={
@@ -704,6 +718,7 @@ CATALOG_BASE: dict[str, ElectroluxDevice] = {
         unit=UnitOfTime.SECONDS,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_icon="mdi:av-timer",
+        write_policy=COUNTER_WRITE_POLICY,
     ),
     "totalCycleCounter": ElectroluxDevice(
         capability_info={"access": "read", "type": "number"},
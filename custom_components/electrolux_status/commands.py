@@ -0,0 +1,101 @@
+"""Bulk commands of the appliances for Electrolux Status.
+
+The commands of a bulk request are all validated against the capabilities
+before any is sent. The commands of an appliance are merged into a single
+payload, and the payloads of the appliances are sent concurrently, within the
+limit of concurrent calls of their account.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from .api import Appliance
+from .coordinator import loaded_coordinators
+from .validation import CommandValidationError
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+def find_appliance(hass: HomeAssistant, appliance_id: str) -> Appliance | None:
+    """Return an appliance of any account."""
+    for coordinator in loaded_coordinators(hass):
+        if appliances := coordinator.data.get("appliances", None):
+            if appliance := appliances.get_appliance(appliance_id):
+                return appliance
+    return None
+
+
+def merge_command(payload: dict[str, Any], path: str, value: Any) -> None:
+    """Add the command of a capability to the payload of its appliance."""
+    source, _, attr = path.rpartition("/")
+    if source:
+        payload.setdefault(source, {})[attr] = value
+    else:
+        payload[attr] = value
+
+
+async def _async_send(appliance: Appliance, payload: dict[str, Any]) -> Any:
+    """Send the merged commands of an appliance."""
+    _LOGGER.debug("Electrolux bulk command %s to %s", payload, appliance.pnc_id)
+    return await appliance.coordinator.api.execute_appliance_command(
+        appliance.pnc_id, payload
+    )
+
+
+async def async_send_commands(
+    hass: HomeAssistant, commands: list[dict[str, Any]]
+) -> dict[str, dict[str, Any]]:
+    """Send appliance, path and value commands, return the result of each appliance.
+
+    Nothing is sent if a command is invalid.
+    """
+    appliances: dict[str, Appliance] = {}
+    payloads: dict[str, dict[str, Any]] = {}
+    errors: list[str] = []
+    for index, command in enumerate(commands):
+        appliance_id, path = command["appliance_id"], command["path"]
+        appliance = appliances.get(appliance_id) or find_appliance(hass, appliance_id)
+        if appliance is None:
+            errors.append(f"commands[{index}] unknown appliance {appliance_id}")
+            continue
+        try:
+            value = appliance.validate_command(path, command["value"])
+        except CommandValidationError as ex:
+            errors.append(f"commands[{index}] {appliance_id}: {ex}")
+            continue
+        appliances[appliance_id] = appliance
+        merge_command(payloads.setdefault(appliance_id, {}), path, value)
+    if errors:
+        raise ServiceValidationError("; ".join(errors))
+
+    results = await asyncio.gather(
+        *(
+            _async_send(appliances[appliance_id], payload)
+            for appliance_id, payload in payloads.items()
+        ),
+        return_exceptions=True,
+    )
+    response: dict[str, dict[str, Any]] = {}
+    for (appliance_id, payload), result in zip(
+        payloads.items(), results, strict=True
+    ):
+        if isinstance(result, Exception):
+            _LOGGER.warning(
+                "Electrolux bulk command to %s failed: %s", appliance_id, result
+            )
+            response[appliance_id] = {
+                "success": False,
+                "command": payload,
+                "error": str(result) or type(result).__name__,
+            }
+        else:
+            response[appliance_id] = {
+                "success": True,
+                "command": payload,
+                "result": result,
+            }
+    return response
@@ -25,11 +25,15 @@ from homeassistant.helpers.selector import (
 )
 
 from .const import (
+    CONF_DIAGNOSTICS_LIVE,
     CONF_LANGUAGE,
     CONF_NOTIFICATION_DEFAULT,
     CONF_NOTIFICATION_DIAG,
     CONF_NOTIFICATION_WARNING,
+    CONF_RECORD_DELTAS,
+    CONF_SLOW_UPDATE_BUDGET,
     DEFAULT_LANGUAGE,
+    DEFAULT_SLOW_UPDATE_BUDGET,
     DOMAIN,
     languages,
 )
@@ -169,6 +173,11 @@ class ElectroluxStatusOptionsFlowHandler(OptionsFlow):
         notify_alert = self.config_entry.data.get(CONF_NOTIFICATION_DEFAULT, True)
         notify_warning = self.config_entry.data.get(CONF_NOTIFICATION_WARNING, False)
         notify_diagnostic = self.config_entry.data.get(CONF_NOTIFICATION_DIAG, False)
+        record_deltas = self.config_entry.data.get(CONF_RECORD_DELTAS, False)
+        diagnostics_live = self.config_entry.data.get(CONF_DIAGNOSTICS_LIVE, False)
+        slow_update_budget = self.config_entry.data.get(
+            CONF_SLOW_UPDATE_BUDGET, DEFAULT_SLOW_UPDATE_BUDGET
+        )
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
@@ -196,6 +205,13 @@ class ElectroluxStatusOptionsFlowHandler(OptionsFlow):
                     vol.Optional(
                         CONF_NOTIFICATION_DIAG, default=notify_diagnostic
                     ): cv.boolean,
+                    vol.Optional(CONF_RECORD_DELTAS, default=record_deltas): cv.boolean,
+                    vol.Optional(
+                        CONF_SLOW_UPDATE_BUDGET, default=slow_update_budget
+                    ): cv.positive_int,
+                    vol.Optional(
+                        CONF_DIAGNOSTICS_LIVE, default=diagnostics_live
+                    ): cv.boolean,
                     # vol.Optional(
                     #     CONF_RENEW_INTERVAL,
                     #     default=self.config_entry.options.get(
@@ -216,6 +232,11 @@ class ElectroluxStatusOptionsFlowHandler(OptionsFlow):
             CONF_NOTIFICATION_DEFAULT: self.options[CONF_NOTIFICATION_DEFAULT],
             CONF_NOTIFICATION_WARNING: self.options[CONF_NOTIFICATION_WARNING],
             CONF_NOTIFICATION_DIAG: self.options[CONF_NOTIFICATION_DIAG],
+            CONF_RECORD_DELTAS: self.options.get(CONF_RECORD_DELTAS, False),
+            CONF_SLOW_UPDATE_BUDGET: self.options.get(
+                CONF_SLOW_UPDATE_BUDGET, DEFAULT_SLOW_UPDATE_BUDGET
+            ),
+            CONF_DIAGNOSTICS_LIVE: self.options.get(CONF_DIAGNOSTICS_LIVE, False),
         }
         self.hass.config_entries.async_update_entry(self.config_entry, data=data)
         return self.async_create_entry(
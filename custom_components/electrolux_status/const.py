@@ -24,10 +24,32 @@ CONF_RENEW_INTERVAL = "renew_interval"
 CONF_NOTIFICATION_DEFAULT = "notifications"
 CONF_NOTIFICATION_DIAG = "notifications_diagnostic"
 CONF_NOTIFICATION_WARNING = "notifications_warning"
+CONF_RECORD_DELTAS = "record_deltas"
+CONF_SLOW_UPDATE_BUDGET = "slow_update_budget"
+CONF_DIAGNOSTICS_LIVE = "diagnostics_live"
+
+# Services
+SERVICE_LOG_PAYLOADS = "log_payloads"
+SERVICE_PROFILE = "profile"
+SERVICE_REPLAY_CAPTURE = "replay_capture"
+SERVICE_SEND_COMMANDS = "send_commands"
 
 # Defaults
 DEFAULT_LANGUAGE = "English"
 DEFAULT_WEBSOCKET_RENEWAL_DELAY = 43200  # 12 hours
+DEFAULT_SLOW_UPDATE_BUDGET = 100  # milliseconds
+DEFAULT_API_CONCURRENCY = 4  # calls in flight per account
+INGEST_QUEUE_SIZE = 100  # pushed deltas pending per account before compaction
+INVENTORY_INTERVAL = 900  # seconds between checks of the appliances of the account
+
+# dispatched with the Appliances added to a config entry after its setup
+SIGNAL_NEW_APPLIANCES = f"{DOMAIN}_new_appliances_{{}}"
+
+# Circuit breaker of the cloud: consecutive outage errors opening it and
+# seconds before a probe, doubled on each failed probe up to the maximum
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_OPEN_DELAY = 30
+BREAKER_MAX_OPEN_DELAY = 900
 
 # these are attributes that appear in the state file but not in the capabilities.
 # defining them here and in the catalog will allow these devices to be added dynamically
@@ -97,5 +119,14 @@ ATTRIBUTES_WHITELIST: list[str] = [".*waterUsage",
 RENAME_RULES: list[str] = [r"^userSelections\/[^_]+_", r"^userSelections\/",
                            r"^fCMiscellaneousState\/[^_]+_", r"^fCMiscellaneousState\/"]
 
-# List of entity names that need to be updated to 0 manually when they are close to 0
-TIME_ENTITIES_TO_UPDATE = ["timeToEnd"]
+# Countdowns interpolated locally, with the appliance state they count down in.
+# The cloud does not send the end of the countdowns
+COUNTDOWN_ATTRIBUTES = {"timeToEnd": "RUNNING", "startTime": "DELAYED_START"}
+# Appliance state reached at the end of a countdown, if declared by the appliance
+COUNTDOWN_END_STATES = {"timeToEnd": "END_OF_CYCLE"}
+# Seconds between two evaluations of the countdowns, they are published by the minute
+COUNTDOWN_INTERVAL = 10
+
+# Version of the entity plans derived from the capabilities.
+# Bump it when the entity derivation logic changes so the stored plans are rebuilt
+ENTITY_PLAN_VERSION = 1
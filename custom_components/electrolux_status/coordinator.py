@@ -3,8 +3,8 @@
 import asyncio
 import base64
 from datetime import UTC, timedelta
-import json
 import logging
+import time
 from typing import Any
 
 from aiohttp import ClientResponseError
@@ -14,18 +14,50 @@ from pyelectroluxocp.oneAppApiClient import UserToken
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .api import Appliance, Appliances, ElectroluxLibraryEntity
-from .const import DOMAIN, TIME_ENTITIES_TO_UPDATE
-from .model import ElectroluxTokenStore
+from .breaker import CircuitOpenError, async_get_breaker, is_outage
+from .capture import DeltaRecorder
+from .const import DOMAIN, SIGNAL_NEW_APPLIANCES
+from .ingest import IngestQueue
+from .model import (
+    ElectroluxApplianceEntityPlans,
+    ElectroluxEntityPlanStore,
+    ElectroluxTokenStore,
+)
+from .payloads import (
+    PAYLOAD_CAPABILITIES,
+    PAYLOAD_DELTA,
+    PAYLOAD_INFO,
+    PAYLOAD_LIST,
+    PayloadLog,
+)
+from .stats import (
+    STAGE_FANOUT,
+    STAGE_MERGE,
+    STAGE_TOTAL,
+    TOKEN_REFRESHES,
+    WEBSOCKET_RECONNECTS,
+    CoordinatorStats,
+    InstrumentedApi,
+)
+from .util import decode_entity_plan, encode_entity_plan
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 SAVE_DELAY = 0
 STORAGE_VERSION = 1
+PLAN_STORAGE_VERSION = 1
+
+
+def entity_plans_store_key(entry_id: str) -> str:
+    """Return the storage key of the entity plans of a config entry."""
+    return f"{DOMAIN}.entity_plans.{entry_id}"
 
 
 class ElectroluxCoordinator(DataUpdateCoordinator):
@@ -41,10 +73,14 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         username: str,
     ) -> None:
         """Initialize."""
-        self.api = client
+        self.stats = CoordinatorStats()
+        self.breaker = async_get_breaker(hass, username)
+        self.api = InstrumentedApi(client, self.stats, breaker=self.breaker)
         self.platforms = []
         self.renew_task = None
         self.token_task = None
+        self.ingest = IngestQueue()
+        self.ingest_task = None
         self.renew_interval = renew_interval
         self._token_expiry = renew_interval
         self._websocket = None
@@ -52,6 +88,14 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         self._token: UserToken | None = None
         self._token_store: ElectroluxTokenStore | None = None
         self._store: Store[ElectroluxTokenStore] = Store(hass, STORAGE_VERSION, DOMAIN)
+        # created per config entry when the plans are loaded
+        self._plan_store: Store[ElectroluxEntityPlanStore] | None = None
+        self._stored_plans: ElectroluxEntityPlanStore | None = None
+        self.entity_plans: dict[str, ElectroluxApplianceEntityPlans] = {}
+        # records the received deltas when enabled
+        self.recorder: DeltaRecorder | None = None
+        # recent raw payloads, dumped to the diagnostics or on demand
+        self.payloads = PayloadLog()
 
         super().__init__(hass, _LOGGER, name=DOMAIN)
 
@@ -146,6 +190,62 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         self._token = None
         return data
 
+    async def load_entity_plans(self) -> None:
+        """Load the entity plans compiled during a previous setup.
+
+        The plans of each config entry are stored apart, so that the accounts
+        do not overwrite each other. Without config entry nothing is stored.
+        """
+        if self._plan_store is None and self.config_entry is not None:
+            self._plan_store = Store(
+                self.hass,
+                PLAN_STORAGE_VERSION,
+                entity_plans_store_key(self.config_entry.entry_id),
+            )
+        self._stored_plans = None
+        if self._plan_store is not None:
+            self._stored_plans = await self._plan_store.async_load()
+        self._stored_plans = self._stored_plans or {"appliances": {}}
+        self.entity_plans = {}
+        for appliance_id, entry in self._stored_plans["appliances"].items():
+            try:
+                self.entity_plans[appliance_id] = {
+                    "key": entry["key"],
+                    "plans": [decode_entity_plan(plan) for plan in entry["plans"]],
+                }
+            except Exception as ex:  # noqa: BLE001
+                _LOGGER.debug(
+                    "Electrolux entity plans of %s could not be loaded: %s",
+                    appliance_id,
+                    ex,
+                )
+
+    @callback
+    def _async_save_entity_plans(self) -> None:
+        """Schedule the save of the entity plans."""
+        if self._plan_store is not None:
+            self._plan_store.async_delay_save(self._save_entity_plans, SAVE_DELAY)
+
+    @callback
+    def _save_entity_plans(self) -> ElectroluxEntityPlanStore:
+        """Return entity plans data to store in a file.
+
+        The plans of the appliances no longer in the account are dropped.
+        """
+        _LOGGER.debug("Saving entity plans to store for %s", self._accountid)
+        data: ElectroluxEntityPlanStore = {"appliances": {}}
+
+        appliances: Appliances = self.data.get("appliances", None)
+        for appliance_id in appliances.get_appliance_ids():
+            if entry := self.entity_plans.get(appliance_id):
+                data["appliances"][appliance_id] = {
+                    "key": entry["key"],
+                    "plans": [encode_entity_plan(plan) for plan in entry["plans"]],
+                }
+
+        self._stored_plans = data
+        return data
+
     async def get_stored_token(self) -> None:
         """Fetch the store token and store into the coordinator."""
         if self._token is None:
@@ -181,6 +281,8 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
 
             if token and token.token:
                 if self._token is None or self._token.token != token.token:
+                    if self._token is not None:
+                        self.stats.increment(TOKEN_REFRESHES)
                     # update the token_expiry only if the token changed
                     await self.update_token_lifetime(token)
                 _LOGGER.debug("Electrolux logged in successfully, %s", token.token)
@@ -190,6 +292,8 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
             _LOGGER.debug(
                 "HTTP error occurred during login to ElectroluxStatus: %s", ex
             )
+            if is_outage(ex):
+                raise ConfigEntryNotReady("Electrolux cloud unreachable") from ex
             self._store.async_delay_save(self._clear_token, SAVE_DELAY)
             if ex.status == 429:
                 raise ConfigEntryNotReady(
@@ -198,57 +302,91 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                 ) from ex
             raise ConfigEntryError from ex
         except Exception as ex:
+            if is_outage(ex):
+                raise ConfigEntryNotReady("Electrolux cloud unreachable") from ex
             _LOGGER.error("Could not log in to ElectroluxStatus, %s", ex)
             raise ConfigEntryError from ex
         return False
 
-    async def deferred_update(self, appliance_id: str, delay: int) -> None:
-        """Deferred update due to Electrolux not sending updated data at the end of the appliance program/cycle."""
-        _LOGGER.debug(
-            "Electrolux scheduling deferred update for appliance %s", appliance_id
-        )
-        await asyncio.sleep(delay)
-        _LOGGER.debug(
-            "Electrolux scheduled deferred update for appliance %s running",
-            appliance_id,
-        )
-        appliances: Appliances = self.data.get("appliances", None)
-        # Should not happen : wonder if this is not the cause of infinite loop of integrations creations => disabled
-        # if appliances is None or len(appliances.get_appliances()) == 0:
-        #     await self.setup_entities()
-        #     appliances = self.data.get('appliances', None)
-
-        for local_appliance_id in appliances.get_appliances():
-            if local_appliance_id != appliance_id:
-                pass
+    def incoming_data(self, data: dict[str, dict[str, Any]]):
+        """Queue incoming data, processed by the ingest task."""
+        received = time.perf_counter()
+        self.stats.record_push(data)
+        # a push proves the cloud reachable
+        self.breaker.record_success()
+        for appliance_id, appliance_data in data.items():
+            self.payloads.record(appliance_id, PAYLOAD_DELTA, appliance_data)
+            if self.recorder:
+                self.recorder.record(appliance_id, appliance_data)
+            self.ingest.put(appliance_id, appliance_data, received)
+
+    def launch_ingest_task(self):
+        """Start the processing of the queued incoming data.
+
+        The task of a config entry is cancelled when the entry is unloaded.
+        """
+        if self.ingest_task:
+            self.ingest_task.cancel()
+        if self.config_entry is not None:
+            self.ingest_task = self.config_entry.async_create_background_task(
+                self.hass, self.ingest_incoming_data(), "Electrolux ingest"
+            )
+        else:
+            self.ingest_task = self.hass.async_create_background_task(
+                self.ingest_incoming_data(), "Electrolux ingest"
+            )
+
+    async def ingest_incoming_data(self):
+        """Process the queued incoming data, one batch at a time."""
+        while True:
+            batch = await self.ingest.get()
             try:
-                appliance: Appliance = appliances.get_appliances().get(appliance_id)
-                appliance_status = await self.api.get_appliance_state(appliance_id)
-                appliance.update(appliance_status)
-                self.async_set_updated_data(self.data)
-            except Exception as exception:
-                _LOGGER.exception(exception)  # noqa: TRY401
-                raise UpdateFailed from exception
+                self.process_incoming_data(batch)
+            except Exception as ex:  # noqa: BLE001
+                _LOGGER.error("Electrolux could not process incoming data %s", ex)
 
-    def incoming_data(self, data: dict[str, dict[str, Any]]):
-        """Process incoming data."""
-        _LOGGER.debug("Electrolux appliance state updated %s", json.dumps(data))
+    def process_incoming_data(self, batch: list[tuple[float, str, dict[str, Any]]]):
+        """Merge a batch of incoming data and update the entities once."""
         # Update reported data
         appliances: Appliances = self.data.get("appliances", None)
-        for appliance_id, appliance_data in data.items():
+        # reception time of the oldest delta of each appliance
+        received: dict[str, float] = {}
+        for delta_received, appliance_id, appliance_data in batch:
             appliance = appliances.get_appliance(appliance_id)
+            if appliance is None:
+                _LOGGER.debug("Electrolux incoming data of unknown %s", appliance_id)
+                continue
+            received.setdefault(appliance_id, delta_received)
+            start = time.perf_counter()
             appliance.update_reported_data(appliance_data)
+            self.stats.record_stage(
+                appliance_id,
+                STAGE_MERGE,
+                time.perf_counter() - start,
+                appliance_data,
+            )
+        if not received:
+            return
+        start = time.perf_counter()
         self.async_set_updated_data(self.data)
-        # Bug in Electrolux library : no data sent when appliance cycle is over
-        for appliance_id, appliance_data in data.items():
-            do_deferred = False
-            for key, value in appliance_data.items():
-                if key in TIME_ENTITIES_TO_UPDATE:
-                    if value is not None and 0 < value <= 1:
-                        do_deferred = True
-                        break
-            if do_deferred:
-                asyncio.create_task(self.deferred_update(appliance_id, 70))
+        end = time.perf_counter()
+        for appliance_id, delta_received in received.items():
+            self.stats.record_stage(appliance_id, STAGE_FANOUT, end - start)
+            self.stats.record_stage(appliance_id, STAGE_TOTAL, end - delta_received)
+
+    @callback
+    def async_tick_countdowns(self, _now: Any = None) -> None:
+        """Publish the countdowns of the appliances interpolated locally."""
+        appliances: Appliances | None = (self.data or {}).get("appliances", None)
+        if appliances is None:
+            return
+        changed = False
+        for appliance in appliances.get_appliances().values():
+            if delta := appliance.countdown.tick(appliance.reported_state):
+                appliance.update_reported_data(delta)
+                changed = True
+        if changed:
+            self.async_set_updated_data(self.data)
 
     def listen_websocket(self):
         """Listen for state changes."""
@@ -257,6 +395,8 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         _LOGGER.debug("Electrolux listen_websocket for appliances %s", ",".join(ids))
         if ids is None or len(ids) == 0:
             return
+        if self._websocket is not None:
+            self.stats.increment(WEBSOCKET_RECONNECTS)
         self._websocket = asyncio.create_task(
             self.api.watch_for_appliance_state_updates(ids, self.incoming_data)
         )
@@ -317,6 +457,9 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
 
     async def close_websocket(self):
         """Close websocket."""
+        if self.ingest_task:
+            self.ingest_task.cancel()
+            self.ingest_task = None
         if self.renew_task:
             self.renew_task.cancel()
             self.renew_task = None
@@ -333,6 +476,7 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         _LOGGER.debug("Electrolux setup_entities")
         appliances = Appliances({})
         self.data = {"appliances": appliances}
+        await self.load_entity_plans()
         try:
             appliances_list = await self.api.get_appliances_list()
             if appliances_list is None:
@@ -343,84 +487,194 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                     "Electrolux unable to retrieve appliances list. Cancelling setup"
                 )
             _LOGGER.debug(
-                "Electrolux get_appliances_list %s %s",
-                self.api,
-                json.dumps(appliances_list),
+                "Electrolux get_appliances_list found %d appliances",
+                len(appliances_list),
             )
 
             for appliance_json in appliances_list:
-                appliance_capabilities = None
-                appliance_id = appliance_json.get("applianceId")
-                connection_status = appliance_json.get("connectionState")
-                _LOGGER.debug("Electrolux found appliance %s", appliance_id)
-                # appliance_profile = await self.hass.async_add_executor_job(self.api.getApplianceProfile, appliance)
-                appliance_name = appliance_json.get("applianceData").get(
-                    "applianceName"
-                )
-                appliance_infos = await self.api.get_appliances_info([appliance_id])
-                _LOGGER.debug(
-                    "Electrolux get_appliances_info result: %s",
-                    json.dumps(appliance_infos),
-                )
-                appliance_state = await self.api.get_appliance_state(appliance_id)
-                _LOGGER.debug(
-                    "Electrolux get_appliance_state result: %s",
-                    json.dumps(appliance_state),
-                )
-                try:
-                    appliance_capabilities = await self.api.get_appliance_capabilities(
-                        appliance_id
-                    )
-                    _LOGGER.debug(
-                        "Electrolux get_appliance_capabilities result: %s",
-                        json.dumps(appliance_capabilities),
-                    )
-                except Exception as exception:  # noqa: BLE001
-                    _LOGGER.warning(
-                        "Electrolux unable to retrieve capabilities, we are going on our own",
-                        exception,
-                    )
-                    # raise ConfigEntryNotReady(
-                    #     "Electrolux unable to retrieve capabilities. Cancelling setup"
-                    # ) from exception
-
-                appliance_info = appliance_infos[0] if appliance_infos else None
-
-                appliance_model = appliance_info.get("model") if appliance_info else ""
-                brand = appliance_info.get("brand") if appliance_info else ""
-                # appliance_profile not reported
-                appliance = Appliance(
-                    coordinator=self,
-                    pnc_id=appliance_id,
-                    name=appliance_name,
-                    brand=brand,
-                    model=appliance_model,
-                    state=appliance_state,
-                )
-                appliances.appliances[appliance_id] = appliance
-
-                appliance.setup(
-                    ElectroluxLibraryEntity(
-                        name=appliance_name,
-                        status=connection_status,
-                        state=appliance_state,
-                        appliance_info=appliance_info,
-                        capabilities=appliance_capabilities,
-                    )
-                )
+                await self.setup_appliance(appliances, appliance_json)
+            self._async_save_entity_plans()
+        except ConfigEntryNotReady:
+            raise
         except Exception as exception:
             _LOGGER.debug("setup_entities: %s", exception)
+            if isinstance(exception, CircuitOpenError) or is_outage(exception):
+                raise ConfigEntryNotReady(
+                    "Electrolux cloud unreachable"
+                ) from exception
             raise UpdateFailed from exception
         return self.data
 
+    async def setup_appliance(
+        self, appliances: Appliances, appliance_json: dict[str, Any]
+    ) -> Appliance:
+        """Fetch an appliance of the appliances list and configure its entities."""
+        appliance_capabilities = None
+        appliance_id = appliance_json.get("applianceId")
+        connection_status = appliance_json.get("connectionState")
+        _LOGGER.debug("Electrolux found appliance %s", appliance_id)
+        self.payloads.record(appliance_id, PAYLOAD_LIST, appliance_json)
+        # appliance_profile = await self.hass.async_add_executor_job(self.api.getApplianceProfile, appliance)
+        appliance_name = appliance_json.get("applianceData").get("applianceName")
+        appliance_infos = await self.api.get_appliances_info([appliance_id])
+        self.payloads.record(appliance_id, PAYLOAD_INFO, appliance_infos)
+        appliance_state = await self.api.get_appliance_state(appliance_id)
+        self.payloads.record_state(appliance_id, appliance_state)
+        try:
+            appliance_capabilities = await self.api.get_appliance_capabilities(
+                appliance_id
+            )
+            self.payloads.record(
+                appliance_id, PAYLOAD_CAPABILITIES, appliance_capabilities
+            )
+        except Exception as exception:  # noqa: BLE001
+            if isinstance(exception, CircuitOpenError) or is_outage(exception):
+                # the appliance is set up again once the cloud is reachable
+                raise
+            _LOGGER.warning(
+                "Electrolux unable to retrieve capabilities, going on our own: %s",
+                exception,
+            )
+            # raise ConfigEntryNotReady(
+            #     "Electrolux unable to retrieve capabilities. Cancelling setup"
+            # ) from exception
+
+        appliance_info = appliance_infos[0] if appliance_infos else None
+
+        appliance_model = appliance_info.get("model") if appliance_info else ""
+        brand = appliance_info.get("brand") if appliance_info else ""
+        # appliance_profile not reported
+        appliance = Appliance(
+            coordinator=self,
+            pnc_id=appliance_id,
+            name=appliance_name,
+            brand=brand,
+            model=appliance_model,
+            state=appliance_state,
+        )
+        appliances.appliances[appliance_id] = appliance
+
+        appliance.setup(
+            ElectroluxLibraryEntity(
+                name=appliance_name,
+                status=connection_status,
+                state=appliance_state,
+                appliance_info=appliance_info,
+                capabilities=appliance_capabilities,
+            )
+        )
+        return appliance
+
+    async def async_refresh_inventory(self, _now: Any = None) -> None:
+        """Add the appliances added to the account and remove the removed ones.
+
+        The appliances already known are left untouched.
+        """
+        appliances: Appliances | None = (self.data or {}).get("appliances", None)
+        if appliances is None:
+            return
+        try:
+            appliances_list = await self.api.get_appliances_list()
+        except Exception as exception:  # noqa: BLE001
+            _LOGGER.debug("Electrolux inventory refresh failed: %s", exception)
+            return
+        if appliances_list is None:
+            return
+        listed = {
+            appliance_json.get("applianceId") for appliance_json in appliances_list
+        }
+        known = set(appliances.get_appliance_ids())
+
+        removed = known - listed
+        for appliance_id in removed:
+            self.remove_appliance(appliances, appliance_id)
+
+        added = Appliances({})
+        for appliance_json in appliances_list:
+            appliance_id = appliance_json.get("applianceId")
+            if appliance_id in known:
+                continue
+            _LOGGER.info("Electrolux appliance %s added to the account", appliance_id)
+            try:
+                appliance = await self.setup_appliance(appliances, appliance_json)
+            except Exception as exception:  # noqa: BLE001
+                # retried on the next refresh
+                appliances.appliances.pop(appliance_id, None)
+                _LOGGER.warning(
+                    "Electrolux could not set up appliance %s: %s",
+                    appliance_id,
+                    exception,
+                )
+                continue
+            added.appliances[appliance_id] = appliance
+
+        if removed or added.appliances:
+            # also drops the plans of the removed appliances
+            self._async_save_entity_plans()
+        if added.appliances:
+            async_dispatcher_send(
+                self.hass,
+                SIGNAL_NEW_APPLIANCES.format(self.config_entry.entry_id),
+                added,
+            )
+        if removed or added.appliances:
+            # subscribe to the updates of the current appliances
+            try:
+                await self.api.disconnect_websocket()
+            except Exception as ex:  # noqa: BLE001
+                _LOGGER.error("Electrolux inventory could not close websocket %s", ex)
+            self.listen_websocket()
+
+    def remove_appliance(self, appliances: Appliances, appliance_id: str) -> None:
+        """Remove an appliance removed from the account, with its device."""
+        appliance = appliances.get_appliance(appliance_id)
+        _LOGGER.info("Electrolux appliance %s removed from the account", appliance_id)
+        appliance.alerts.clear()
+        device_registry = dr.async_get(self.hass)
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, appliance.name)}
+        ):
+            entity_registry = er.async_get(self.hass)
+            for entry in er.async_entries_for_device(
+                entity_registry, device.id, include_disabled_entities=True
+            ):
+                if entry.config_entry_id == self.config_entry.entry_id:
+                    entity_registry.async_remove(entry.entity_id)
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=self.config_entry.entry_id
+            )
+        # the entities still listening until their removal is handled skip the
+        # updates of an appliance they cannot find
+        del appliances.appliances[appliance_id]
+        self.stats.appliances.pop(appliance_id, None)
+        self.payloads.appliances.pop(appliance_id, None)
+
     async def _async_update_data(self):
-        """Update data via library."""
+        """Update data via library.
+
+        While the cloud is unreachable the last known state is kept.
+        """
         appliances: Appliances = self.data.get("appliances", None)
+        failure: Exception | None = None
         for appliance_id, appliance in appliances.get_appliances().items():
             try:
                 appliance_status = await self.api.get_appliance_state(appliance_id)
                 appliance.update(appliance_status)
-            except Exception as exception:
+            except CircuitOpenError:
+                _LOGGER.debug("Electrolux cloud unreachable, keeping the last state")
+                break
+            except Exception as exception:  # noqa: BLE001
                 _LOGGER.debug("_async_update_data: %s", exception)
-                raise UpdateFailed from exception
+                failure = exception
+        if failure is not None and not self.breaker.stale:
+            raise UpdateFailed from failure
         return self.data
+
+
+def loaded_coordinators(hass: HomeAssistant) -> list[ElectroluxCoordinator]:
+    """Return the coordinators of the accounts whose appliances are set up."""
+    return [
+        coordinator
+        for coordinator in hass.data.get(DOMAIN, {}).values()
+        if coordinator.data is not None
+    ]
@@ -0,0 +1,92 @@
+"""Local countdowns for Electrolux Status.
+
+The cloud pushes the remaining time of a cycle (timeToEnd) or of a delayed start
+(startTime) irregularly and never sends their end. The remaining time is
+interpolated from the last reported value with the monotonic clock, published
+once per minute, and set back to the reported value whenever the cloud sends one.
+"""
+
+import logging
+import time
+from typing import Any
+
+from .const import COUNTDOWN_ATTRIBUTES, COUNTDOWN_END_STATES
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+APPLIANCE_STATE = "applianceState"
+
+
+class CountdownEngine:
+    """Interpolate the countdowns of an appliance."""
+
+    def __init__(self, capabilities: dict[str, Any] | None) -> None:
+        """Keep the countdowns declared by the capabilities."""
+        capabilities = capabilities or {}
+        self.paths = {
+            path: state
+            for path, state in COUNTDOWN_ATTRIBUTES.items()
+            if path in capabilities
+        }
+        states = (capabilities.get(APPLIANCE_STATE) or {}).get("values") or {}
+        self.end_states = {
+            path: state
+            for path, state in COUNTDOWN_END_STATES.items()
+            if state in states
+        }
+        # reported value and monotonic time it was reported at
+        self.running: dict[str, tuple[float, float]] = {}
+        # values published by the engine, not resynchronized from
+        self.published: dict[str, int] = {}
+
+    def sync(
+        self, reported_state: dict[str, Any], delta: dict[str, Any] | None = None
+    ) -> None:
+        """Start, resynchronize or stop the countdowns from the reported state.
+
+        When a delta is given only the countdowns it updates are synchronized.
+        """
+        if not self.paths:
+            return
+        now = time.monotonic()
+        for path, state in self.paths.items():
+            value = reported_state.get(path)
+            if delta is not None:
+                if path not in delta and APPLIANCE_STATE not in delta:
+                    continue
+                if path in delta and self.published.get(path) == value:
+                    # echo of a value published by the engine
+                    continue
+            self.published.pop(path, None)
+            if (
+                isinstance(value, int | float)
+                and value > 0
+                and reported_state.get(APPLIANCE_STATE) == state
+            ):
+                self.running[path] = (value, now)
+            else:
+                self.running.pop(path, None)
+
+    def tick(self, reported_state: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the delta publishing the countdowns that changed minute."""
+        if not self.running:
+            return None
+        now = time.monotonic()
+        delta: dict[str, Any] = {}
+        for path, (value, reported_at) in list(self.running.items()):
+            remaining = int(max(value - (now - reported_at), 0))
+            current = reported_state.get(path)
+            if remaining == 0:
+                del self.running[path]
+                delta[path] = 0
+                if end_state := self.end_states.get(path):
+                    delta[APPLIANCE_STATE] = end_state
+                _LOGGER.debug("Electrolux countdown %s ended", path)
+            elif not isinstance(current, int | float) or (
+                remaining // 60 != int(current) // 60
+            ):
+                delta[path] = remaining
+        for path, value in delta.items():
+            if path in self.paths:
+                self.published[path] = value
+        return delta or None
@@ -0,0 +1,64 @@
+"""Value decoding for Electrolux Status."""
+
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+import logging
+from typing import Any
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+DECODE_CACHE_SIZE = 256
+
+
+class ValueDecoder:
+    """Decode the raw values of a capability to the values displayed by an entity.
+
+    Values declared by the capability and the catalog are decoded up front,
+    other values are decoded on first use and kept in a bounded cache.
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[Any], Any],
+        values: Iterable[Any],
+        strings_only: bool = False,
+    ) -> None:
+        """Build the decode table."""
+        self.table: dict[Any, Any] = {}
+        for value in values:
+            try:
+                self.table[value] = decode(value)
+            except (TypeError, ValueError) as ex:
+                _LOGGER.debug("Electrolux unable to decode %s: %s", value, ex)
+        # when only strings need decoding, other undeclared values are returned as is
+        self.strings_only = strings_only
+        self._decode = decode
+        self._fallback = lru_cache(maxsize=DECODE_CACHE_SIZE)(decode)
+
+    def __call__(self, value: Any) -> Any:
+        """Return the decoded value."""
+        try:
+            return self.table[value]
+        except KeyError:
+            if self.strings_only and not isinstance(value, str):
+                return value
+            return self._fallback(value)
+        except TypeError:
+            # unhashable value, ex: a list of alerts
+            return self._decode(value)
+
+
+# decoders shared by the entities of the appliances of the same model
+_DECODERS: dict[tuple, ValueDecoder] = {}
+
+
+def shared_decoder(
+    key: tuple,
+    decode: Callable[[Any], Any],
+    values: Iterable[Any],
+    strings_only: bool = False,
+) -> ValueDecoder:
+    """Return the decoder identified by the key, building it if needed."""
+    if (decoder := _DECODERS.get(key)) is None:
+        decoder = _DECODERS[key] = ValueDecoder(decode, values, strings_only)
+    return decoder
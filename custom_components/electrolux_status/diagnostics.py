@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import attr
@@ -12,7 +13,8 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from .const import DOMAIN
+from .api import Appliances
+from .const import CONF_DIAGNOSTICS_LIVE, DOMAIN
 from .coordinator import ElectroluxCoordinator
 
 REDACT_CONFIG = {}
@@ -51,24 +53,80 @@ async def _async_get_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     app_entry: ElectroluxCoordinator = hass.data[DOMAIN][entry.entry_id]
-    user_metadata = await app_entry.api.get_user_metadata()
-    appliances_list = await app_entry.api.get_appliances_list()
-    appliances_info = await app_entry.api.get_appliances_info(
-        [x["applianceId"] for x in appliances_list]
+    # the cached data is served while the cloud is unreachable
+    if entry.data.get(CONF_DIAGNOSTICS_LIVE, False) and not app_entry.breaker.stale:
+        data = await _async_get_live_data(app_entry)
+    else:
+        data = _async_get_cached_data(app_entry)
+    data.update(
+        breaker=app_entry.breaker.as_dict(),
+        statistics=app_entry.stats.as_dict(),
+        ingest=app_entry.ingest.as_dict(),
+        recent_payloads=app_entry.payloads.as_dict(),
+    )
+    return async_redact_data(data, REDACT_CONFIG)
+
+
+async def _async_get_live_data(app_entry: ElectroluxCoordinator) -> dict[str, Any]:
+    """Fetch the account and the appliances from the API.
+
+    The calls run concurrently, within the limit of concurrent calls of the API.
+    """
+    api = app_entry.api
+    user_metadata, appliances_list = await asyncio.gather(
+        api.get_user_metadata(), api.get_appliances_list()
+    )
+    appliance_ids = [x["applianceId"] for x in appliances_list]
+    appliances_info, *details = await asyncio.gather(
+        api.get_appliances_info(appliance_ids),
+        *(
+            asyncio.gather(
+                api.get_appliance_capabilities(appliance_id),
+                api.get_appliance_state(appliance_id),
+            )
+            for appliance_id in appliance_ids
+        ),
     )
-    data = {
+    return {
+        "mode": "live",
         "user_metadata": user_metadata,
         "appliances_info": appliances_info,
         "appliances_list": appliances_list,
+        "appliances_detail": {
+            appliance_id: {"capabilities": capabilities, "state": state}
+            for appliance_id, (capabilities, state) in zip(
+                appliance_ids, details, strict=True
+            )
+        },
+    }
+
+
+@callback
+def _async_get_cached_data(app_entry: ElectroluxCoordinator) -> dict[str, Any]:
+    """Return the appliances known to the coordinator, without calling the API."""
+    appliances: Appliances = app_entry.data["appliances"]
+    data: dict[str, Any] = {
+        "mode": "cached",
+        "appliances_info": [],
+        "appliances_list": [],
         "appliances_detail": {},
     }
-    for appliance in appliances_list:
-        appliance_id = appliance["applianceId"]
+    for appliance_id, appliance in appliances.get_appliances().items():
+        library_entity = appliance.data
+        data["appliances_list"].append(
+            {
+                "applianceId": appliance_id,
+                "applianceData": {"applianceName": appliance.name},
+                "connectionState": library_entity.status if library_entity else None,
+            }
+        )
+        if library_entity is not None and library_entity.appliance_info:
+            data["appliances_info"].append(library_entity.appliance_info)
         data["appliances_detail"][appliance_id] = {
-            "capabilities": await app_entry.api.get_appliance_capabilities(appliance_id),
-            "state": await app_entry.api.get_appliance_state(appliance_id),
+            "capabilities": library_entity.capabilities if library_entity else None,
+            "state": appliance.state,
         }
-    return async_redact_data(data, REDACT_CONFIG)
+    return data
 
 
 @callback
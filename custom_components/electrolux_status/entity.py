@@ -1,6 +1,8 @@
 """Entity platform for Electrolux Status."""
 
+from functools import partial
 import logging
+import time
 from typing import Any, cast
 
 from pyelectroluxocp import OneAppApi
@@ -8,15 +10,21 @@ from pyelectroluxocp.apiModels import ApplienceStatusResponse
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .decoding import ValueDecoder, shared_decoder
 from .model import ElectroluxDevice
+from .throttle import WriteThrottle
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# attribute holding the time of the last exchange with an unreachable cloud
+ATTR_STALE_SINCE = "stale_since"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -47,6 +55,9 @@ class ElectroluxEntity(CoordinatorEntity):
 
     appliance_status: ApplienceStatusResponse
 
+    # undeclared values other than strings are displayed as is
+    decode_strings_only = True
+
     def __init__(
         self,
         coordinator: Any,
@@ -70,11 +81,16 @@ class ElectroluxEntity(CoordinatorEntity):
         self.data = None
         self.coordinator = coordinator
         self._cached_value = None
+        self._decoder: ValueDecoder | None = None
         self._name = name
         self._icon = icon
         self._device_class = device_class
         self._entity_category = entity_category
         self._catalog_entry = catalog_entry
+        self._throttle: WriteThrottle | None = None
+        self._unsub_write: CALLBACK_TYPE | None = None
+        if catalog_entry and catalog_entry.write_policy:
+            self._throttle = WriteThrottle(catalog_entry.write_policy)
         self.api: OneAppApi = coordinator.api
         self.entity_name = entity_name
         self.entity_attr = entity_attr
@@ -127,8 +143,52 @@ class ElectroluxEntity(CoordinatorEntity):
         if self.coordinator.data is None:
             return
         appliances = self.coordinator.data.get("appliances", None)
-        self.appliance_status = appliances.get_appliance(self.pnc_id).state
+        if (appliance := appliances.get_appliance(self.pnc_id)) is None:
+            # removed from the account, the entity is being removed
+            return
+        self.appliance_status = appliance.state
+        if self._throttle is None:
+            self._write_state()
+            return
+        value = self.extract_value()
+        extra = (self.available, self.extra_state_attributes)
+        now = time.monotonic()
+        wait = self._throttle.check(value, now, extra)
+        if wait is None:
+            self.coordinator.stats.record_skipped_write(self.pnc_id)
+        elif wait > 0:
+            # the scheduled write checks the latest value again
+            if self._unsub_write is None:
+                self._unsub_write = async_call_later(
+                    self.hass, wait, self._async_write_throttled
+                )
+        else:
+            if self._unsub_write is not None:
+                self._unsub_write()
+                self._unsub_write = None
+            self._throttle.written(value, now, extra)
+            self._write_state()
+
+    @callback
+    def _async_write_throttled(self, _now: Any) -> None:
+        """Write the value held back by the minimum interval."""
+        self._unsub_write = None
+        self._handle_coordinator_update()
+
+    def _write_state(self) -> None:
+        """Write the state and record its duration."""
+        start = time.perf_counter()
         self.async_write_ha_state()
+        self.coordinator.stats.record_entity_write(
+            self.pnc_id, time.perf_counter() - start, self.json_path
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the scheduled write."""
+        await super().async_will_remove_from_hass()
+        if self._unsub_write is not None:
+            self._unsub_write()
+            self._unsub_write = None
 
     def get_connection_state(self) -> str | None:
         """Return connection state."""
@@ -239,6 +299,52 @@ class ElectroluxEntity(CoordinatorEntity):
         """Return matched catalog entry."""
         return self._catalog_entry
 
+    @staticmethod
+    def decode(catalog_entry: ElectroluxDevice | None, unit: str | None, value: Any) -> Any:
+        """Convert a raw value to the value displayed by the entity."""
+        return value
+
+    @property
+    def decoder(self) -> ValueDecoder:
+        """Return the decoder of the raw values.
+
+        Decoders are shared by the entities of the appliances of the same model.
+        """
+        if self._decoder is None:
+            values = list((self.capability or {}).get("values", None) or {})
+            if self.catalog_entry:
+                values.extend(self.catalog_entry.value_mapping)
+            self._decoder = shared_decoder(
+                (
+                    self.get_appliance.model,
+                    self.json_path,
+                    type(self).__name__,
+                    self.unit,
+                    tuple(values),
+                ),
+                partial(self.decode, self.catalog_entry, self.unit),
+                values,
+                self.decode_strings_only,
+            )
+        return self._decoder
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark the state as stale while the cloud is unreachable."""
+        breaker = self.coordinator.breaker
+        if not breaker.stale:
+            return None
+        return {
+            ATTR_STALE_SINCE: breaker.last_success.isoformat()
+            if breaker.last_success
+            else None
+        }
+
+    @property
+    def constraint(self) -> dict[str, Any]:
+        """Return the overrides of the capability applied by the program and triggers."""
+        return self.get_appliance.get_constraint(self.json_path)
+
     # @property
     # def extra_state_attributes(self) -> dict[str, Any]:
     #     """Return the state attributes of the sensor."""
@@ -0,0 +1,98 @@
+"""Ingest queue of the pushed deltas for Electrolux Status.
+
+The websocket callback only queues the deltas it receives, so that the socket
+reader is never stalled by the merge and the entity updates. A single consumer
+task takes all the pending deltas at once and processes them as a batch.
+
+The queue is bounded: when it is full the pending deltas of each appliance are
+compacted into one, the later value of a key replacing the earlier one as the
+merge into the reported state would. Deltas are only dropped when more
+appliances than the size of the queue have pending deltas.
+"""
+
+import asyncio
+from collections import deque
+import logging
+from typing import Any
+
+from .const import INGEST_QUEUE_SIZE
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class IngestQueue:
+    """Bounded queue of the deltas pushed for the appliances of an account."""
+
+    def __init__(self, size: int = INGEST_QUEUE_SIZE) -> None:
+        """Initialize an empty queue."""
+        self.size = size
+        # reception time, appliance id and delta
+        self.pending: deque[tuple[float, str, dict[str, Any]]] = deque()
+        self._event = asyncio.Event()
+        self.max_depth = 0
+        self.batches = 0
+        self.compactions = 0
+        # deltas merged into another one by the compactions
+        self.compacted = 0
+        self.dropped = 0
+
+    def put(self, appliance_id: str, delta: dict[str, Any], received: float) -> None:
+        """Queue a delta, compacting the pending ones if the queue is full."""
+        if len(self.pending) >= self.size:
+            self._compact()
+        if len(self.pending) >= self.size:
+            _, dropped_id, _ = self.pending.popleft()
+            self.dropped += 1
+            _LOGGER.warning(
+                "Electrolux ingest queue full, delta of %s dropped", dropped_id
+            )
+        self.pending.append((received, appliance_id, delta))
+        self.max_depth = max(self.max_depth, len(self.pending))
+        self._event.set()
+
+    def _compact(self) -> None:
+        """Merge the pending deltas of each appliance into one.
+
+        The merged delta keeps the reception time of the oldest one.
+        """
+        merged: dict[str, tuple[float, dict[str, Any]]] = {}
+        for received, appliance_id, delta in self.pending:
+            if (item := merged.get(appliance_id)) is None:
+                # the queued deltas are kept by the payload log, not modified
+                merged[appliance_id] = (received, dict(delta))
+            else:
+                item[1].update(delta)
+        count = len(self.pending)
+        self.pending = deque(
+            (received, appliance_id, delta)
+            for appliance_id, (received, delta) in merged.items()
+        )
+        self.compactions += 1
+        self.compacted += count - len(self.pending)
+        _LOGGER.debug(
+            "Electrolux ingest queue compacted from %d to %d deltas",
+            count,
+            len(self.pending),
+        )
+
+    async def get(self) -> list[tuple[float, str, dict[str, Any]]]:
+        """Wait for deltas and return all the pending ones, oldest first."""
+        while not self.pending:
+            self._event.clear()
+            await self._event.wait()
+        batch = list(self.pending)
+        self.pending.clear()
+        self.batches += 1
+        return batch
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the queue."""
+        return {
+            "size": self.size,
+            "depth": len(self.pending),
+            "max_depth": self.max_depth,
+            "batches": self.batches,
+            "compactions": self.compactions,
+            "compacted": self.compacted,
+            "dropped": self.dropped,
+        }
@@ -15,6 +15,23 @@ from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.const import EntityCategory, Platform
 
 
+@dataclass(frozen=True)
+class ElectroluxWritePolicy:
+    """Define when the state of an entity is written on updates of its value."""
+
+    # seconds between two writes, the last value is written once it elapses
+    min_interval: float = 0
+
+    # numeric changes smaller than this amount are not written
+    deadband: float = 0
+
+    # numeric changes smaller than this share of the last written value are not written
+    relative_deadband: float = 0
+
+    # write right away when the value changes class, between unknown, numeric and text
+    write_on_class_change: bool = True
+
+
 @dataclass
 class ElectroluxDevice:
     """Define class for main domain information."""
@@ -76,8 +93,53 @@ class ElectroluxDevice:
 
     entity_value_named: bool = False
 
+    # throttle the state writes of values changing often without meaning much
+    write_policy: ElectroluxWritePolicy | None = None
+
+
+@dataclass
+class ElectroluxAttributeFilter:
+    """Define model specific filters of the capabilities loaded as entities."""
+
+    # regex of attributes to ignore in addition to ATTRIBUTES_BLACKLIST
+    blacklist: list[str] = field(default_factory=list)
+
+    # regex of attributes to load even when blacklisted, in addition to ATTRIBUTES_WHITELIST
+    whitelist: list[str] = field(default_factory=list)
+
 
 class ElectroluxTokenStore(TypedDict):
     """Serialized exposed entities storage storage collection."""
 
     accounts: dict[str, UserToken]
+
+
+class ElectroluxEntityPlan(TypedDict):
+    """Description of the entities derived from one capability."""
+
+    capability: str
+    entity_type: Platform
+    entity_name: str
+    entity_attr: str
+    entity_source: str
+    sensor_name: str
+    capability_info: dict[str, Any]
+    unit: str | None
+    device_class: str | None
+    entity_category: EntityCategory | None
+    icon: str | None
+    # static attributes are not part of the capabilities returned by the API
+    static: bool
+
+
+class ElectroluxApplianceEntityPlans(TypedDict):
+    """Entity plans of one appliance and the key they were compiled for."""
+
+    key: str
+    plans: list[ElectroluxEntityPlan]
+
+
+class ElectroluxEntityPlanStore(TypedDict):
+    """Serialized entity plans storage collection."""
+
+    appliances: dict[str, ElectroluxApplianceEntityPlans]
@@ -1,16 +1,18 @@
 """Number platform for Electrolux Status."""
 
 import logging
+from typing import Any
 
 from pyelectroluxocp import OneAppApi
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, NUMBER
+from .const import DOMAIN, NUMBER, SIGNAL_NEW_APPLIANCES
 from .entity import ElectroluxEntity
 from .util import time_minutes_to_seconds, time_seconds_to_minutes
 
@@ -24,17 +26,22 @@ async def async_setup_entry(
 ) -> None:
     """Configure number platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_appliances(appliances: Any) -> None:
+        entities = appliances.get_platform_entities(NUMBER)
+        _LOGGER.debug(
+            "Electrolux add %d NUMBER entities to registry", len(entities)
+        )
+        async_add_entities(entities)
+
     if appliances := coordinator.data.get("appliances", None):
-        for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == NUMBER
-            ]
-            _LOGGER.debug(
-                "Electrolux add %d NUMBER entities to registry for appliance %s",
-                len(entities),
-                appliance_id,
-            )
-            async_add_entities(entities)
+        async_add_appliances(appliances)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_NEW_APPLIANCES.format(entry.entry_id), async_add_appliances
+        )
+    )
 
 
 class ElectroluxNumber(ElectroluxEntity, NumberEntity):
@@ -54,9 +61,10 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
             value = self.extract_value()
 
         if not value:
-            value = self.capability.get("default", None)
+            constraint = self.constraint
+            value = constraint.get("default", self.capability.get("default", None))
             if value == "INVALID_OR_NOT_SET_TIME":
-                value = self.capability.get("min", None)
+                value = constraint.get("min", self.capability.get("min", None))
         if not value:
             return self._cached_value
         if isinstance(self.unit, UnitOfTemperature):
@@ -67,31 +75,35 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
         self._cached_value = value
         return value
 
+    def get_capability_value(self, key: str, default: float) -> float:
+        """Return a bound of the capability, overridden by the active triggers."""
+        value = self.constraint.get(key, self.capability.get(key, default))
+        if self.unit == UnitOfTime.SECONDS:
+            return time_seconds_to_minutes(value)
+        return value
+
     @property
     def native_max_value(self) -> float:
         """Return the max value."""
-        if self.unit == UnitOfTime.SECONDS:
-            return time_seconds_to_minutes(self.capability.get("max", 100))
-        return self.capability.get("max", 100)
+        return self.get_capability_value("max", 100)
 
     @property
     def native_min_value(self) -> float:
         """Return the max value."""
-        if self.unit == UnitOfTime.SECONDS:
-            return time_seconds_to_minutes(self.capability.get("min", 0))
-        return self.capability.get("min", 0)
+        return self.get_capability_value("min", 0)
 
     @property
     def native_step(self) -> float:
         """Return the max value."""
-        if self.unit == UnitOfTime.SECONDS:
-            return time_seconds_to_minutes(self.capability.get("step", 1))
-        return self.capability.get("step", 1)
+        return self.get_capability_value("step", 1)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         if self.unit == UnitOfTime.SECONDS:
             value = time_minutes_to_seconds(value)
+        value = self.get_appliance.validate_command(
+            self.json_path, value, self.capability
+        )
         client: OneAppApi = self.api
         if self.entity_source:
             command = {self.entity_source: {self.entity_attr: value}}
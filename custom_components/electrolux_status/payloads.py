@@ -0,0 +1,86 @@
+"""Recent raw payloads of the appliances for Electrolux Status.
+
+The documents fetched at setup and the deltas received from the websocket are
+kept by reference in a fixed-size ring buffer per appliance, so recording them
+costs a deque append. They are only serialized when dumped, to the diagnostics
+or to the debug log.
+"""
+
+from collections import deque
+import copy
+import json
+import logging
+import time
+from typing import Any
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# payloads kept for each appliance
+PAYLOAD_BUFFER_SIZE = 50
+
+PAYLOAD_LIST = "appliances_list"
+PAYLOAD_INFO = "appliances_info"
+PAYLOAD_STATE = "appliance_state"
+PAYLOAD_CAPABILITIES = "appliance_capabilities"
+PAYLOAD_DELTA = "delta"
+
+
+def _timestamp(value: float) -> str:
+    """Format a reception time."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(value)) + (
+        f".{int(value % 1 * 1000):03d}"
+    )
+
+
+class PayloadLog:
+    """Ring buffers of the recent payloads of each appliance."""
+
+    def __init__(self, size: int = PAYLOAD_BUFFER_SIZE) -> None:
+        """Initialize empty buffers."""
+        self.size = size
+        self.appliances: dict[str, deque[tuple[float, str, Any]]] = {}
+
+    def record(self, appliance_id: str, kind: str, payload: Any) -> None:
+        """Keep a payload received for an appliance.
+
+        The payload is kept by reference, it must not be modified afterwards.
+        """
+        if (buffer := self.appliances.get(appliance_id)) is None:
+            buffer = self.appliances[appliance_id] = deque(maxlen=self.size)
+        buffer.append((time.time(), kind, payload))
+
+    def record_state(self, appliance_id: str, state: Any) -> None:
+        """Keep a copy of a state document, which is updated in place by the deltas."""
+        self.record(appliance_id, PAYLOAD_STATE, copy.deepcopy(state))
+
+    def as_dict(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the payloads of each appliance, oldest first."""
+        return {
+            appliance_id: [
+                {"time": _timestamp(received), "kind": kind, "payload": payload}
+                for received, kind, payload in buffer
+            ]
+            for appliance_id, buffer in self.appliances.items()
+        }
+
+    def log(self, appliance_id: str | None = None) -> int:
+        """Write the payloads of an appliance, or of all, to the debug log.
+
+        Return the number of payloads written.
+        """
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return 0
+        count = 0
+        for buffer_id, buffer in self.appliances.items():
+            if appliance_id is not None and buffer_id != appliance_id:
+                continue
+            for received, kind, payload in buffer:
+                _LOGGER.debug(
+                    "Electrolux %s payload of %s at %s: %s",
+                    kind,
+                    buffer_id,
+                    _timestamp(received),
+                    json.dumps(payload),
+                )
+                count += 1
+        return count
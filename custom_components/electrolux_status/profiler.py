@@ -0,0 +1,193 @@
+"""On-demand profiling of Electrolux Status.
+
+The cpu mode runs cProfile in the event loop for some seconds, so it covers the
+coordinator callbacks and the evaluation of the entity properties. The memory
+mode traces the allocations made during the same window with tracemalloc and
+measures the memory held by each appliance, entity class and capability
+document. Reports are written to the configuration directory.
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable
+import cProfile
+import gc
+import io
+import logging
+from pathlib import Path
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+PROFILE_CPU = "cpu"
+PROFILE_MEMORY = "memory"
+PROFILE_MODES = [PROFILE_CPU, PROFILE_MEMORY]
+# lines of the summary sent in the notification
+SUMMARY_LINES = 10
+# frames kept by tracemalloc for each allocation
+TRACEMALLOC_FRAMES = 5
+
+PACKAGE_PATH = str(Path(__file__).parent)
+# objects followed when measuring the memory held, besides those of this package
+DATA_TYPES = (dict, list, tuple, set, frozenset, str, bytes, int, float, bool)
+
+
+def _report_path(hass: HomeAssistant, mode: str, suffix: str) -> Path:
+    """Return the path of a new report."""
+    name = f"{DOMAIN}.{mode}.{time.strftime('%Y%m%d-%H%M%S')}{suffix}"
+    return Path(hass.config.path(name))
+
+
+def _write(path: Path, text: str) -> None:
+    """Write a report."""
+    path.write_text(text, encoding="utf-8")
+
+
+async def async_profile_cpu(hass: HomeAssistant, seconds: float) -> tuple[Path, str]:
+    """Profile the event loop, return the report path and a summary."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.disable()
+
+    path = _report_path(hass, PROFILE_CPU, ".prof")
+    await hass.async_add_executor_job(profiler.dump_stats, str(path))
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream).sort_stats("cumulative")
+    stats.print_stats(PACKAGE_PATH, 50)
+    await hass.async_add_executor_job(
+        _write, path.with_suffix(".txt"), stream.getvalue()
+    )
+
+    own = [
+        (function, stat[3])
+        for function, stat in stats.stats.items()  # type: ignore[attr-defined]
+        if function[0].startswith(PACKAGE_PATH)
+    ]
+    own.sort(key=lambda item: item[1], reverse=True)
+    summary = "\n".join(
+        f"{cumulative * 1000:.1f} ms {Path(filename).name}:{line}({name})"
+        for (filename, line, name), cumulative in own[:SUMMARY_LINES]
+    )
+    return path, summary
+
+
+def deep_size(objects: Iterable[Any], seen: set[int] | None = None) -> int:
+    """Return the memory held by objects and the data they reference.
+
+    Only plain data and objects of this package are followed. Objects whose ids
+    are in seen are skipped, and the ids of the measured objects are added to
+    it, so that shared data is only counted once.
+    """
+    if seen is None:
+        seen = set()
+    pending = list(objects)
+    size = 0
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if not isinstance(obj, DATA_TYPES) and not type(obj).__module__.startswith(
+            __package__
+        ):
+            continue
+        size += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return size
+
+
+def memory_usage(coordinators: Iterable[Any]) -> dict[str, dict[str, int]]:
+    """Return the memory held by the appliances, entity classes and documents.
+
+    The data an entity shares with its appliance is counted for the appliance.
+    """
+    coordinators = list(coordinators)
+    appliances = [
+        appliance
+        for coordinator in coordinators
+        for appliance in coordinator.data["appliances"].get_appliances().values()
+    ]
+    # shared objects, not attributed to an appliance or an entity
+    seen = {id(coordinator) for coordinator in coordinators}
+    seen.update(id(appliance) for appliance in appliances)
+    seen.update(id(appliance.entities) for appliance in appliances)
+
+    usage: dict[str, dict[str, int]] = {
+        "appliances": {},
+        "entity_classes": defaultdict(int),
+        "capabilities": {},
+    }
+    for appliance in appliances:
+        if appliance.data is not None and appliance.data.capabilities:
+            usage["capabilities"][appliance.pnc_id] = deep_size(
+                [appliance.data.capabilities], set(seen)
+            )
+        usage["appliances"][appliance.pnc_id] = deep_size([vars(appliance)], seen)
+    for appliance in appliances:
+        for entity in appliance.entities:
+            usage["entity_classes"][type(entity).__name__] += deep_size(
+                [vars(entity)], seen
+            )
+    usage["entity_classes"] = dict(usage["entity_classes"])
+    return usage
+
+
+async def async_profile_memory(
+    hass: HomeAssistant, coordinators: Iterable[Any], seconds: float
+) -> tuple[Path, str]:
+    """Trace the allocations and measure the memory held, return the report path and a summary."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    try:
+        before = tracemalloc.take_snapshot()
+        await asyncio.sleep(seconds)
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    package = [tracemalloc.Filter(True, f"{PACKAGE_PATH}/*")]
+    growth = after.filter_traces(package).compare_to(
+        before.filter_traces(package), "lineno"
+    )
+    usage = memory_usage(coordinators)
+
+    lines = ["Memory held", ""]
+    for section, sizes in usage.items():
+        lines.append(f"[{section}]")
+        lines.extend(
+            f"{size / 1024:10.1f} KiB {name}"
+            for name, size in sorted(sizes.items(), key=lambda item: -item[1])
+        )
+        lines.append("")
+    lines.extend([f"Allocations during {seconds} s", ""])
+    lines.extend(str(stat) for stat in growth[:50])
+
+    path = _report_path(hass, PROFILE_MEMORY, ".txt")
+    await hass.async_add_executor_job(_write, path, "\n".join(lines))
+
+    summary = [
+        f"{size / 1024:.1f} KiB appliance {name}"
+        for name, size in usage["appliances"].items()
+    ]
+    summary.extend(
+        f"{size / 1024:.1f} KiB {name}"
+        for name, size in sorted(
+            usage["entity_classes"].items(), key=lambda item: -item[1]
+        )
+    )
+    summary.extend(str(stat) for stat in growth[:3])
+    return path, "\n".join(summary[:SUMMARY_LINES])
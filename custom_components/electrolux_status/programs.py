@@ -0,0 +1,89 @@
+"""Program dependent capabilities for Electrolux Status.
+
+The values of a program capability (ex: "userSelections/programUID" on washers)
+define, for each program, the access, allowed values, bounds and defaults of the
+capabilities depending on it. They are indexed once so that the overrides of the
+selected program are available without walking the capability document.
+"""
+
+import logging
+from typing import Any
+
+from .triggers import state_value
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class ProgramIndex:
+    """Index of the capability overrides of each program of an appliance."""
+
+    def __init__(self, capabilities: dict[str, Any] | None) -> None:
+        """Build the index from the capabilities."""
+        # path of the program capability
+        self.source: str | None = None
+        # overrides by capability path, by program
+        self.programs: dict[str, dict[str, dict[str, Any]]] = {}
+        self.program: str | None = None
+        self._overrides: dict[str, dict[str, Any]] = {}
+
+        capabilities = capabilities or {}
+        for path, capability in capabilities.items():
+            if programs := self._programs(capabilities, capability):
+                self.source = path
+                self.programs = programs
+                _LOGGER.debug(
+                    "Electrolux indexed %d programs of %s", len(programs), path
+                )
+                break
+
+    @staticmethod
+    def _programs(
+        capabilities: dict[str, Any], capability: Any
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the overrides by program if the capability selects programs."""
+        if not isinstance(capability, dict) or not isinstance(
+            values := capability.get("values"), dict
+        ):
+            return {}
+        programs = {
+            program: {
+                path: overrides
+                for path, overrides in entry.items()
+                if isinstance(overrides, dict)
+                and state_value(capabilities, path) is not None
+            }
+            for program, entry in values.items()
+            if isinstance(entry, dict)
+        }
+        if not any(programs.values()):
+            return {}
+        return programs
+
+    def constraint(self, path: str) -> dict[str, Any]:
+        """Return the overrides applied to a capability by the selected program."""
+        return self._overrides.get(path, {})
+
+    def defaults(self, program: str | None = None) -> dict[str, Any]:
+        """Return the default values of the dependent capabilities of a program."""
+        return {
+            path: overrides["default"]
+            for path, overrides in self.programs.get(
+                program or self.program, {}
+            ).items()
+            if "default" in overrides
+        }
+
+    def update(self, reported_state: dict[str, Any]) -> set[str]:
+        """Select the overrides of the program reported in the state.
+
+        Return the capabilities whose overrides changed.
+        """
+        if self.source is None:
+            return set()
+        program = state_value(reported_state, self.source)
+        if program == self.program:
+            return set()
+        previous = self._overrides
+        self.program = program
+        self._overrides = self.programs.get(program, {})
+        return set(previous) | set(self._overrides)
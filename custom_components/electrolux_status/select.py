@@ -9,10 +9,11 @@ from pyelectroluxocp.oneAppApi import OneAppApi
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory, Platform, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, SELECT
+from .const import DOMAIN, SELECT, SIGNAL_NEW_APPLIANCES
 from .entity import ElectroluxEntity
 from .model import ElectroluxDevice
 
@@ -26,17 +27,22 @@ async def async_setup_entry(
 ) -> None:
     """Configure select platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_appliances(appliances: Any) -> None:
+        entities = appliances.get_platform_entities(SELECT)
+        _LOGGER.debug(
+            "Electrolux add %d SELECT entities to registry", len(entities)
+        )
+        async_add_entities(entities)
+
     if appliances := coordinator.data.get("appliances", None):
-        for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == SELECT
-            ]
-            _LOGGER.debug(
-                "Electrolux add %d SELECT entities to registry for appliance %s",
-                len(entities),
-                appliance_id,
-            )
-            async_add_entities(entities)
+        async_add_appliances(appliances)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_NEW_APPLIANCES.format(entry.entry_id), async_add_appliances
+        )
+    )
 
 
 class ElectroluxSelect(ElectroluxEntity, SelectEntity):
@@ -91,18 +97,33 @@ class ElectroluxSelect(ElectroluxEntity, SelectEntity):
         """Enitity domain for the entry. Used for consistent entity_id."""
         return SELECT
 
-    def format_label(self, value: str | None) -> str | None:
+    # every value is converted to a label
+    decode_strings_only = False
+
+    @staticmethod
+    def label(unit: str | None, value: Any) -> str | None:
         """Convert input to label string value."""
         if value is None:
             return None
         if isinstance(value, str):
             value = value.replace("_", " ").title()
-        if self.unit == UnitOfTemperature.CELSIUS:
+        if unit == UnitOfTemperature.CELSIUS:
             value = f"{value} °C"
-        elif self.unit == UnitOfTemperature.FAHRENHEIT:
+        elif unit == UnitOfTemperature.FAHRENHEIT:
             value = f"{value} °F"
         return str(value)
 
+    def format_label(self, value: str | None) -> str | None:
+        """Convert input to label string value."""
+        return self.label(self.unit, value)
+
+    @staticmethod
+    def decode(catalog_entry: ElectroluxDevice | None, unit: str | None, value: Any) -> Any:
+        """Convert a raw value to the label of the option."""
+        if catalog_entry and catalog_entry.value_mapping:
+            value = catalog_entry.value_mapping.get(value, value)
+        return ElectroluxSelect.label(unit, value)
+
     # @property
     # def icon(self) -> str:
     #     """Return a representative icon."""
@@ -118,27 +139,16 @@ class ElectroluxSelect(ElectroluxEntity, SelectEntity):
         if value is None:
             return self._cached_value
 
-        if self.catalog_entry and self.catalog_entry.value_mapping:
-            mapping = self.catalog_entry.value_mapping
-            _LOGGER.debug("Mapping %s: %s to %s", self.json_path, value, mapping)
-            if value in mapping:
-                value = mapping.get(value, value)
-
-        label = None
-        try:
-            label = list(self.options_list.keys())[
-                list(self.options_list.values()).index(value)
-            ]
-        except Exception as ex:  # noqa: BLE001
+        label = self.decoder(value)
+        # When value not in the catalog -> add the value to the list then
+        if label is not None and label not in self.options_list:
+            if self.catalog_entry and self.catalog_entry.value_mapping:
+                value = self.catalog_entry.value_mapping.get(value, value)
             _LOGGER.info(
-                "Electrolux error value %s does not exist in the list %s. %s",
+                "Electrolux value %s does not exist in the list %s",
                 value,
                 self.options_list.values(),
-                ex,
             )
-        # When value not in the catalog -> add the value to the list then
-        if label is None:
-            label = self.format_label(value)
             self.options_list[label] = value
         if label is not None:
             self._cached_value = label
@@ -160,6 +170,9 @@ class ElectroluxSelect(ElectroluxEntity, SelectEntity):
 
         if value is None:
             return
+        value = self.get_appliance.validate_command(
+            self.json_path, value, self.capability
+        )
 
         client: OneAppApi = self.api
         command: dict[str, Any] = {}
@@ -175,4 +188,16 @@ class ElectroluxSelect(ElectroluxEntity, SelectEntity):
     @property
     def options(self) -> list[str]:
         """Return a set of selectable options."""
-        return list(self.options_list.keys())
+        values: dict[str, Any] | None = self.constraint.get("values", None)
+        if values is None:
+            return list(self.options_list.keys())
+        # values allowed by the active triggers, the current option is kept for display
+        options = []
+        for label, value in self.options_list.items():
+            entry = values.get(value, None)
+            if label == self._cached_value or (
+                entry is not None
+                and not (isinstance(entry, dict) and entry.get("disabled", False))
+            ):
+                options.append(label)
+        return options
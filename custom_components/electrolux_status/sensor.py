@@ -1,21 +1,66 @@
 """Switch platform for Electrolux Status."""
 
 import contextlib
+from datetime import timedelta
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature, UnitOfTime, UnitOfVolume
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfTemperature,
+    UnitOfTime,
+    UnitOfVolume,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, SENSOR
+from .alerts import ATTR_ALERTS
+from .const import DOMAIN, NAME, SENSOR, SIGNAL_NEW_APPLIANCES
 from .entity import ElectroluxEntity
-from .util import create_notification
+from .model import ElectroluxDevice
+from .stats import (
+    API_CALLS,
+    API_ENDPOINTS,
+    API_LATENCY,
+    API_THROTTLED,
+    DELTAS_MERGED,
+    ENTITY_WRITES,
+    PUSH_MESSAGES,
+    STAGE_TOTAL,
+    TOKEN_REFRESHES,
+    WEBSOCKET_RECONNECTS,
+)
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# performance sensors are refreshed on this interval instead of on every update
+SCAN_INTERVAL = timedelta(seconds=60)
+
+# statistic, name, percentile of the histogram or None for a counter
+PERFORMANCE_SENSORS: list[tuple[str, str, int | None]] = [
+    (PUSH_MESSAGES, "Push messages", None),
+    (DELTAS_MERGED, "Deltas merged", None),
+    (ENTITY_WRITES, "Entity writes", None),
+    (API_CALLS, "API calls", None),
+    (API_THROTTLED, "API throttled calls", None),
+    (API_LATENCY, "API latency p95", 95),
+    (f"push_{STAGE_TOTAL}", "Push latency p95", 95),
+]
+# performance sensors of the account, on a device of its own
+ACCOUNT_SENSORS: list[tuple[str, str, int | None]] = [
+    (API_THROTTLED, "API throttled calls", None),
+    (TOKEN_REFRESHES, "Token refreshes", None),
+    (WEBSOCKET_RECONNECTS, "Websocket reconnects", None),
+    *(
+        (f"{API_LATENCY}.{endpoint}", f"API latency p95 {endpoint}", 95)
+        for endpoint in API_ENDPOINTS
+    ),
+]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,22 +69,43 @@ async def async_setup_entry(
 ) -> None:
     """Configure sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    if appliances := coordinator.data.get("appliances", None):
-        for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == SENSOR
+
+    @callback
+    def async_add_appliances(appliances: Any) -> None:
+        entities = appliances.get_platform_entities(SENSOR)
+        _LOGGER.debug("Electrolux add %d SENSOR entities to registry", len(entities))
+        async_add_entities(
+            [
+                *entities,
+                *(
+                    ElectroluxPerformanceSensor(
+                        coordinator, entry, appliance_id, *sensor
+                    )
+                    for appliance_id in appliances.get_appliance_ids()
+                    for sensor in PERFORMANCE_SENSORS
+                ),
             ]
-            _LOGGER.debug(
-                "Electrolux add %d SENSOR entities to registry for appliance %s",
-                len(entities),
-                appliance_id,
-            )
-            async_add_entities(entities)
+        )
+
+    async_add_entities(
+        ElectroluxPerformanceSensor(coordinator, entry, None, *sensor)
+        for sensor in ACCOUNT_SENSORS
+    )
+    if appliances := coordinator.data.get("appliances", None):
+        async_add_appliances(appliances)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_NEW_APPLIANCES.format(entry.entry_id), async_add_appliances
+        )
+    )
 
 
 class ElectroluxSensor(ElectroluxEntity, SensorEntity):
     """Electrolux Status Sensor class."""
 
+    # the state of every alert code is recorded by the optional alert binary sensors
+    _unrecorded_attributes = frozenset({ATTR_ALERTS})
+
     @property
     def entity_domain(self):
         """Enitity domain for the entry. Used for consistent entity_id."""
@@ -58,6 +124,17 @@ class ElectroluxSensor(ElectroluxEntity, SensorEntity):
             return 0
         return None
 
+    @staticmethod
+    def decode(catalog_entry: ElectroluxDevice | None, unit: str | None, value: Any) -> Any:
+        """Convert a raw value to the value displayed by the sensor."""
+        if catalog_entry and catalog_entry.value_mapping:
+            # Electrolux presents as string but returns an int
+            # the mapping entry allows us to correctly display this to the frontend
+            value = catalog_entry.value_mapping.get(value, value)
+        if isinstance(value, str):
+            value = value.replace("_", " ").title()
+        return value
+
     @property
     def native_value(self) -> str | int | float:
         """Return the state of the sensor."""
@@ -69,18 +146,8 @@ class ElectroluxSensor(ElectroluxEntity, SensorEntity):
         elif value is not None and isinstance(self.unit, UnitOfTime):
             # Electrolux bug - prevent negative/disabled timers
             value = max(value, 0)
-        if self.catalog_entry and self.catalog_entry.value_mapping:
-            # Electrolux presents as string but returns an int
-            # the mapping entry allows us to correctly display this to the frontend
-            mapping = self.catalog_entry.value_mapping
-            _LOGGER.debug("Mapping %s: %s to %s", self.json_path, value, mapping)
-            if value in mapping:
-                value = mapping.get(value, value)
-        if isinstance(value, str):
-            if "_" in value:
-                value = value.replace("_", " ")
-            value = value.title()
         if value is not None:
+            value = self.decoder(value)
             self._cached_value = value
         else:
             value = self._cached_value
@@ -106,23 +173,74 @@ class ElectroluxSensor(ElectroluxEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the sensor."""
+        attributes = super().extra_state_attributes or {}
         if self.entity_attr == "alerts":
-            alert_types = self.capability.get("values", {})
-            # default is nullable - set a value for display to user
-            alert_types = {key: "OFF" for key in alert_types}
-            if current_alerts := self.extract_value():
-                for alert in current_alerts:
-                    name = alert.get("code", "Unknown")
-                    severity = alert.get("severity", "Alert")
-                    status = alert.get("acknowledgeStatus", "")
-                    alert_types[name] = f"{severity}-{status}"
-                    create_notification(
-                        self.hass,
-                        self.config_entry,
-                        alert_name=name,
-                        alert_severity=severity,
-                        alert_status=status,
-                        title=self.name,
-                    )
-            return alert_types
-        return {}
+            attributes[ATTR_ALERTS] = self.get_appliance.alerts.attributes(
+                self.json_path
+            )
+        return attributes
+
+
+class ElectroluxPerformanceSensor(SensorEntity):
+    """Runtime statistic of an appliance or of the account, disabled by default."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:chart-line"
+
+    def __init__(
+        self,
+        coordinator: Any,
+        config_entry: ConfigEntry,
+        pnc_id: str | None,
+        statistic: str,
+        name: str,
+        percentile: int | None,
+    ) -> None:
+        """Initialize the sensor, of the account if pnc_id is None."""
+        self.coordinator = coordinator
+        self.pnc_id = pnc_id
+        self.statistic = statistic
+        self.percentile = percentile
+        self._attr_name = name
+        self._attr_unique_id = f"{config_entry.entry_id}-stats-{statistic}"
+        if pnc_id is not None:
+            self._attr_unique_id += f"-{pnc_id}"
+        if percentile is None:
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        else:
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+            self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+            self._attr_suggested_display_precision = 0
+        if pnc_id is None:
+            self._attr_device_info = {
+                "identifiers": {(DOMAIN, config_entry.entry_id)},
+                "name": f"{NAME} {config_entry.title}",
+                "manufacturer": "Electrolux",
+                "entry_type": DeviceEntryType.SERVICE,
+            }
+            return
+        appliance = coordinator.data["appliances"].get_appliance(pnc_id)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, appliance.name)},
+            "name": appliance.name,
+            "model": appliance.model,
+            "manufacturer": appliance.brand,
+        }
+
+    @property
+    def native_value(self) -> int | float | None:
+        """Return the value of the statistic."""
+        if self.pnc_id is None:
+            stats = self.coordinator.stats
+        elif self.coordinator.data["appliances"].get_appliance(self.pnc_id) is None:
+            # removed from the account, the sensor is being removed
+            return None
+        else:
+            stats = self.coordinator.stats.appliance(self.pnc_id)
+        if self.percentile is None:
+            return stats.counters[self.statistic]
+        if histogram := stats.histogram(self.statistic):
+            return histogram.percentile(self.percentile) * 1000
+        return None
@@ -0,0 +1,159 @@
+"""Services of the Electrolux Status integration."""
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.components.persistent_notification import async_create
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .capture import (
+    async_replay_capture,
+    capture_directory,
+    captures_path,
+    read_capture,
+)
+from .commands import async_send_commands
+from .const import (
+    DOMAIN,
+    NAME,
+    SERVICE_LOG_PAYLOADS,
+    SERVICE_PROFILE,
+    SERVICE_REPLAY_CAPTURE,
+    SERVICE_SEND_COMMANDS,
+)
+from .coordinator import loaded_coordinators
+from .profiler import (
+    PROFILE_CPU,
+    PROFILE_MODES,
+    async_profile_cpu,
+    async_profile_memory,
+)
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+REPLAY_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required("capture"): cv.string,
+        vol.Optional("speed", default=1.0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("mode", default=PROFILE_CPU): vol.In(PROFILE_MODES),
+        vol.Optional("seconds", default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
+LOG_PAYLOADS_SCHEMA = vol.Schema({vol.Optional("appliance_id"): cv.string})
+
+SEND_COMMANDS_SCHEMA = vol.Schema(
+    {
+        vol.Required("commands"): vol.All(
+            cv.ensure_list,
+            vol.Length(min=1),
+            [
+                vol.Schema(
+                    {
+                        vol.Required("appliance_id"): cv.string,
+                        vol.Required("path"): cv.string,
+                        vol.Required("value"): vol.Any(bool, int, float, str),
+                    }
+                )
+            ],
+        ),
+    }
+)
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def replay_capture(call: ServiceCall) -> None:
+        """Feed a capture of the push stream back through the coordinators."""
+        # the capture name must not escape the captures directory
+        directory = await hass.async_add_executor_job(
+            capture_directory, captures_path(hass), call.data["capture"]
+        )
+        if directory is None:
+            raise ServiceValidationError(f"Unknown capture {call.data['capture']}")
+        deltas = await hass.async_add_executor_job(read_capture, directory)
+        coordinators = loaded_coordinators(hass)
+
+        async def replay() -> None:
+            """Replay the capture, which may last as long as it was recorded."""
+            count = await async_replay_capture(
+                coordinators, deltas, call.data["speed"]
+            )
+            _LOGGER.debug(
+                "Electrolux replayed %d deltas of %s", count, call.data["capture"]
+            )
+
+        hass.async_create_background_task(
+            replay(), f"Electrolux replay of {call.data['capture']}"
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REPLAY_CAPTURE, replay_capture, schema=REPLAY_CAPTURE_SCHEMA
+    )
+
+    async def profile(call: ServiceCall) -> None:
+        """Profile the integration, report the summary in a notification."""
+        mode, seconds = call.data["mode"], call.data["seconds"]
+        _LOGGER.debug("Electrolux profiling %s for %s s", mode, seconds)
+        if mode == PROFILE_CPU:
+            path, summary = await async_profile_cpu(hass, seconds)
+        else:
+            path, summary = await async_profile_memory(
+                hass, loaded_coordinators(hass), seconds
+            )
+        async_create(
+            hass,
+            f"Report written to {path}\n\n```\n{summary}\n```",
+            title=f"{NAME} {mode} profile",
+            notification_id=f"{DOMAIN}_{SERVICE_PROFILE}",
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, profile, schema=PROFILE_SCHEMA
+    )
+
+    async def log_payloads(call: ServiceCall) -> None:
+        """Write the recent raw payloads to the debug log."""
+        count = sum(
+            coordinator.payloads.log(call.data.get("appliance_id"))
+            for coordinator in loaded_coordinators(hass)
+        )
+        if not count:
+            _LOGGER.info(
+                "Electrolux no payload logged, the debug log may not be enabled"
+            )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_LOG_PAYLOADS, log_payloads, schema=LOG_PAYLOADS_SCHEMA
+    )
+
+    async def send_commands(call: ServiceCall) -> ServiceResponse:
+        """Send commands to several appliances at once."""
+        results = await async_send_commands(hass, call.data["commands"])
+        return {"results": results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_COMMANDS,
+        send_commands,
+        schema=SEND_COMMANDS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
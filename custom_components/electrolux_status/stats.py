@@ -0,0 +1,309 @@
+"""Runtime performance counters for Electrolux Status.
+
+Counters and duration histograms are kept per account (coordinator) and per
+appliance. Recording is a dictionary increment or a deque append, percentiles
+are only computed when they are read.
+"""
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Callable, Iterable
+import functools
+import logging
+import math
+import time
+from typing import Any
+
+from aiohttp import ClientResponseError
+
+from .breaker import ESSENTIAL_ENDPOINTS, CircuitBreaker, CircuitOpenError, is_outage
+from .const import DEFAULT_API_CONCURRENCY, DEFAULT_SLOW_UPDATE_BUDGET
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# durations kept by each histogram
+HISTOGRAM_SIZE = 1000
+PERCENTILES = (50, 95, 99)
+
+# OneAppApi methods whose calls and latencies are recorded
+API_ENDPOINTS = (
+    "execute_appliance_command",
+    "get_appliance_capabilities",
+    "get_appliance_state",
+    "get_appliances_info",
+    "get_appliances_list",
+    "get_user_metadata",
+    "get_user_token",
+)
+
+# counters of the account
+PUSH_MESSAGES = "push_messages"
+DELTAS_MERGED = "deltas_merged"
+ENTITY_WRITES = "entity_writes"
+ENTITY_WRITES_SKIPPED = "entity_writes_skipped"
+API_CALLS = "api_calls"
+API_THROTTLED = "api_throttled"
+API_SKIPPED = "api_skipped"
+TOKEN_REFRESHES = "token_refreshes"
+WEBSOCKET_RECONNECTS = "websocket_reconnects"
+# histograms of the account
+API_LATENCY = "api_latency"
+
+# stages of a pushed delta, timed per appliance
+STAGE_MERGE = "merge"
+STAGE_FANOUT = "fanout"
+STAGE_WRITE = "write"
+STAGE_TOTAL = "total"
+
+
+class Histogram:
+    """Rolling window of durations, in seconds."""
+
+    def __init__(self, size: int = HISTOGRAM_SIZE) -> None:
+        """Initialize an empty histogram."""
+        self.samples: deque[float] = deque(maxlen=size)
+        self.count = 0
+        self.total = 0.0
+        self._sorted: list[float] | None = None
+
+    def add(self, value: float) -> None:
+        """Record a duration."""
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        self._sorted = None
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a percentile of the window, in seconds."""
+        if not self.samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self.samples)
+        # nearest rank
+        index = math.ceil(len(self._sorted) * percent / 100) - 1
+        return self._sorted[min(max(index, 0), len(self._sorted) - 1)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the summary of the histogram, durations in milliseconds."""
+        summary: dict[str, Any] = {"count": self.count}
+        if self.count:
+            summary["mean_ms"] = round(self.total / self.count * 1000, 3)
+        for percent in PERCENTILES:
+            if (value := self.percentile(percent)) is not None:
+                summary[f"p{percent}_ms"] = round(value * 1000, 3)
+        return summary
+
+
+class ElectroluxStats:
+    """Counters and histograms of an account or an appliance."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.counters: Counter[str] = Counter()
+        self.histograms: dict[str, Histogram] = {}
+        self.started = time.time()
+
+    def increment(self, name: str, count: int = 1) -> None:
+        """Increment a counter."""
+        self.counters[name] += count
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a duration in a histogram."""
+        if (histogram := self.histograms.get(name)) is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(value)
+
+    def histogram(self, name: str) -> Histogram | None:
+        """Return a histogram, if any duration was recorded."""
+        return self.histograms.get(name)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics."""
+        return {
+            "since": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "counters": dict(sorted(self.counters.items())),
+            "histograms": {
+                name: histogram.as_dict()
+                for name, histogram in sorted(self.histograms.items())
+            },
+        }
+
+
+class CoordinatorStats(ElectroluxStats):
+    """Statistics of an account and of its appliances."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        super().__init__()
+        self.appliances: dict[str, ElectroluxStats] = {}
+        # stage durations above this budget are logged, in seconds
+        self.slow_budget = DEFAULT_SLOW_UPDATE_BUDGET / 1000
+
+    def appliance(self, appliance_id: str) -> ElectroluxStats:
+        """Return the statistics of an appliance."""
+        if (stats := self.appliances.get(appliance_id)) is None:
+            stats = self.appliances[appliance_id] = ElectroluxStats()
+        return stats
+
+    def record_push(self, data: dict[str, dict[str, Any]]) -> None:
+        """Record a message received from the websocket."""
+        self.increment(PUSH_MESSAGES)
+        for appliance_id, delta in data.items():
+            stats = self.appliance(appliance_id)
+            stats.increment(PUSH_MESSAGES)
+            stats.increment(DELTAS_MERGED, len(delta))
+            self.increment(DELTAS_MERGED, len(delta))
+
+    def record_entity_write(
+        self, appliance_id: str, duration: float, path: str | None = None
+    ) -> None:
+        """Record the state write of an entity."""
+        self.increment(ENTITY_WRITES)
+        self.appliance(appliance_id).increment(ENTITY_WRITES)
+        self.record_stage(appliance_id, STAGE_WRITE, duration, path)
+
+    def record_skipped_write(self, appliance_id: str) -> None:
+        """Record a state write skipped by the write policy of an entity."""
+        self.increment(ENTITY_WRITES_SKIPPED)
+        self.appliance(appliance_id).increment(ENTITY_WRITES_SKIPPED)
+
+    def record_stage(
+        self,
+        appliance_id: str,
+        stage: str,
+        duration: float,
+        paths: str | Iterable[str] | None = None,
+    ) -> None:
+        """Record the duration of a stage of a pushed delta, log it when slow."""
+        self.appliance(appliance_id).observe(f"push_{stage}", duration)
+        if duration > self.slow_budget:
+            if paths is not None and not isinstance(paths, str):
+                paths = ", ".join(paths)
+            _LOGGER.warning(
+                "Electrolux slow %s stage for appliance %s (%s): %.1f ms",
+                stage,
+                appliance_id,
+                paths,
+                duration * 1000,
+            )
+
+    def record_api_call(
+        self,
+        endpoint: str,
+        appliance_id: str | None,
+        duration: float,
+        throttled: bool = False,
+    ) -> None:
+        """Record a call to the API."""
+        targets = [self]
+        if appliance_id is not None:
+            targets.append(self.appliance(appliance_id))
+        for stats in targets:
+            stats.increment(API_CALLS)
+            stats.observe(API_LATENCY, duration)
+            if throttled:
+                stats.increment(API_THROTTLED)
+        self.increment(f"{API_CALLS}.{endpoint}")
+        self.observe(f"{API_LATENCY}.{endpoint}", duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of the account and of the appliances."""
+        return {
+            **super().as_dict(),
+            "appliances": {
+                appliance_id: stats.as_dict()
+                for appliance_id, stats in self.appliances.items()
+            },
+        }
+
+
+class InstrumentedApi:
+    """Proxy of OneAppApi recording the calls to the API endpoints.
+
+    The calls to the endpoints share a limit of concurrent calls, so that
+    concurrent callers of an account do not flood the API, and go through the
+    circuit breaker of the account when given. Other attributes are read from
+    and written to the client.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        stats: CoordinatorStats,
+        concurrency: int = DEFAULT_API_CONCURRENCY,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Wrap the client."""
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_stats", stats)
+        object.__setattr__(self, "_endpoints", {})
+        object.__setattr__(self, "_limit", asyncio.Semaphore(concurrency))
+        object.__setattr__(self, "_breaker", breaker)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the attribute of the client, timed for the API endpoints."""
+        if name not in API_ENDPOINTS:
+            return getattr(self._client, name)
+        if (endpoint := self._endpoints.get(name)) is None:
+            endpoint = self._endpoints[name] = self._instrument(
+                name, getattr(self._client, name)
+            )
+        return endpoint
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set the attribute of the client."""
+        setattr(self._client, name, value)
+
+    def _instrument(self, name: str, method: Callable) -> Callable:
+        """Wrap an endpoint to record its calls."""
+        stats = self._stats
+        limit = self._limit
+        # the essential calls bypass the breaker, they do not probe the cloud:
+        # the token may be served from the cache of the client
+        breaker = None if name in ESSENTIAL_ENDPOINTS else self._breaker
+
+        @functools.wraps(method)
+        async def endpoint(*args, **kwargs):
+            # the endpoints of an appliance take its id first
+            appliance_id = args[0] if args and isinstance(args[0], str) else None
+            if breaker is not None and not breaker.allow():
+                stats.increment(API_SKIPPED)
+                raise CircuitOpenError(f"Electrolux cloud unreachable, {name} skipped")
+            # a call let through an open breaker is its probe. Nothing is awaited
+            # before the try, which ends the probe however the call ends.
+            probe = breaker is not None and breaker.stale
+            try:
+                async with limit:
+                    throttled = False
+                    start = time.monotonic()
+                    try:
+                        result = await method(*args, **kwargs)
+                    except Exception as ex:
+                        throttled = (
+                            isinstance(ex, ClientResponseError) and ex.status == 429
+                        )
+                        raise
+                    finally:
+                        stats.record_api_call(
+                            name, appliance_id, time.monotonic() - start, throttled
+                        )
+            except Exception as ex:
+                if breaker is not None:
+                    if is_outage(ex):
+                        breaker.record_failure()
+                    elif isinstance(ex, ClientResponseError):
+                        # the cloud answered
+                        breaker.record_success()
+                    elif probe:
+                        breaker.release()
+                raise
+            except BaseException:
+                # cancelled, also while waiting for the limit
+                if probe:
+                    breaker.release()
+                raise
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+        return endpoint
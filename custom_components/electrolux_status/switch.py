@@ -7,11 +7,13 @@ from pyelectroluxocp import OneAppApi
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, SWITCH
+from .const import DOMAIN, SIGNAL_NEW_APPLIANCES, SWITCH
 from .entity import ElectroluxEntity
+from .model import ElectroluxDevice
 from .util import string_to_boolean
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
@@ -24,17 +26,22 @@ async def async_setup_entry(
 ) -> None:
     """Configure switch platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def async_add_appliances(appliances: Any) -> None:
+        entities = appliances.get_platform_entities(SWITCH)
+        _LOGGER.debug(
+            "Electrolux add %d SWITCH entities to registry", len(entities)
+        )
+        async_add_entities(entities)
+
     if appliances := coordinator.data.get("appliances", None):
-        for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == SWITCH
-            ]
-            _LOGGER.debug(
-                "Electrolux add %d SENSOR entities to registry for appliance %s",
-                len(entities),
-                appliance_id,
-            )
-            async_add_entities(entities)
+        async_add_appliances(appliances)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_NEW_APPLIANCES.format(entry.entry_id), async_add_appliances
+        )
+    )
 
 
 class ElectroluxSwitch(ElectroluxEntity, SwitchEntity):
@@ -45,6 +52,14 @@ class ElectroluxSwitch(ElectroluxEntity, SwitchEntity):
         """Enitity domain for the entry. Used for consistent entity_id."""
         return SWITCH
 
+    @staticmethod
+    def decode(catalog_entry: ElectroluxDevice | None, unit: str | None, value: Any) -> Any:
+        """Convert a raw value to the state of the switch."""
+        # Electrolux returns strings for some true/false states
+        if isinstance(value, str):
+            return string_to_boolean(value, False)
+        return value
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary_sensor is on."""
@@ -54,12 +69,10 @@ class ElectroluxSwitch(ElectroluxEntity, SwitchEntity):
             if self.catalog_entry and self.catalog_entry.state_mapping:
                 mapping = self.catalog_entry.state_mapping
                 value = self.get_state_attr(mapping)
-        # Electrolux returns strings for some true/false states
-        if value is not None and isinstance(value, str):
-            value = string_to_boolean(value, False)
 
         if value is None:
             return self._cached_value
+        value = self.decoder(value)
         self._cached_value = value
         return value
 
@@ -69,6 +82,9 @@ class ElectroluxSwitch(ElectroluxEntity, SwitchEntity):
         # Electrolux bug - needs string not bool
         if "values" in self.capability:
             value = "ON" if value else "OFF"
+        value = self.get_appliance.validate_command(
+            self.json_path, value, self.capability
+        )
 
         if self.entity_source:
             command = {self.entity_source: {self.entity_attr: value}}
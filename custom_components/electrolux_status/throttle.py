@@ -0,0 +1,61 @@
+"""State write throttling for Electrolux Status."""
+
+from typing import Any
+
+from .model import ElectroluxWritePolicy
+
+# nothing written yet
+_UNSET = object()
+
+
+def _value_class(value: Any) -> str:
+    """Return the class of a value: unknown, numeric or text."""
+    if value is None:
+        return "unknown"
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return "numeric"
+    return "text"
+
+
+class WriteThrottle:
+    """Apply the write policy of an entity to the updates of its value."""
+
+    def __init__(self, policy: ElectroluxWritePolicy) -> None:
+        """Initialize the throttle, the first value is always written."""
+        self.policy = policy
+        self.value: Any = _UNSET
+        # availability and attributes written with the value
+        self.extra: Any = None
+        self.written_at = 0.0
+
+    def check(self, value: Any, now: float, extra: Any = None) -> float | None:
+        """Return 0 to write the value now, None to skip it.
+
+        A positive result is the delay before the minimum interval allows the
+        value to be written. Only the value is throttled: a change of the extra
+        state (availability, attributes) is written right away.
+        """
+        policy = self.policy
+        if self.value is _UNSET or extra != self.extra:
+            return 0
+        if policy.write_on_class_change and _value_class(value) != _value_class(
+            self.value
+        ):
+            return 0
+        if value == self.value:
+            return None
+        if _value_class(value) == "numeric" and _value_class(self.value) == "numeric":
+            change = abs(value - self.value)
+            if change < policy.deadband:
+                return None
+            if change < policy.relative_deadband * abs(self.value):
+                return None
+        if (wait := self.written_at + policy.min_interval - now) > 0:
+            return wait
+        return 0
+
+    def written(self, value: Any, now: float, extra: Any = None) -> None:
+        """Record a written value."""
+        self.value = value
+        self.extra = extra
+        self.written_at = now
@@ -0,0 +1,256 @@
+"""Capability triggers for Electrolux Status.
+
+Capabilities may define triggers: when the condition on the appliance state is met,
+the action overrides the definition (access, values, disabled, default...) of other
+capabilities. The cloud applies them on its side, they are evaluated here as well so
+the entities can follow without waiting for the cloud to echo the consequences.
+
+ex: "applianceState" RUNNING only allows the PAUSE value of "executeCommand"
+"""
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+import logging
+import operator
+import re
+from typing import Any
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# operand referring to the value of the capability owning the trigger
+VALUE_OPERAND = "value"
+# action target referring to the capability owning the trigger
+SELF_TARGET = "$self"
+# access override restoring the access defined by the capability
+DEFAULT_ACCESS = "default"
+
+Condition = Callable[[Callable[[str], Any]], bool]
+
+NUMBER_PREFIX = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def _ordinal(value: Any) -> float | None:
+    """Return the number used to order a value.
+
+    ex: 40 for "40_CELSIUS", None for "COLD"
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int | float):
+        return value
+    if isinstance(value, str) and (match := NUMBER_PREFIX.match(value)):
+        return float(match.group())
+    return None
+
+
+def _ordered(compare: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    """Build an ordering operator that is False for values that cannot be ordered."""
+
+    def ordered(left: Any, right: Any) -> bool:
+        left, right = _ordinal(left), _ordinal(right)
+        if left is None or right is None:
+            return False
+        return compare(left, right)
+
+    return ordered
+
+
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": _ordered(operator.lt),
+    "le": _ordered(operator.le),
+    "gt": _ordered(operator.gt),
+    "ge": _ordered(operator.ge),
+}
+
+
+def compile_condition(node: dict[str, Any], source: str) -> tuple[Condition, set[str]]:
+    """Compile a trigger condition.
+
+    Return the condition and the state paths it depends on.
+    """
+    operator_name = node.get("operator")
+    if operator_name in ("and", "or"):
+        left, left_paths = compile_condition(node["operand_1"], source)
+        right, right_paths = compile_condition(node["operand_2"], source)
+        if operator_name == "and":
+
+            def condition(get: Callable[[str], Any]) -> bool:
+                return left(get) and right(get)
+
+        else:
+
+            def condition(get: Callable[[str], Any]) -> bool:
+                return left(get) or right(get)
+
+        return condition, left_paths | right_paths
+
+    if (compare := OPERATORS.get(operator_name)) is None:
+        raise ValueError(f"Unsupported trigger operator: {operator_name}")
+
+    path = node["operand_1"]
+    if path == VALUE_OPERAND:
+        path = source
+    expected = node.get("operand_2")
+
+    def comparison(get: Callable[[str], Any]) -> bool:
+        return compare(get(path), expected)
+
+    return comparison, {path}
+
+
+def state_value(reported_state: dict[str, Any], path: str) -> Any:
+    """Return the value of a path in the reported state."""
+    if path in reported_state:
+        return reported_state[path]
+    source, _, attr = path.partition("/")
+    if attr and isinstance(category := reported_state.get(source), dict):
+        return category.get(attr)
+    return None
+
+
+def changed_paths(delta: dict[str, Any]) -> Iterator[str]:
+    """Return the paths updated by a delta of the reported state."""
+    for key, value in delta.items():
+        yield key
+        if isinstance(value, dict):
+            for sub_key in value:
+                yield f"{key}/{sub_key}"
+
+
+@dataclass
+class TriggerRule:
+    """Define a compiled trigger."""
+
+    source: str
+    condition: Condition
+    dependencies: set[str]
+    # overrides by target capability
+    actions: dict[str, dict[str, Any]]
+    active: bool = False
+
+
+class TriggerEngine:
+    """Evaluate the triggers of an appliance capabilities.
+
+    Rules are indexed by the state paths their condition reads, so a delta only
+    re-evaluates the rules depending on the paths it changes.
+    """
+
+    def __init__(self, capabilities: dict[str, Any] | None) -> None:
+        """Compile the triggers of the capabilities."""
+        self.rules: list[TriggerRule] = []
+        # rule indexes by state path read by the condition
+        self.dependencies: dict[str, list[int]] = {}
+        # rule indexes by target capability
+        self.targets: dict[str, list[int]] = {}
+        # active overrides by target capability
+        self.constraints: dict[str, dict[str, Any]] = {}
+
+        for source, capability in self._capabilities(capabilities or {}):
+            for trigger in capability.get("triggers", []):
+                try:
+                    self._add_rule(source, trigger)
+                except (KeyError, TypeError, ValueError) as ex:
+                    _LOGGER.debug(
+                        "Electrolux ignoring trigger of %s: %s %s", source, trigger, ex
+                    )
+
+    @staticmethod
+    def _capabilities(
+        capabilities: dict[str, Any],
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Return the capabilities that may define triggers."""
+        for key, value in capabilities.items():
+            if not isinstance(value, dict):
+                continue
+            yield key, value
+            for sub_key, sub_value in value.items():
+                if isinstance(sub_value, dict) and "triggers" in sub_value:
+                    path = f"{key}/{sub_key}"
+                    if path not in capabilities:
+                        yield path, sub_value
+
+    def _add_rule(self, source: str, trigger: dict[str, Any]) -> None:
+        """Compile a trigger and index it."""
+        condition, dependencies = compile_condition(trigger["condition"], source)
+        actions = {
+            source if target == SELF_TARGET else target: overrides
+            for target, overrides in trigger["action"].items()
+            if isinstance(overrides, dict)
+        }
+        index = len(self.rules)
+        self.rules.append(TriggerRule(source, condition, dependencies, actions))
+        for path in dependencies:
+            self.dependencies.setdefault(path, []).append(index)
+        for target in actions:
+            self.targets.setdefault(target, []).append(index)
+
+    def constraint(self, path: str) -> dict[str, Any]:
+        """Return the overrides currently applied to a capability."""
+        return self.constraints.get(path, {})
+
+    def evaluate(self, reported_state: dict[str, Any]) -> set[str]:
+        """Evaluate every rule against the reported state.
+
+        Return the capabilities whose overrides changed.
+        """
+        return self._evaluate(range(len(self.rules)), reported_state)
+
+    def update(self, delta: dict[str, Any], reported_state: dict[str, Any]) -> set[str]:
+        """Evaluate the rules depending on the paths updated by the delta.
+
+        Return the capabilities whose overrides changed.
+        """
+        indexes: set[int] = set()
+        for path in changed_paths(delta):
+            indexes.update(self.dependencies.get(path, ()))
+        if not indexes:
+            return set()
+        return self._evaluate(sorted(indexes), reported_state)
+
+    def _evaluate(self, indexes, reported_state: dict[str, Any]) -> set[str]:
+        """Evaluate some rules and refresh the overrides of their targets."""
+
+        def get(path: str) -> Any:
+            return state_value(reported_state, path)
+
+        targets: set[str] = set()
+        for index in indexes:
+            rule = self.rules[index]
+            active = rule.condition(get)
+            if active != rule.active:
+                rule.active = active
+                targets.update(rule.actions)
+
+        changed: set[str] = set()
+        for target in targets:
+            constraint = self._merge(target)
+            if constraint != self.constraints.get(target, {}):
+                changed.add(target)
+                if constraint:
+                    self.constraints[target] = constraint
+                else:
+                    self.constraints.pop(target, None)
+        return changed
+
+    def _merge(self, target: str) -> dict[str, Any]:
+        """Merge the overrides of the active rules of a target, in definition order.
+
+        Allowed values are the union of the values of the active rules,
+        other overrides are replaced by the latest rule.
+        """
+        merged: dict[str, Any] = {}
+        for index in self.targets[target]:
+            rule = self.rules[index]
+            if not rule.active:
+                continue
+            for key, value in rule.actions[target].items():
+                if key == "access" and value == DEFAULT_ACCESS:
+                    merged.pop(key, None)
+                elif key == "values" and isinstance(merged.get(key), dict):
+                    merged[key] = {**merged[key], **value}
+                else:
+                    merged[key] = value
+        return merged
@@ -1,15 +1,35 @@
 """Utlities for the Electrolux Status platform."""
 
 import base64
+from enum import Enum
+import hashlib
+import json
 import logging
 import math
 import re
+from typing import Any
 
 from pyelectroluxocp import OneAppApi
 
-from homeassistant.components.persistent_notification import async_create
-from homeassistant.core import HomeAssistant
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.button import ButtonDeviceClass
+from homeassistant.components.number import NumberDeviceClass
+from homeassistant.components.persistent_notification import (
+    async_create,
+    async_dismiss,
+)
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    EntityCategory,
+    Platform,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+    UnitOfVolume,
+)
+from homeassistant.core import HomeAssistant
 
 from .const import (
     CONF_NOTIFICATION_DEFAULT,
@@ -17,9 +37,28 @@ from .const import (
     CONF_NOTIFICATION_WARNING,
     NAME,
 )
+from .model import ElectroluxEntityPlan
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Enumerations that can be found in an entity plan, by class name
+PLAN_ENUMS: dict[str, type[Enum]] = {
+    enum_class.__name__: enum_class
+    for enum_class in (
+        BinarySensorDeviceClass,
+        ButtonDeviceClass,
+        EntityCategory,
+        NumberDeviceClass,
+        Platform,
+        SensorDeviceClass,
+        SwitchDeviceClass,
+        UnitOfPower,
+        UnitOfTemperature,
+        UnitOfTime,
+        UnitOfVolume,
+    )
+}
+
 
 def get_electrolux_session(
     username, password, client_session, language="eng"
@@ -40,6 +79,22 @@ def should_send_notification(config_entry, alert_severity, alert_status):
         return config_entry.data.get(CONF_NOTIFICATION_DEFAULT, True)
 
 
+def notification_id(title: str, message: str) -> str:
+    """Return the notification id of a message."""
+    # Convert the string to base64 - this prevents the same alert being spammed
+    input_string = f"{title}-{message}"
+    bytes_string = input_string.encode("utf-8")
+    base64_bytes = base64.b64encode(bytes_string)
+    return base64_bytes.decode("utf-8")
+
+
+def alert_message(alert_name: str, alert_severity: str, alert_status: str) -> str:
+    """Return the notification message of an alert."""
+    return (
+        f"Alert: {alert_name}</br>Severity: {alert_severity}</br>Status: {alert_status}"
+    )
+
+
 def create_notification(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -50,9 +105,7 @@ def create_notification(
 ):
     """Create a notification."""
 
-    message = (
-        f"Alert: {alert_name}</br>Severity: {alert_severity}</br>Status: {alert_status}"
-    )
+    message = alert_message(alert_name, alert_severity, alert_status)
 
     if should_send_notification(config_entry, alert_severity, alert_status) is False:
         _LOGGER.debug(
@@ -62,19 +115,32 @@ def create_notification(
         )
         return
 
-    # Convert the string to base64 - this prevents the same alert being spammed
-    input_string = f"{title}-{message}"
-    bytes_string = input_string.encode("utf-8")
-    base64_bytes = base64.b64encode(bytes_string)
-    base64_string = base64_bytes.decode("utf-8")
-
     # send notification with crafted notification id so we dont spam notifications
     _LOGGER.debug(
         "Sending notification.\nTitle: %s\nMessage: %s",
         title,
         message,
     )
-    async_create(hass, message, title=title, notification_id=base64_string)
+    async_create(
+        hass, message, title=title, notification_id=notification_id(title, message)
+    )
+
+
+def dismiss_notification(
+    hass: HomeAssistant,
+    alert_name: str,
+    alert_severity: str,
+    alert_status: str,
+    title: str = NAME,
+):
+    """Dismiss the notification of an alert."""
+    message = alert_message(alert_name, alert_severity, alert_status)
+    _LOGGER.debug(
+        "Dismissing notification.\nTitle: %s\nMessage: %s",
+        title,
+        message,
+    )
+    async_dismiss(hass, notification_id(title, message))
 
 
 def time_seconds_to_minutes(seconds: float | None) -> int | None:
@@ -95,9 +161,8 @@ def time_minutes_to_seconds(minutes: float | None) -> int | None:
     return int(minutes) * 60
 
 
-def string_to_boolean(value: str | None, fallback=True) -> bool | str | None:
-    """Convert a string input to boolean."""
-    on_values = {
+ON_VALUES = frozenset(
+    {
         "charging",
         "connected",
         "detected",
@@ -126,8 +191,10 @@ def string_to_boolean(value: str | None, fallback=True) -> bool | str | None:
         "wet",
         "yes",
     }
+)
 
-    off_values = {
+OFF_VALUES = frozenset(
+    {
         "away",
         "clear",
         "closed",
@@ -156,14 +223,53 @@ def string_to_boolean(value: str | None, fallback=True) -> bool | str | None:
         "unplugged",
         "up-to-date",
     }
+)
+
+WHITESPACE = re.compile(r"\s+")
 
-    normalize_input = re.sub(r"\s+", " ", value.replace("_", " ").strip().lower())
 
-    if normalize_input in on_values:
+def string_to_boolean(value: str | None, fallback=True) -> bool | str | None:
+    """Convert a string input to boolean."""
+    normalize_input = WHITESPACE.sub(" ", value.replace("_", " ").strip().lower())
+
+    if normalize_input in ON_VALUES:
         return True
-    if normalize_input in off_values:
+    if normalize_input in OFF_VALUES:
         return False
     _LOGGER.debug("Electrolux unable to convert %s to boolean", value)
     if fallback:
         return value
     return False
+
+
+def fingerprint(*parts: Any) -> str:
+    """Return a stable hash of JSON serializable parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(
+            json.dumps(part, sort_keys=True, separators=(",", ":"), default=repr).encode(
+                "utf-8"
+            )
+        )
+    return digest.hexdigest()
+
+
+def encode_entity_plan(plan: ElectroluxEntityPlan) -> dict[str, Any]:
+    """Convert an entity plan to a JSON serializable dictionary."""
+    return {
+        key: {"enum": type(value).__name__, "value": value.value}
+        if isinstance(value, Enum)
+        else value
+        for key, value in plan.items()
+    }
+
+
+def decode_entity_plan(data: dict[str, Any]) -> ElectroluxEntityPlan:
+    """Convert a stored dictionary back to an entity plan."""
+    plan = {}
+    for key, value in data.items():
+        if isinstance(value, dict) and value.keys() == {"enum", "value"}:
+            enum_class = PLAN_ENUMS.get(value["enum"])
+            value = enum_class(value["value"]) if enum_class else value["value"]
+        plan[key] = value
+    return plan
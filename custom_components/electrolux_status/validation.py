@@ -0,0 +1,149 @@
+"""Local validation of the commands for Electrolux Status.
+
+The definition of a capability (access, type, min, max, step, values) is
+compiled once into a validator. The overrides applied by the selected program
+and the active triggers are layered on top of it when a command is checked, so
+that invalid commands are rejected without a round trip to the cloud. Numbers
+off the step grid are snapped to the nearest step.
+"""
+
+import logging
+from typing import Any
+
+from homeassistant.exceptions import ServiceValidationError
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+# capability accesses accepting commands
+WRITE_ACCESSES = ("readwrite", "write")
+# capability types holding numbers
+NUMBER_TYPES = ("float", "int", "integer", "number", "temperature")
+
+
+class CommandValidationError(ServiceValidationError):
+    """A command does not satisfy the capability it targets."""
+
+
+def _number(value: Any) -> float | None:
+    """Return a number of the definition, None if it is not one."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int | float):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _is_number(value: Any) -> bool:
+    """Return true for numbers, which booleans are not."""
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+class CapabilityValidator:
+    """Checks of the commands of a capability."""
+
+    __slots__ = (
+        "access",
+        "definition",
+        "disabled",
+        "enumerated",
+        "maximum",
+        "minimum",
+        "path",
+        "step",
+        "type",
+        "values",
+    )
+
+    def __init__(self, path: str, definition: dict[str, Any]) -> None:
+        """Compile the definition of a capability."""
+        self.path = path
+        self.definition = definition
+        self.access = definition.get("access")
+        self.type = definition.get("type")
+        self.disabled = bool(definition.get("disabled", False))
+        self.minimum = _number(definition.get("min"))
+        self.maximum = _number(definition.get("max"))
+        step = _number(definition.get("step"))
+        self.step = step if step and step > 0 else None
+        # listed values, and their numbers for the numeric keys, mapped to the
+        # key of the definition or to None when disabled. None if unrestricted.
+        self.values: dict[Any, str | None] | None = None
+        if values := definition.get("values"):
+            self.values = {}
+            for key, entry in values.items():
+                allowed: str | None = key
+                if isinstance(entry, dict) and entry.get("disabled", False):
+                    allowed = None
+                self.values[key] = allowed
+                if (number := _number(key)) is not None:
+                    self.values.setdefault(number, allowed)
+        # the values of a number within a range only flag some special values
+        self.enumerated = not (
+            self.type in NUMBER_TYPES
+            and (self.minimum is not None or self.maximum is not None)
+        )
+
+    def override(self, constraint: dict[str, Any]) -> "CapabilityValidator":
+        """Return the validator of the capability with overrides applied."""
+        return CapabilityValidator(self.path, {**self.definition, **constraint})
+
+    def _error(self, value: Any, reason: str) -> CommandValidationError:
+        """Return the error of a rejected value."""
+        return CommandValidationError(
+            f"Invalid value {value!r} for {self.path}: {reason}"
+        )
+
+    def validate(self, value: Any) -> Any:
+        """Return the value to send, raise CommandValidationError if invalid."""
+        if self.access not in WRITE_ACCESSES:
+            raise self._error(value, f"access is {self.access}")
+        if self.disabled:
+            raise self._error(value, "disabled")
+
+        if self.values is not None:
+            # booleans would match the numeric keys 0 and 1
+            listed = not isinstance(value, bool) and (
+                value in self.values or str(value) in self.values
+            )
+            if listed:
+                if self.values.get(value, self.values.get(str(value))) is None:
+                    raise self._error(value, "value disabled")
+                if self.enumerated:
+                    return value
+            elif self.enumerated:
+                allowed = sorted({key for key in self.values.values() if key})
+                raise self._error(value, f"allowed values are {', '.join(allowed)}")
+
+        if self.type == "boolean":
+            if not isinstance(value, bool):
+                raise self._error(value, "a boolean is expected")
+            return value
+        if self.type == "string":
+            if not isinstance(value, str):
+                raise self._error(value, "a string is expected")
+            return value
+        if self.type not in NUMBER_TYPES:
+            return value
+        if not _is_number(value):
+            raise self._error(value, "a number is expected")
+
+        sent = value
+        if self.step is not None:
+            origin = self.minimum if self.minimum is not None else 0
+            sent = round(origin + round((value - origin) / self.step) * self.step, 9)
+        if self.type in ("int", "integer") or (
+            sent == int(sent) and isinstance(value, int)
+        ):
+            sent = int(round(sent))
+        if self.minimum is not None and sent < self.minimum:
+            raise self._error(value, f"minimum is {self.minimum}")
+        if self.maximum is not None and sent > self.maximum:
+            raise self._error(value, f"maximum is {self.maximum}")
+        if sent != value:
+            _LOGGER.debug("Electrolux snapped %s of %s to %s", value, self.path, sent)
+        return sent